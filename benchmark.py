@@ -0,0 +1,304 @@
+#!/usr/bin/env python
+'''
+benchmark.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This script measures how long each stage of answering the questions takes, without
+    asking the user anything:
+
+      1. csv     - reading and encoding the data file with a csv.reader loop, the way
+                   it was done before tokenizer.py, as a reference for 'parse'
+      2. parse   - reading and encoding the data file (loader.parse_file, no cache)
+      3. filter  - answering every selection of the question (its find_rows)
+      4. write   - writing the matched rows as CSV, the way the question scripts do
+      5. plot    - rendering the charts of some selections (plotting.render_charts)
+
+    Every question is measured on its data file in dataFiles/ and on scaled-up copies
+    of it: a copy at scale N holds the rows of the file N times, each time under another
+    GEO name, so it has N times the rows and N times the geographies. Each question and
+    scale runs in a fresh worker process, so the peak memory reported is its own.
+
+    For every stage the wall time, the rows handled per second and the peak resident
+    memory of the worker so far are reported (and, for the two reading stages, the
+    megabytes of the file read per second), and everything is saved as JSON so the
+    results of two commits can be compared with --compare.
+
+    Commandline Parameters (all optional):
+      --questions <N>...      the questions to measure (default: 1 2 3 4)
+      --scales <N>...         the scales to measure (default: 1 10 100)
+      --plots <N>             the number of charts rendered per question (default: 20)
+      --out <file>            where to save the results (default: print only)
+      --compare <file>        results saved earlier, to compare these results with
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'csv' writes the scaled copies and the matched rows
+import csv
+
+# 'json' saves the results
+import json
+
+# 'os' builds paths
+import os
+
+# 'platform' records the machine the results come from
+import platform
+
+# 'resource' reports the peak memory of the worker process
+import resource
+
+# 'shutil' removes the scaled copies afterwards
+import shutil
+
+# 'subprocess' asks git which commit is measured
+import subprocess
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'tempfile' gives us a folder for the scaled copies and the output files
+import tempfile
+
+# 'time' measures the stages
+import time
+
+# 'concurrent.futures' runs every measurement in a fresh process
+from concurrent.futures import ProcessPoolExecutor
+
+#
+#  main.py knows the project folder
+#
+import main
+
+# The plotting module renders the charts
+import plotting
+
+# 'loader' parses the data files
+from vacancies import loader
+
+# 'output' writes the matched rows the way the question scripts do
+from vacancies import output
+
+# 'registry' defines the questions and their data files
+from vacancies import registry
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+DEFAULT_SCALES = (1, 10, 100)
+DEFAULT_PLOTS = 20
+STAGES = ('csv', 'parse', 'filter', 'write', 'plot')
+
+
+def write_scaled_copy(data_file, scale, out_file):
+  '''
+    Writes a copy of a data file with its rows repeated 'scale' times, each time under
+    another GEO name. The lines after the data (StatCan footnotes) are kept at the end.
+
+    Returns:
+    str: the path of the copy
+  '''
+  with open(data_file, encoding='utf-8-sig', newline='') as source_file:
+    rows = list(csv.reader(source_file))
+  header = rows[0]
+  data_rows = [row for row in rows[1:] if loader.is_data_row(row)]
+  trailer = [row for row in rows[1:] if not loader.is_data_row(row)]
+
+  with open(out_file, 'w', encoding='utf-8-sig', newline='') as copy_file:
+    csv_writer = csv.writer(copy_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(header)
+    for copy in range(scale):
+      for row in data_rows:
+        if copy:
+          row = row[:loader.GEO_COLUMN] + [f"{row[loader.GEO_COLUMN]} (copy {copy})"] + row[loader.GEO_COLUMN + 1:]
+        csv_writer.writerow(row)
+    csv_writer.writerows(trailer)
+  return out_file
+
+
+def _peak_rss_kb():
+  # ru_maxrss is in kilobytes on Linux but in bytes on macOS
+  peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def _stage(seconds, rows, size=None):
+  measured = {
+      'seconds': round(seconds, 6),
+      'rows': rows,
+      'rows_per_second': round(rows / seconds) if seconds > 0 else None,
+      'peak_rss_kb': _peak_rss_kb(),
+  }
+  if size is not None:
+    measured['megabytes_per_second'] = round(size / 1e6 / seconds, 1) if seconds > 0 else None
+  return measured
+
+
+def measure(question_number, data_file, plots, work_dir):
+  '''
+    Runs every stage for one question on one data file. This runs in a worker process.
+
+    Returns:
+    dict: the rows and geographies of the file and the measurements of each stage
+  '''
+  question = registry.get_question(question_number)
+  size = os.path.getsize(data_file)
+  stages = {}
+
+  started = time.perf_counter()
+  with open(data_file, encoding='utf-8-sig', newline='') as csv_file:
+    reference = loader.encode_rows(csv.reader(csv_file))
+  stages['csv'] = _stage(time.perf_counter() - started, len(reference), size)
+  del reference
+
+  started = time.perf_counter()
+  table = loader.parse_file(data_file)
+  stages['parse'] = _stage(time.perf_counter() - started, len(table), size)
+  loader.remember_table(data_file, table)
+
+  selections = [(noc, characteristic)
+                for noc in question.choices('noc', data_file).values()
+                for characteristic in question.choices('characteristic', data_file).values()]
+  started = time.perf_counter()
+  answers = [question.find_rows(data_file, noc, characteristic) for noc, characteristic in selections]
+  stages['filter'] = _stage(time.perf_counter() - started, sum(len(rows) for rows in answers))
+
+  # The question scripts print the rows they write; the printing is measured too,
+  # but goes to the null device instead of the terminal
+  started = time.perf_counter()
+  with open(os.devnull, 'w') as null_file:
+    sinks = [output.CsvSink(loader.OUTPUT_HEADER, os.path.join(work_dir, f"rows-{os.getpid()}.csv")),
+             output.StdoutSink(loader.OUTPUT_HEADER, null_file)]
+    output.write_rows([row for rows in answers for row in rows], sinks)
+  stages['write'] = _stage(time.perf_counter() - started, sum(len(rows) for rows in answers))
+
+  # Import matplotlib first, so the plot stage measures rendering rather than start-up
+  import matplotlib.backends.backend_agg  # noqa: F401
+  charts = [plotting.chart_from_rows(rows) for rows in answers if rows][:plots]
+  started = time.perf_counter()
+  plotting.render_charts(charts, os.path.join(work_dir, f"charts-{os.getpid()}"))
+  stages['plot'] = _stage(time.perf_counter() - started, sum(len(dates) for _, dates, _ in charts))
+
+  return {
+      'rows': len(table),
+      'geos': len(table.dictionaries['geo']),
+      'selections': len(selections),
+      'stages': stages,
+  }
+
+
+def git_commit():
+  '''
+    Returns the commit being measured, or None outside a git checkout.
+  '''
+  try:
+    return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=main.PROJECT_DIR,
+                          capture_output=True, text=True, check=True).stdout.strip()
+  except (OSError, subprocess.CalledProcessError):
+    return None
+
+
+def run_benchmarks(questions, scales, plots=DEFAULT_PLOTS):
+  '''
+    Measures every question at every scale.
+
+    Returns:
+    dict: the machine, the commit and one result per question and scale
+  '''
+  work_dir = tempfile.mkdtemp(prefix='vacancies-benchmark-')
+  results = []
+  try:
+    for question_number in questions:
+      source_file = registry.get_question(question_number).data_file
+      for scale in scales:
+        data_file = source_file
+        if scale != 1:
+          data_file = write_scaled_copy(source_file, scale,
+                                        os.path.join(work_dir, f"dataForQuestion{question_number}-x{scale}.csv"))
+        # A fresh process for every run, so neither memory nor loaded tables carry over
+        with ProcessPoolExecutor(max_workers=1) as pool:
+          result = pool.submit(measure, question_number, data_file, plots, work_dir).result()
+        results.append({'question': question_number, 'scale': scale, **result})
+        if scale != 1:
+          os.remove(data_file)
+  finally:
+    shutil.rmtree(work_dir, ignore_errors=True)
+
+  return {
+      'commit': git_commit(),
+      'python': platform.python_version(),
+      'platform': platform.platform(),
+      'created': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+      'results': results,
+  }
+
+
+def print_results(report, baseline=None):
+  '''
+    Prints one line per question, scale and stage, with the speed-up over 'baseline'
+    (results saved earlier) where it has the same measurement.
+  '''
+  baseline_seconds = {}
+  if baseline is not None:
+    for result in baseline['results']:
+      for stage, measured in result['stages'].items():
+        baseline_seconds[(result['question'], result['scale'], stage)] = measured['seconds']
+
+  print(f"{'question':>8} {'scale':>6} {'rows':>10} {'stage':<7} {'seconds':>10} {'rows/s':>12} {'MB/s':>8} {'peak RSS MB':>12}"
+        + (f" {'vs ' + str(baseline.get('commit')):>12}" if baseline is not None else ''))
+  for result in report['results']:
+    for stage in STAGES:
+      measured = result['stages'][stage]
+      megabytes = measured.get('megabytes_per_second')
+      line = (f"{result['question']:>8} {result['scale']:>6} {result['rows']:>10} {stage:<7} "
+              f"{measured['seconds']:>10.4f} {measured['rows_per_second'] or 0:>12} "
+              f"{'' if megabytes is None else megabytes:>8} {measured['peak_rss_kb'] / 1024:>12.1f}")
+      before = baseline_seconds.get((result['question'], result['scale'], stage))
+      if before is not None and measured['seconds'] > 0:
+        line += f" {before / measured['seconds']:>11.2f}x"
+      print(line)
+
+
+def main_benchmark(argv):
+  '''
+    Runs the benchmarks from the command line.
+  '''
+  parser = argparse.ArgumentParser(prog='benchmark.py', description='Measure the csv, parse, filter, write and plot stages.')
+  parser.add_argument('--questions', type=int, nargs='+', default=sorted(registry.QUESTIONS), choices=sorted(registry.QUESTIONS))
+  parser.add_argument('--scales', type=int, nargs='+', default=list(DEFAULT_SCALES))
+  parser.add_argument('--plots', type=int, default=DEFAULT_PLOTS, help='charts rendered per question and scale')
+  parser.add_argument('--out', help='where to save the results as JSON')
+  parser.add_argument('--compare', help='results saved earlier to compare with')
+  arguments = parser.parse_args(argv[1:])
+
+  baseline = None
+  if arguments.compare:
+    try:
+      with open(arguments.compare, encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+    except (OSError, ValueError) as e:
+      print(f"Cannot read {arguments.compare}: {e}")
+      return 2
+
+  report = run_benchmarks(arguments.questions, arguments.scales, arguments.plots)
+  print_results(report, baseline)
+
+  if arguments.out:
+    with open(arguments.out, 'w', encoding='utf-8') as out_file:
+      json.dump(report, out_file, indent=2)
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main_benchmark(sys.argv))
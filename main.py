@@ -4,7 +4,7 @@ main.py
   Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
 
   Project: Job Vacancies in Canada
-  Date of Last Update: April 1, 2024
+  Date of Last Update: October 18, 2026
 
   Functional Summary
 
@@ -12,8 +12,17 @@ main.py
       1. User choice of the function it wants to use 
 
       The script asks users to input the choice of the function they want to use. It then calls the function based on the user's choice.
+
+      In batch mode the selections are read from a file instead (see vacancies/batch.py) and
+      the results are written as JSON Lines, one line per selection, without any plots.
       
-    Commandline Parameters: 0
+    Commandline Parameters: 0, 2 or 3
+      argv[1] = --batch
+      argv[2] = path to the selection file (.json, .csv or .toml)
+      argv[3] = path to the results file (optional, the results are printed otherwise)
+
+    Either mode can be preceded by "--profile <trace_file>" (and "--cprofile") to record
+    where the time goes, see vacancies/profiling.py.
 
 '''
 #
@@ -21,12 +30,51 @@ main.py
 #  functions to operate on file paths, directories, processes, and environment variables. The os module is particularly useful for tasks such as file manipulation, directory          #   operations, and executing system commands.
 import os
 
+#
+#  The sys module gives us access to the command line parameters
+import sys
+
+#
+#  The plotting module draws the results. It only imports matplotlib when a plot is drawn.
+import plotting
+
+#
+#  The batch module answers a whole file of selections without asking the user anything
+from vacancies import batch
+
+#
+#  The proportions module gives the share of its total of every value, which is what the questions ask for
+from vacancies import proportions
+
+#
+#  The parallel module loads several data files at once in worker processes
+from vacancies import parallel
+
+#
+#  The output module writes the selected rows in bulk, to the sinks asked for in VACANCIES_OUTPUT
+from vacancies import output
+
+#
+#  The profiling module records how long each stage takes, when asked to
+from vacancies import profiling
+
+#
+#  The registry module defines every question: its data file and its choices
+from vacancies import registry
+
+#
+#  The results module answers repeated selections from its cache
+from vacancies import results
+
 
 #
 # Define any "constants" for the file here.
 # Names of constants should be in UPPER_CASE.
 #
-def main():
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def main(argv):
   '''
     Main function in the script. Putting the body of the
     script into a function allows us to separate the local
@@ -34,34 +82,162 @@ def main():
     declared outside.
     '''
 
-  user_choice = int(
-      input(
-          "Enter the question number to execute (1-4): \n"
-          "1. Question 1: What is the proportion of job vacancies for people who got their job through social media quarterly, without adjusting for seasonality, in Canada? \n"
-          "2. Question 2: What is the proportion of job vacancies for people with more than 8 years of experience quarterly, without adjusting for seasonality, in Canada? \n"
-          "3. What is the proportion of job vacancies, with no minimum level of education required quarterly, without adjusting for seasonality, in Canada? \n"
-          "4. What is the proportion of job vacancies  last for less than 15 days on the market before they are filled quarterly, without adjusting for seasonality, in Canada? \n"
-        "Enter your choice: "
-      ))
+  #
+  #  Switch profiling on when asked to, on the command line or in the environment
+  #
+  argv = list(argv)
+  use_cprofile = None
+  if '--cprofile' in argv:
+    argv.remove('--cprofile')
+    use_cprofile = True
+  trace_file = None
+  if len(argv) > 2 and argv[1] == '--profile':
+    trace_file = argv[2]
+    del argv[1:3]
+  profiling.configure(trace_file, use_cprofile)
+
+  #
+  #  Run the selections from a file when we are in batch mode
+  #
+  if len(argv) > 1:
+    if argv[1] != '--batch' or len(argv) not in (3, 4):
+      print("Usage: main.py [--profile <trace_file> [--cprofile]] [--batch <selection_file> [<results_file>]]")
+      sys.exit(1)
+    sys.exit(run_batch(argv[2], argv[3] if len(argv) == 4 else None))
+
+  #
+  #  Show the menu of every question in the registry
+  #
+  first, last = min(registry.QUESTIONS), max(registry.QUESTIONS)
+  menu = ''.join(f"{number}. Question {number}: {question.title} \n" for number, question in registry.QUESTIONS.items())
+  user_choice = int(input(f"Enter the question number to execute ({first}-{last}): \n{menu}Enter your choice: "))
 
   #
   #  Runnning the function based on the user choice
   #    
-  if user_choice == 1:
-    os.system("python questions/question1.py dataFiles/dataForQuestion1.csv")
-    os.system("python plotting.py dataForPlotting.csv")
-  elif user_choice == 2:
-    os.system("python questions/question2.py dataFiles/dataForQuestion2.csv")
-    os.system("python plotting.py dataForPlotting.csv")
-  elif user_choice == 3:
-    os.system("python questions/question3.py dataFiles/dataForQuestion3.csv")
-    os.system("python plotting.py dataForPlotting.csv")
-  elif user_choice == 4:
-    os.system("python questions/question4.py dataFiles/dataForQuestion4.csv")
-    os.system("python plotting.py dataForPlotting.csv")
+  if user_choice in registry.QUESTIONS:
+    run_question(user_choice)
+  else:
+    print(f"Invalid choice. Please enter a number between {first} and {last}.")
 
+
+def run_question(user_choice):
+  '''
+    Runs one question inside this process: asks the user for their selection, prints
+    the matching rows and plots them, passing the rows along in memory. The rows and
+    the image of the chart are kept in the result cache (see vacancies/results.py).
+
+    Parameters:
+    user_choice (int): the question number, a key of registry.QUESTIONS
+  '''
+  question, data_file = load_question(user_choice)
+
+  try:
+    noc, characteristic = question.ask_selection(data_file)
+    rows = results.query_rows(data_file, user_choice, noc, characteristic, question.find_rows)
+  except FileNotFoundError:
+    print(f"File not found: {data_file}")
+    return
+
+  # Show the rows the way VACANCIES_OUTPUT asks for (printed by default)
+  try:
+    sinks = output.open_sinks()
+  except output.OutputError as e:
+    print(f"Invalid output: {e}")
+    return
+  with profiling.stage('write', rows=len(rows)):
+    output.write_rows(rows, sinks)
+
+  if not rows:
+    print("No job vacancy data matches this selection.")
+    return
+
+  print_proportions(data_file, rows, noc, characteristic, question.total_label)
+
+  # The user gets the live chart. Its image is kept in the result cache for the server,
+  # once per selection and data file version
+  plotting.show_chart(plotting.chart_from_rows(rows),
+                      lambda render: results.query_figure(data_file, user_choice, noc, characteristic, render))
+
+
+def print_proportions(data_file, rows, noc, characteristic, total_label=None):
+  '''
+    Prints the share of its total of each quarter of a selection.
+  '''
+  try:
+    shares = proportions.load_proportions(data_file, total_label)
+  except ValueError as e:
+    print(f"Proportions are not available: {e}")
+    return
+
+  for row, share, status in zip(rows, shares.shares_for(noc, characteristic), shares.status_for(noc, characteristic),
+                              strict=True):
+    if row[5] is None:
+      share_text = f"not available (value suppressed, STATUS {status or 'none'})"
+    elif share is None:
+      share_text = "not available"
+    else:
+      share_text = f"{share:.2%} (STATUS {status})" if status else f"{share:.2%}"
+    print(f"{row[0]}, {row[1]}: {share_text} of '{shares.total_label}'")
+
+
+def load_question(user_choice):
+  '''
+    Looks up the definition of a question in the registry.
+
+    Returns:
+    tuple: (registry.Question, path of its data file)
+  '''
+  question = registry.get_question(user_choice)
+  return question, question.data_file
+
+
+def run_batch(selection_file, results_file):
+  '''
+    Answers every selection in 'selection_file' in this one process.
+
+    Parameters:
+    selection_file (str): the path to the selection file
+    results_file (str): where to write the results, or None to print them
+
+    Returns:
+    int: the exit status, 0 when every selection was answered
+  '''
+  try:
+    selections = batch.read_selections(selection_file)
+  except FileNotFoundError:
+    print(f"File not found: {selection_file}")
+    return 2
+  except ValueError as e:
+    print(f"Invalid selection file: {e}")
+    return 1
+
+  #
+  #  Load every data file the selections need up front, in parallel, when the
+  #  VACANCIES_WORKERS environment variable asks for more than one worker
+  #
+  try:
+    workers = parallel.worker_count() if os.environ.get(parallel.WORKERS_VARIABLE) else 1
+  except ValueError as e:
+    print(f"Usage: {e}")
+    return 1
+  if workers > 1:
+    questions = {str(selection['question']).strip() for selection in selections}
+    data_files = [question.data_file for number, question in registry.QUESTIONS.items() if str(number) in questions]
+    try:
+      parallel.load_tables(data_files)
+    except FileNotFoundError as e:
+      print(f"File not found: {e.filename}")
+      return 2
+
+  if results_file is None:
+    failures = batch.run_batch(selections, load_question, sys.stdout)
   else:
-    print("Invalid choice. Please enter a number between 1 and 4.")
+    with open(results_file, 'w', encoding='utf-8') as out_file:
+      failures = batch.run_batch(selections, load_question, out_file)
+
+  return 3 if failures else 0
+
 
 if __name__ == "__main__":
-  main()
+  main(sys.argv)
@@ -4,7 +4,7 @@ plotting.py
   Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
 
   Project: Job Vacancies in Canada Visualization Tool
-  Date of Last Update: April 1, 2024
+  Date of Last Update: October 18, 2026
 
   Functional Summary:
     This script visualizes job vacancy data in Canada based on user-selected job characteristics and National Occupational Classification (NOC). It outputs the data as a bar graph to display trends over time.
@@ -12,7 +12,12 @@ plotting.py
     The script prompts users to input their choice of job characteristics and NOC categories. It then processes the data and generates a bar graph reflecting the trends.
 
     Commandline Parameters: 1
-    1. A path to a CSV file that contains the job vacancy data to be plotted.
+    1. A path to a CSV file that contains the job vacancy data to be plotted (or a
+       Parquet or Arrow file written by the question scripts, read without parsing text).
+
+    With "--render" as the first parameter, the charts of any number of CSV files are
+    written to PNG or SVG files instead (one per file, or one multi-panel grid), without
+    a display, see render_main().
 
   This script is part of a suite of tools designed to provide insights into the Canadian job market.
 '''
@@ -25,14 +30,48 @@ plotting.py
 import sys
 
 #
-# 'matplotlib.pyplot' for creating visualizations
+# 'argparse' reads the command line parameters of the render mode, 'csv' reads the
+# data files there without pandas, 'io' holds images rendered in memory, 'math' sizes
+# the panel grid and 'os' creates the output folder
+#
+import argparse
+import csv
+import io
+import math
+import os
+
+#
+# 'datetime' turns the 'Ref Date' text into dates for the x-axis
+#
+from datetime import datetime
+
+#
+# 'loader' recognises Parquet and Arrow files by their suffix
+#
+from vacancies import loader
+
+#
+# 'profiling' times the plotting when profiling is on
+#
+from vacancies import profiling
+
+#
+# 'matplotlib.pyplot' (for creating visualizations) and 'pandas' (for handling data
+# in a structured way) take a while to import, so they are only imported inside the
+# functions that need them. This keeps main.py quick to start when no plot is drawn.
+# The render functions draw on figures of their own with the Agg renderer, so they
+# need no display and never block.
 #
-import matplotlib.pyplot as plt
 
 #
-# pandas' for handling data in a structured way.
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
 #
-import pandas as pd
+REF_DATE_FORMAT = '%Y-%m'
+FIGURE_SIZE = (10, 6)
+DEFAULT_TITLE = 'Job Vacancies Over Time'
+CHART_NAME_PATTERN = 'Figure_{number}'
+IMAGE_FORMATS = ('png', 'svg')
 
 
 def main(csv_file):
@@ -47,43 +86,297 @@ def main(csv_file):
     Returns:
     None: This function does not return any value; its purpose is to generate a plot.
   '''
+  with profiling.stage('read plot data') as timer:
+    import pandas as pd
 
-  # Read the CSV file into a pandas DataFrame
-  data = pd.read_csv(csv_file)
+    # Read the CSV file into a pandas DataFrame, or a Parquet or Arrow file as it is
+    if loader.columnar_format(csv_file):
+      # 'columnar' needs the 'pyarrow' package, so it is only imported for these files
+      from vacancies import columnar
+      data = columnar.read_frame(csv_file)
+    else:
+      data = pd.read_csv(csv_file)
+    timer.count(len(data))
 
   # Convert the 'Ref Date' column to datetime objects for proper plotting
-  data['Ref Date'] = pd.to_datetime(data['Ref Date'], format='%Y-%m')
+  data['Ref Date'] = pd.to_datetime(data['Ref Date'], format=REF_DATE_FORMAT)
 
-  # Initialize the plot with a specified figure size
-  plt.figure(figsize=(10, 6))
+  show_chart((DEFAULT_TITLE, data['Ref Date'], data['Value']))
+
+
+def show_chart(chart, keep_image=None):
+  '''
+    Draws a chart on a live matplotlib figure and shows it to the user, who can zoom,
+    pan and read the values off its axes.
+
+    Parameters:
+    chart (tuple): (title, dates, values), see chart_from_rows()
+    keep_image (function): called, before the chart is shown, with a function that
+      takes a file format and returns the figure as image bytes (see figure_bytes()),
+      e.g. to keep the image in the result cache; None to keep nothing
+  '''
+  title, dates, values = chart
+  with profiling.stage('plot') as timer:
+    import matplotlib.pyplot as plt
+
+    # Initialize the plot with a specified figure size
+    figure = plt.figure(figsize=FIGURE_SIZE)
+
+    draw_series(figure.gca(), dates, values, title)
+    timer.count(len(values))
+
+    # Adjust the layout to ensure labels and titles are not cut off
+    figure.tight_layout()
+
+  if keep_image is not None:
+    keep_image(lambda file_format: figure_bytes(figure, file_format))
+
+  # Display the plot to the user
+  plt.show()
 
+
+def draw_series(axes, dates, values, title=DEFAULT_TITLE):
+  '''
+    Draws the number of job vacancies over time on one set of axes.
+
+    Parameters:
+    axes (matplotlib.axes.Axes): where to draw
+    dates (list): the date of each point
+    values (list): the number of job vacancies at each date
+    title (str): the title of the plot
+  '''
   # Create a line plot of 'Ref Date' vs 'Value' with markers and a solid line style
-  plt.plot(data['Ref Date'], data['Value'], marker='o', linestyle='-')
+  axes.plot(dates, values, marker='o', linestyle='-')
 
   # Set the title of the plot
-  plt.title('Job Vacancies Over Time')
+  axes.set_title(title)
 
   # Label the x-axis as 'Date'
-  plt.xlabel('Date')
+  axes.set_xlabel('Date')
 
   # Label the y-axis as 'Number of Job Vacancies'
-  plt.ylabel('Number of Job Vacancies')
+  axes.set_ylabel('Number of Job Vacancies')
 
   # Rotate the x-axis date labels for better readability
-  plt.xticks(rotation=45)
+  axes.tick_params(axis='x', labelrotation=45)
 
-  # Adjust the layout to ensure labels and titles are not cut off
-  plt.tight_layout()
 
-  # Display the plot to the user
-  plt.show()  
+def chart_from_rows(rows, title=None):
+  '''
+    Turns rows, as returned by find_rows() in the question scripts, into a chart
+    for render_charts() or render_grid().
+
+    Parameters:
+    rows (list): [ref date, geo, occupation, characteristic, statistics, value] rows
+    title (str): the title of the chart; by default the occupation and characteristic
+
+    Returns:
+    tuple: (title, dates, values)
+  '''
+  if title is None:
+    title = f"{rows[0][2]}\n{rows[0][3]}" if rows else DEFAULT_TITLE
+  dates = [datetime.strptime(row[0], REF_DATE_FORMAT) for row in rows]
+  values = [row[5] for row in rows]
+  return title, dates, values
+
+
+def read_chart(csv_file):
+  '''
+    Reads a chart from a CSV file written by the question scripts, with the csv module
+    rather than pandas, or from a Parquet or Arrow file written by them.
+
+    Returns:
+    tuple: (title, dates, values)
+  '''
+  if loader.columnar_format(csv_file):
+    from vacancies import columnar
+    return chart_from_rows(columnar.read_rows(csv_file))
+
+  with open(csv_file, encoding='utf-8', newline='') as data_file:
+    reader = csv.reader(data_file)
+    next(reader, None)
+    rows = [row[:5] + [float(row[5]) if row[5] else None] for row in reader if len(row) >= 6]
+  return chart_from_rows(rows)
+
+
+def _new_figure(figure_size):
+  '''
+    Creates a figure drawn with the Agg renderer. It is not attached to pyplot, so it
+    needs no display and is never shown.
+  '''
+  from matplotlib.backends.backend_agg import FigureCanvasAgg
+  from matplotlib.figure import Figure
+
+  figure = Figure(figsize=figure_size)
+  FigureCanvasAgg(figure)
+  return figure
+
+
+def render_charts(charts, out_dir, file_format='png', name_pattern=CHART_NAME_PATTERN):
+  '''
+    Renders one image file per chart, without a display. The same figure and axes are
+    cleared and reused for every chart, so hundreds of charts cost one figure.
+
+    Parameters:
+    charts (list): (title, dates, values) charts, see chart_from_rows()
+    out_dir (str): the folder to write the images to
+    file_format (str): 'png' or 'svg'
+    name_pattern (str): the file name of chart n (counting from 1), without extension
+
+    Returns:
+    list: the paths of the images written
+  '''
+  os.makedirs(out_dir, exist_ok=True)
+  figure = _new_figure(FIGURE_SIZE)
+  axes = figure.add_subplot()
+
+  paths = []
+  for number, (title, dates, values) in enumerate(charts, start=1):
+    with profiling.stage('render', format=file_format) as timer:
+      axes.clear()
+      draw_series(axes, dates, values, title)
+      figure.tight_layout()
+      path = os.path.join(out_dir, f"{name_pattern.format(number=number)}.{file_format}")
+      figure.savefig(path, format=file_format)
+      timer.count(len(values))
+    paths.append(path)
+  return paths
+
+
+def render_bytes(chart, file_format='png'):
+  '''
+    Renders one chart to image bytes in memory, without a display.
+
+    Parameters:
+    chart (tuple): (title, dates, values), see chart_from_rows()
+    file_format (str): 'png' or 'svg'
+
+    Returns:
+    bytes: the image
+  '''
+  title, dates, values = chart
+  figure = _new_figure(FIGURE_SIZE)
+  with profiling.stage('render', format=file_format) as timer:
+    draw_series(figure.add_subplot(), dates, values, title)
+    figure.tight_layout()
+    image = figure_bytes(figure, file_format)
+    timer.count(len(values))
+  return image
+
+
+def figure_bytes(figure, file_format='png'):
+  '''
+    Saves a figure that is already drawn to image bytes in memory.
+
+    Parameters:
+    figure (matplotlib.figure.Figure): the figure
+    file_format (str): 'png' or 'svg'
+
+    Returns:
+    bytes: the image
+  '''
+  image = io.BytesIO()
+  figure.savefig(image, format=file_format)
+  return image.getvalue()
+
+
+def image_format(path, file_format=None):
+  '''
+    Returns the format of an image file: the one of its extension, or 'file_format'
+    (PNG by default) when the extension is not one of IMAGE_FORMATS.
+
+    Raises:
+    ValueError: when 'file_format' is given and the extension names another format
+  '''
+  extension = os.path.splitext(path)[1][1:].lower()
+  if extension in IMAGE_FORMATS:
+    if file_format is not None and file_format != extension:
+      raise ValueError(f"{path} is named as a .{extension} image, not {file_format}")
+    return extension
+  return file_format or IMAGE_FORMATS[0]
+
+
+def render_grid(charts, path, columns=2, file_format=None):
+  '''
+    Renders several charts as the panels of one image, without a display.
+
+    Parameters:
+    charts (list): (title, dates, values) charts, see chart_from_rows()
+    path (str): the image to write
+    columns (int): the number of panels per row
+    file_format (str): 'png' or 'svg', by default taken from the extension of 'path'
+      (see image_format())
+
+    Returns:
+    str: the path of the image written
+
+    Raises:
+    ValueError: when 'file_format' and the extension of 'path' do not agree
+  '''
+  file_format = image_format(path, file_format)
+  columns = max(1, min(columns, len(charts)))
+  rows = max(1, math.ceil(len(charts) / columns))
+  figure = _new_figure((FIGURE_SIZE[0] * columns / 2, FIGURE_SIZE[1] * rows / 2 + 1))
+  panels = list(figure.subplots(rows, columns, squeeze=False).flat)
+
+  with profiling.stage('render', panels=len(charts)) as timer:
+    # The grid may have more panels than charts; those are hidden below
+    for axes, (title, dates, values) in zip(panels, charts, strict=False):
+      draw_series(axes, dates, values, title)
+      timer.count(len(values))
+
+    # Hide the panels left over in the last row
+    for axes in panels[len(charts):]:
+      axes.set_visible(False)
+
+    figure.tight_layout()
+    figure.savefig(path, format=file_format)
+  return path
+
+
+def render_main(argv):
+  '''
+    Renders charts from CSV files written by the question scripts, without a display.
+  '''
+  parser = argparse.ArgumentParser(prog='python plotting.py --render', description='Render job vacancy charts to image files.')
+  parser.add_argument('csv_files', nargs='+', help='CSV files written by the question scripts')
+  parser.add_argument('--out', required=True, help='folder for one image per file, or the image file with --grid')
+  parser.add_argument('--format', choices=IMAGE_FORMATS,
+                      help='image format (default: png, or the extension of the image with --grid)')
+  parser.add_argument('--grid', type=int, metavar='COLUMNS', help='draw every file as a panel of one image')
+  arguments = parser.parse_args(argv)
+
+  try:
+    charts = [read_chart(csv_file) for csv_file in arguments.csv_files]
+  except FileNotFoundError as e:
+    print(f"File not found: {e.filename}")
+    return 2
+  except ValueError as e:
+    print(f"Cannot read the file: {e}")
+    return 3
+
+  if arguments.grid:
+    try:
+      paths = [render_grid(charts, arguments.out, arguments.grid, arguments.format)]
+    except ValueError as e:
+      print(f"Cannot render the charts: {e}")
+      return 4
+  else:
+    paths = render_charts(charts, arguments.out, arguments.format or IMAGE_FORMATS[0])
+  for path in paths:
+    print(path)
+  return 0
 
 #
 #   Main control flow
 #
 if __name__ == "__main__":
+  profiling.configure()
+  if len(sys.argv) > 1 and sys.argv[1] == '--render':
+    sys.exit(render_main(sys.argv[2:]))
   if len(sys.argv) != 2:
     print("Usage: python plotting.py <csv_file>")
+    print("       python plotting.py --render <csv_file>... --out <folder|image> [--format png|svg] [--grid <columns>]")
     sys.exit(1)
   csv_file = sys.argv[1]
   main(csv_file)
\ No newline at end of file
@@ -1,10 +1,10 @@
 #!/usr/bin/env python
 '''
-question2.py
+question3.py
   Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
 
   Project: Job Vacancies in Canada
-  Date of Last Update: April 1, 2024
+  Date of Last Update: October 18, 2026
 
   Functional Summary
     This script processes a CSV file containing job vacancy data across Canada, focusing on
@@ -20,177 +20,51 @@ question2.py
     Users are prompted to select the type of minimum experience required and the type of National Occupation Classification (NOC),
     and the script filters and displays matching job vacancy data to the console.
 
-    Commandline Parameters: 1
+    Commandline Parameters: 1 or 2
       argv[1] = path to the input file
+      argv[2] = (optional) where to write the rows for plotting.py; by default a new
+                file of its own, dataForPlotting-q3-<unique id>.csv
+      --where <filter> = (optional) the rows to select, instead of asking for a
+                selection, e.g. --where "characteristic = 6 and ref_date = 2023"
+                (see vacancies/filters.py)
 '''
 
 #
 #   Packages and modules
 #
 
-# The 'csv' module gives us access to a tool that will read CSV
-# (Comma Separated Value) files and provide us access to each of
-# the fields on each line in turn
-import csv
+# The 'os' module is used to find the project folder this script lives in
+import os
 
-# The 'sys' module gives us access to system tools, including the
-# command line parameters, as well as standard input, output and error
+# The 'sys' module gives us access to the command line parameters
 import sys
 
+# The shared 'vacancies' package lives in the project folder, one level above
+# this script, so make sure it can be imported when the script is run directly
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# The 'profiling' module records how long each stage takes, when asked to
+from vacancies import profiling
+
+# The 'registry' module defines every question and the code they share
+from vacancies import registry
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+QUESTION = registry.QUESTIONS[3]
+
 
 def main(argv):
   '''
-  Main function in the script. Putting the body of the
-  script into a function allows us to separate the local
-  variables of this function from the global constants
-  declared outside.
+    Main function in the script: asks the user for a selection among the labels of
+    the data file, prints the matching rows and writes them to a file for plotting.py
+    (see registry.Question.run_script).
   '''
+  QUESTION.run_script(argv)
 
-  #
-  #   Check that we have been given the right number of parameters,
-  #   and store the following two command line arguments variables with
-  #   better names
-  #
-  if len(argv) != 2:
-    print("Usage: question3.py <file_name> <province/Canada>")
-    sys.exit(1)
-
-  # 
-  #   The name of the file that we will read
-  #
-  file_name = argv[1]
-
-  # User input for selection of the minimum experience required
-  print("Enter the type of minimum experience required: \n"
-          "1. Minimum experience level sought, all levels \n"
-          "2. Less than 1 year \n"
-          "3. 1 year to less than 3 years \n"
-          "4. 3 years to less than 5 years \n"
-          "5. 5 years to less than 8 years \n"
-          "6. 8 years or more")
-  experience_choice = get_valid_integer(1, 6)
-
-  # Dictionary mapping user input to corresponding experience requirement
-  experience_types = {
-        1: "Minimum experience level sought, all levels",
-        2: "Less than 1 year",
-        3: "1 year to less than 3 years",
-        4: "3 years to less than 5 years",
-        5: "5 years to less than 8 years",
-        6: "8 years or more"
-    }
-
-  if experience_choice in experience_types:
-    selected_experience_level = experience_types[experience_choice]
-  else:
-    print("Invalid choice. Please try again.")
-    sys.exit(1)
-
-    # User input for selection of the type of National Occupation Classification (NOC)
-  print("Enter the number of the type of National Occupation Classification you are looking for: \n"
-          "Your choices are: \n"
-          "1. All Occupations \n"
-          "2. Management occupations \n"
-          "3. Business, finance and administration occupations \n"
-          "4. Natural and applied sciences and related occupations \n"
-          "5. Health occupations \n"
-          "6. Occupations in education, law and social, community and government services \n"
-          "7. Occupations in art, culture, recreation and sport \n"
-          "8. Sales and service occupations \n"
-          "9. Trades, transport and equipment operators and related occupations \n"
-          "10. Natural resources, agriculture and related production occupations \n"
-          "11. Occupations in manufacturing and utilities")
-  noc_choice = get_valid_integer(1, 11)
-
-    # Mapping user input to NOC categories
-  occupation_choices_dict = {
-    1: 'Total, all occupations',
-    2: 'Management occupations [0]',
-    3: 'Business, finance and administration occupations [1]',
-    4: 'Natural and applied sciences and related occupations [2]',
-    5: 'Health occupations [3]',
-    6: 'Occupations in education, law and social, community, and government services [4]',
-    7: 'Occupations in art, culture, recreation, and sport [5]',
-    8: 'Sales and service occupations [6]',
-    9: 'Trades, transport, and equipment operators and related occupations [7]',
-    10: 'Natural resources, agriculture, and related production occupations [8]',
-    11: 'Occupations in manufacturing and utilities [9]',
-    12: 'Unclassified occupations'
-  }
-
-    #
-    #   Check if the choice exists in the dictionary
-    #
-  if noc_choice in occupation_choices_dict:
-        selected_noc = occupation_choices_dict[noc_choice]
-  else:
-      print("Invalid choice. Please try again.")
-      sys.exit(1)
-
-  try:
-    # Open the file for reading
-    with open(file_name, encoding="utf-8") as csv_file, open('dataForPlotting.csv', 'w', newline='', encoding='utf-8') as out_file:
-  
-      # Create a reader object that will read from the opened csv file
-        csv_reader = csv.reader(csv_file, delimiter=',')
-        csv_writer = csv.writer(out_file)
-
-  
-      # Print the header
-        header = ["Ref Date", "Geo", "National Occupation Classification", "Recruitment Strategy", "Statistics", "Value"]
-        print_and_write_csv(csv_writer, header)
-    
-        for row in csv_reader:
-  
-        # Check if the row is empty
-          if not row:  # If row is empty, skip to the next iteration
-            continue
-  
-          # Attempt to unpack the row into variables
-          try:
-            ref_date = row[0]
-            geo = row[1]
-            national_occupation_classification = row[3]
-            job_characteristic = row[4]
-            statistics = row[5]
-            value = row[12]
-    
-              # Matching user-selected criteria
-            if (national_occupation_classification == selected_noc and job_characteristic == selected_experience_level):
-                # Print rows with valid 'value'
-              print(f"{ref_date}, {geo}, {national_occupation_classification}, {job_characteristic}, {statistics}, {value or 0}")
-              data_row = [ref_date, geo, national_occupation_classification, job_characteristic, statistics, value or 0]
-              print_and_write_csv(csv_writer, data_row)
-              
-          except ValueError as e:
-                  print(f"Error processing row: {e}, row data: {row}")   
-            
-  except FileNotFoundError:
-        print(f"File not found: {file_name}")
-        sys.exit(2)
-  except Exception as e:
-        print(f"An unexpected error occurred: {e}")
-        sys.exit(3)
-
-def get_valid_integer(lower_bound, upper_bound):
-    '''
-    Utility function to ensure user input is a valid integer within specified bounds.
-    '''
-    while True:
-        try:
-            user_input = int(input("Please enter your choice: "))
-            if lower_bound <= user_input <= upper_bound:
-                return user_input
-            else:
-                print(f"Please enter an integer between {lower_bound} and {upper_bound}.")
-        except ValueError:
-            print("Please enter a valid integer.")
-
-def print_and_write_csv(csv_writer, data):
-  # Convert all items in 'data' to strings and join with commas for printing
-  print_str = ', '.join(map(str, data))
-  print(print_str)  # Print to terminal
-  csv_writer.writerow(data)  # Write to CSV
 
 if __name__ == "__main__":
-    main(sys.argv)
\ No newline at end of file
+  profiling.configure()
+  main(sys.argv)
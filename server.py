@@ -0,0 +1,421 @@
+#!/usr/bin/env python
+'''
+server.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This script answers selections over HTTP, so a dashboard can ask for many of them
+    without starting Python for each one. It loads every data file once at start-up,
+    keeps the tables, cubes and proportions in memory and serves, with asyncio:
+
+      GET  /questions           the questions and the NOC / characteristic choices of each
+      GET  /series?question=1&noc=2&characteristic=6
+                                the rows and proportions of a selection, as JSON; the
+                                choices are menu numbers or labels, like in batch mode
+      POST /batch               a JSON list of selections (or {"queries": [...]}),
+                                answered together as a JSON list
+      GET  /chart?question=1&noc=2&characteristic=6&format=png
+                                the chart of a selection, as PNG or SVG
+      GET  /join?column=1:6&column=4:2&noc=5
+                                characteristics of several questions joined on
+                                (REF_DATE, GEO, NOC), see vacancies/join.py; noc, geo
+                                and how=inner|outer are optional
+      GET  /select?question=1&where=noc in (1, 3) and ref_date = 2023
+                                the rows of a question that pass a filter, see
+                                vacancies/filters.py (the query string is URL-encoded)
+
+    The selections are answered in the event loop, from memory: the tables, cubes and
+    proportions are loaded at start-up and the answers are kept in an in-memory cache
+    (results.MemoryCache), so answering a selection reads and writes no file. Charts
+    are rendered in a pool of worker processes; concurrent requests for the same chart
+    share one rendering, and rendered charts are kept in the on-disk result cache by
+    results.query_figure(), which runs in a worker thread rather than in the event
+    loop.
+
+    A request that cannot be read gets a 400 answer and one that fails unexpectedly a
+    500 answer; the connection is then closed.
+
+    Commandline Parameters (all optional):
+      --host <address>       the address to listen on (default: 127.0.0.1)
+      --port <N>             the port to listen on (default: 8080)
+      --render-workers <N>   the number of chart rendering processes
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'asyncio' serves many connections at once in one thread
+import asyncio
+
+# 'contextlib' stops the server quietly on Ctrl-C
+import contextlib
+
+# 'json' reads the requests and writes the answers
+import json
+
+# 'sys' gives access to the command line parameters and the error output
+import sys
+
+# 'traceback' reports the requests that fail unexpectedly
+import traceback
+
+# 'concurrent.futures' runs the chart rendering processes
+from concurrent.futures import ProcessPoolExecutor
+
+# 'http' gives the text of each status code
+from http import HTTPStatus
+
+# 'urllib.parse' reads the query string of a request
+from urllib.parse import parse_qs, urlsplit
+
+#
+#  main.py knows how to look up a question for batch.answer_selection()
+#
+import main
+
+# The plotting module renders the charts
+import plotting
+
+# 'batch' answers selections the same way batch mode does
+from vacancies import batch
+
+# 'filters' selects the rows that pass a filter
+from vacancies import filters
+
+# 'join' answers the queries across several data files
+from vacancies import join
+
+# 'loader' gives the header of the selected rows
+from vacancies import loader
+
+# 'parallel' loads every data file at start-up
+from vacancies import parallel
+
+# 'proportions' computes the shares of every data file at start-up
+from vacancies import proportions
+
+# 'registry' defines the questions and their data files
+from vacancies import registry
+
+# 'results' keeps the rendered charts
+from vacancies import results
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8080
+DEFAULT_RENDER_WORKERS = 2
+MAX_BODY_BYTES = 1 << 20
+CHART_FORMATS = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+
+class HttpError(Exception):
+  '''
+    Ends a request with an HTTP error status.
+
+    Attributes:
+    status (HTTPStatus): the status of the answer
+    close (bool): True to close the connection after the answer, e.g. when the body
+      of the request could not be read
+  '''
+
+  def __init__(self, status, message, close=False):
+    super().__init__(message)
+    self.status = status
+    self.close = close
+
+
+class QueryService:
+  '''
+    Answers the requests, from the data loaded at start-up.
+
+    Attributes:
+    render_pool (ProcessPoolExecutor): the chart rendering processes
+    result_cache (ResultCache): where rendered charts are kept, or None
+    answers (MemoryCache): the answers of the selections, kept in memory
+  '''
+
+  def __init__(self, render_workers=DEFAULT_RENDER_WORKERS):
+    self.render_pool = ProcessPoolExecutor(max_workers=max(1, render_workers))
+    self.result_cache = results.default_cache()
+    self.answers = results.MemoryCache()
+    # Charts being rendered, so concurrent requests for one chart share the work
+    self._rendering = {}
+
+  def load(self):
+    '''
+      Loads every data file, computes its proportions and starts the render workers,
+      so requests never wait for them.
+    '''
+    parallel.load_tables([question.data_file for question in registry.QUESTIONS.values()])
+    for question in registry.QUESTIONS.values():
+      proportions.load_proportions(question.data_file, question.total_label)
+      # The content hash is part of every answer's key; it is only computed once
+      results.file_version(question.data_file)
+    # The render workers are forked on the first task; they are started here, before
+    # any connection is accepted, so none of them holds a client's socket open
+    self.render_pool.submit(int).result()
+
+  def close(self):
+    self.render_pool.shutdown()
+
+  def describe_questions(self):
+    return [
+        {
+            'question': number,
+            'title': question.title,
+            'data_file': question.data_file,
+            'noc': question.choices('noc'),
+            'characteristic': question.choices('characteristic'),
+            'total': question.total(),
+        }
+        for number, question in registry.QUESTIONS.items()
+    ]
+
+  def answer(self, selection):
+    '''
+      Answers one selection, see batch.answer_selection().
+    '''
+    missing = [field for field in batch.SELECTION_FIELDS if field not in selection]
+    if missing:
+      raise HttpError(HTTPStatus.BAD_REQUEST, f"Missing: {', '.join(missing)}")
+    try:
+      return batch.answer_selection(selection, main.load_question, self.answers)
+    except (KeyError, ValueError) as e:
+      raise HttpError(HTTPStatus.BAD_REQUEST, str(e)) from None
+
+  def join(self, query):
+    '''
+      Answers a join query, see join.join_query().
+
+      Parameters:
+      query (dict): the query string, field -> list of values
+    '''
+    columns = query.get('column', [])
+    if not columns:
+      raise HttpError(HTTPStatus.BAD_REQUEST, "Missing: column")
+    noc, geo, how = (query.get(field, [default])[0] for field, default in (('noc', None), ('geo', None), ('how', 'inner')))
+    try:
+      return join.join_query(columns, noc, geo, how)
+    except (KeyError, ValueError) as e:
+      raise HttpError(HTTPStatus.BAD_REQUEST, str(e)) from None
+
+  def select(self, query):
+    '''
+      Returns the rows of a question that pass a filter, see filters.select_rows().
+
+      Parameters:
+      query (dict): the query string, field -> list of values
+    '''
+    missing = [field for field in ('question', 'where') if field not in query]
+    if missing:
+      raise HttpError(HTTPStatus.BAD_REQUEST, f"Missing: {', '.join(missing)}")
+    try:
+      question = registry.get_question(int(query['question'][0]))
+      rows = filters.select_rows(question.data_file, query['where'][0])
+    except ValueError as e:
+      raise HttpError(HTTPStatus.BAD_REQUEST, str(e)) from None
+    return {'question': question.number, 'where': query['where'][0], 'header': loader.OUTPUT_HEADER, 'rows': rows}
+
+  def answer_batch(self, selections):
+    '''
+      Answers a list of selections; one that cannot be answered gets an "error" entry.
+    '''
+    answers = []
+    for number, selection in enumerate(selections, start=1):
+      try:
+        answer = self.answer(selection)
+      except HttpError as e:
+        answer = {'error': str(e), 'selection': selection}
+      answers.append({'query': number, **answer})
+    return answers
+
+  async def chart(self, selection, file_format):
+    '''
+      Returns the chart of a selection as image bytes, rendered in the worker pool.
+    '''
+    if file_format not in CHART_FORMATS:
+      raise HttpError(HTTPStatus.BAD_REQUEST, f"Unknown format '{file_format}', use one of: {', '.join(CHART_FORMATS)}")
+    answer = self.answer(selection)
+    if not answer['rows']:
+      raise HttpError(HTTPStatus.NOT_FOUND, "No job vacancy data matches this selection.")
+
+    data_file = registry.get_question(answer['question']).data_file
+    key_text = json.dumps([answer['question'], answer['noc'], answer['characteristic'], file_format])
+    rendering = self._rendering.get(key_text)
+    if rendering is None:
+      chart = plotting.chart_from_rows(answer['rows'])
+
+      def render(chart_format):
+        return self.render_pool.submit(plotting.render_bytes, chart, chart_format).result()
+
+      # The result cache is read and written in a worker thread, the chart rendered
+      # in the pool; the event loop only waits for them
+      rendering = asyncio.ensure_future(asyncio.get_running_loop().run_in_executor(
+          None, results.query_figure, data_file, answer['question'], answer['noc'], answer['characteristic'],
+          render, file_format, self.result_cache))
+      self._rendering[key_text] = rendering
+      rendering.add_done_callback(lambda _: self._rendering.pop(key_text, None))
+    return await asyncio.shield(rendering)
+
+
+def _selection(query):
+  return {field: values[0] for field, values in parse_qs(query).items()}
+
+
+async def route(service, method, target, body):
+  '''
+    Answers one request.
+
+    Returns:
+    tuple: (content type, body bytes)
+  '''
+  url = urlsplit(target)
+  if url.path == '/questions' and method == 'GET':
+    return 'application/json', json.dumps(service.describe_questions()).encode('utf-8')
+
+  if url.path == '/series' and method == 'GET':
+    return 'application/json', json.dumps(service.answer(_selection(url.query))).encode('utf-8')
+
+  if url.path == '/batch' and method == 'POST':
+    try:
+      selections = json.loads(body or b'[]')
+    except ValueError as e:
+      raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid JSON: {e}") from None
+    if isinstance(selections, dict):
+      selections = selections.get('queries', [])
+    if not isinstance(selections, list) or not all(isinstance(selection, dict) for selection in selections):
+      raise HttpError(HTTPStatus.BAD_REQUEST, "Expected a list of selections")
+    return 'application/json', json.dumps(service.answer_batch(selections)).encode('utf-8')
+
+  if url.path == '/chart' and method == 'GET':
+    selection = _selection(url.query)
+    file_format = selection.pop('format', 'png')
+    return CHART_FORMATS.get(file_format, ''), await service.chart(selection, file_format)
+
+  if url.path == '/join' and method == 'GET':
+    return 'application/json', json.dumps(service.join(parse_qs(url.query))).encode('utf-8')
+
+  if url.path == '/select' and method == 'GET':
+    return 'application/json', json.dumps(service.select(parse_qs(url.query))).encode('utf-8')
+
+  if url.path in ('/questions', '/series', '/batch', '/chart', '/join', '/select'):
+    raise HttpError(HTTPStatus.METHOD_NOT_ALLOWED, f"{method} is not allowed on {url.path}")
+  raise HttpError(HTTPStatus.NOT_FOUND, f"Nothing at {url.path}")
+
+
+def _content_length(headers):
+  '''
+    Returns the length of the body of a request.
+
+    Raises:
+    HttpError: when the length is not a number or is too large; the body cannot be
+      skipped then, so the connection is closed after the answer
+  '''
+  text = headers.get('content-length') or '0'
+  if not text.isdigit():
+    raise HttpError(HTTPStatus.BAD_REQUEST, f"Invalid Content-Length: {text}", close=True)
+  length = int(text)
+  if length > MAX_BODY_BYTES:
+    raise HttpError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE, "Request body too large", close=True)
+  return length
+
+
+async def handle_connection(service, reader, writer):
+  '''
+    Serves the requests of one connection, keeping it open between requests.
+  '''
+  try:
+    while True:
+      request_line = await reader.readline()
+      if not request_line.strip():
+        break
+
+      keep_alive = False
+      try:
+        try:
+          method, target, version = request_line.decode('latin-1').split()
+        except ValueError:
+          raise HttpError(HTTPStatus.BAD_REQUEST, "Invalid request line", close=True) from None
+
+        headers = {}
+        while True:
+          line = await reader.readline()
+          if line in (b'\r\n', b'\n', b''):
+            break
+          name, _, value = line.decode('latin-1').partition(':')
+          headers[name.strip().lower()] = value.strip()
+
+        keep_alive = headers.get('connection', '').lower() != 'close' and version == 'HTTP/1.1'
+        length = _content_length(headers)
+        body = await reader.readexactly(length) if length else b''
+        status = HTTPStatus.OK
+        content_type, content = await route(service, method, target, body)
+      except (ConnectionError, asyncio.IncompleteReadError):
+        raise
+      except HttpError as e:
+        status = e.status
+        content_type, content = 'application/json', json.dumps({'error': str(e)}).encode('utf-8')
+        keep_alive = keep_alive and not e.close
+      except Exception:
+        # Anything else is a bug; the client still gets an answer
+        traceback.print_exc(file=sys.stderr)
+        status = HTTPStatus.INTERNAL_SERVER_ERROR
+        content_type, content = 'application/json', json.dumps({'error': status.phrase}).encode('utf-8')
+        keep_alive = False
+
+      writer.write(
+          f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+          f"Content-Type: {content_type}\r\n"
+          f"Content-Length: {len(content)}\r\n"
+          f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode('latin-1') + content)
+      await writer.drain()
+      if not keep_alive:
+        break
+  except (ConnectionError, asyncio.IncompleteReadError):
+    pass
+  finally:
+    writer.close()
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, render_workers=DEFAULT_RENDER_WORKERS):
+  '''
+    Loads the data and serves requests until the process is stopped.
+  '''
+  service = QueryService(render_workers)
+  service.load()
+  server = await asyncio.start_server(lambda reader, writer: handle_connection(service, reader, writer), host, port)
+  print(f"Serving job vacancy queries on http://{host}:{port}/")
+  try:
+    async with server:
+      await server.serve_forever()
+  finally:
+    service.close()
+
+
+def main_server(argv):
+  '''
+    Starts the server from the command line.
+  '''
+  parser = argparse.ArgumentParser(prog='server.py', description='Serve job vacancy queries over HTTP.')
+  parser.add_argument('--host', default=DEFAULT_HOST, help='address to listen on')
+  parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='port to listen on')
+  parser.add_argument('--render-workers', type=int, default=DEFAULT_RENDER_WORKERS, help='chart rendering processes')
+  arguments = parser.parse_args(argv[1:])
+
+  with contextlib.suppress(KeyboardInterrupt):
+    asyncio.run(serve(arguments.host, arguments.port, arguments.render_workers))
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main_server(sys.argv))
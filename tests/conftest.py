@@ -0,0 +1,79 @@
+'''
+conftest.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Fixtures shared by the tests. Every test gets a cache folder, a plotting folder
+    and a set of loaded tables of its own, and works on copies of the data files in
+    a temporary folder, so no test writes to dataFiles/ or sees what another test
+    loaded.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'os' builds the paths of the data files
+import os
+
+# 'shutil' copies the data files
+import shutil
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' names the environment variables of the on-disk cache
+from vacancies import cache
+
+# 'loader' holds the tables loaded in this process
+from vacancies import loader
+
+# 'registry' knows the data files and the plotting folder
+from vacancies import registry
+
+# 'synthetic' writes files of any size and shape
+from vacancies import synthetic
+
+
+@pytest.fixture(autouse=True)
+def isolated(tmp_path, monkeypatch):
+  '''
+    Gives the test its own cache, plotting folder and loaded tables.
+  '''
+  monkeypatch.setenv(cache.CACHE_DIR_VARIABLE, str(tmp_path / 'cache'))
+  monkeypatch.delenv(cache.NO_CACHE_VARIABLE, raising=False)
+  monkeypatch.setenv(registry.PLOT_DIR_VARIABLE, str(tmp_path))
+  monkeypatch.setattr(loader, '_loaded_tables', {})
+
+
+@pytest.fixture
+def copy_data_file(tmp_path):
+  '''
+    Returns a function copying the data file of a question to the test's folder.
+  '''
+  def copy(question_number=1):
+    source = registry.get_question(question_number).data_file
+    return shutil.copy(source, tmp_path / os.path.basename(source))
+  return copy
+
+
+@pytest.fixture
+def data_file(copy_data_file):
+  '''
+    A copy of the data file of question 1.
+  '''
+  return str(copy_data_file(1))
+
+
+@pytest.fixture
+def synthetic_file(tmp_path):
+  '''
+    A small synthetic file, with several GEOs and suppressed cells.
+  '''
+  path = str(tmp_path / 'synthetic.csv')
+  synthetic.write_file(path, quarter_count=6, geo_count=3, noc_count=4, characteristic_count=5,
+                       suppressed=0.1, seed=7)
+  return path
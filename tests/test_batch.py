@@ -0,0 +1,97 @@
+'''
+test_batch.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of batch.py and of the batch mode of main.py: the selections of a JSON, CSV
+    or TOML file are answered one JSON line each, menu numbers and labels alike, and
+    a selection that cannot be answered gets an error line instead of stopping the
+    batch. A VACANCIES_WORKERS that is not a number is reported, not raised.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'json' writes the selection files and reads the results
+import json
+
+# 'sys' tells if TOML files can be read
+import sys
+
+# 'pytest' runs the tests
+import pytest
+
+# 'main' runs the batch mode
+import main
+
+# 'batch' is the module tested
+from vacancies import batch
+
+# 'parallel' names the environment variable of the worker count
+from vacancies import parallel
+
+
+def read_results(path):
+  '''
+    The results of a batch, one per line of 'path'.
+  '''
+  with open(path, encoding='utf-8') as results_file:
+    return [json.loads(line) for line in results_file]
+
+
+def test_json_selections(tmp_path):
+  selection_file = tmp_path / 'selections.json'
+  selection_file.write_text(json.dumps({'queries': [
+      {'question': 1, 'noc': 1, 'characteristic': 6},
+      {'question': 1, 'noc': 'Total, all occupations', 'characteristic': 'Social media'},
+      {'question': 1, 'noc': 99, 'characteristic': 6},
+      {'question': 9, 'noc': 1, 'characteristic': 1},
+  ]}), encoding='utf-8')
+  results_file = str(tmp_path / 'results.jsonl')
+
+  assert main.run_batch(str(selection_file), results_file) == 3
+  first, by_label, bad_noc, bad_question = read_results(results_file)
+  assert [result['query'] for result in (first, by_label, bad_noc, bad_question)] == [1, 2, 3, 4]
+  assert first['characteristic'] == 'Social media' and first['rows']
+  assert {key: by_label[key] for key in ('noc', 'rows', 'proportions', 'status')} == \
+         {key: first[key] for key in ('noc', 'rows', 'proportions', 'status')}
+  assert len(first['rows']) == len(first['proportions']) == len(first['status'])
+  assert 'error' in bad_noc and 'error' in bad_question
+
+
+def test_csv_selections(tmp_path):
+  selection_file = tmp_path / 'selections.csv'
+  selection_file.write_text("question,characteristic,noc\n2,1,1\n3,1,2\n", encoding='utf-8')
+  results_file = str(tmp_path / 'results.jsonl')
+  assert main.run_batch(str(selection_file), results_file) == 0
+  assert [result['question'] for result in read_results(results_file)] == [2, 3]
+
+
+@pytest.mark.skipif(sys.version_info < (3, 11), reason="tomllib is new in Python 3.11")
+def test_toml_selections(tmp_path):
+  selection_file = tmp_path / 'selections.toml'
+  selection_file.write_text('[[query]]\nquestion = 4\ncharacteristic = 1\nnoc = 1\n', encoding='utf-8')
+  assert batch.read_selections(str(selection_file)) == [{'question': 4, 'characteristic': 1, 'noc': 1}]
+
+
+def test_invalid_selection_files(tmp_path):
+  missing_field = tmp_path / 'selections.json'
+  missing_field.write_text(json.dumps([{'question': 1, 'noc': 1}]), encoding='utf-8')
+  with pytest.raises(batch.SelectionError):
+    batch.read_selections(str(missing_field))
+  with pytest.raises(batch.SelectionError):
+    batch.read_selections(str(tmp_path / 'selections.txt'))
+  assert main.run_batch(str(missing_field), None) == 1
+  assert main.run_batch(str(tmp_path / 'absent.json'), None) == 2
+
+
+def test_invalid_worker_count(tmp_path, monkeypatch, capsys):
+  selection_file = tmp_path / 'selections.json'
+  selection_file.write_text(json.dumps([{'question': 1, 'noc': 1, 'characteristic': 1}]), encoding='utf-8')
+  monkeypatch.setenv(parallel.WORKERS_VARIABLE, 'many')
+  assert main.run_batch(str(selection_file), None) == 1
+  assert f"{parallel.WORKERS_VARIABLE} should be a whole number" in capsys.readouterr().out
@@ -0,0 +1,57 @@
+'''
+test_benchmark.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of benchmark.py: a scaled copy has the rows of its file once per scale,
+    every stage is measured, and saved results can be compared with.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'json' reads the saved results
+import json
+
+# 'benchmark' is the module tested
+import benchmark
+
+# 'loader' parses the scaled copies
+from vacancies import loader
+
+
+def test_scaled_copy(data_file, tmp_path):
+  table = loader.parse_file(data_file)
+  scaled = loader.parse_file(benchmark.write_scaled_copy(data_file, 3, str(tmp_path / 'scaled.csv')))
+  assert len(scaled) == 3 * len(table)
+  assert len(scaled.dictionaries['geo']) == 3 * len(table.dictionaries['geo'])
+  assert scaled.select(geo=table.dictionaries['geo'][0]) == table.select()
+
+
+def test_every_stage_is_measured(data_file, tmp_path):
+  result = benchmark.measure(1, data_file, 1, str(tmp_path))
+  assert result['rows'] == len(loader.parse_file(data_file)) and result['selections'] > 0
+  assert sorted(result['stages']) == sorted(benchmark.STAGES)
+  for stage in ('csv', 'parse', 'filter', 'write'):
+    assert result['stages'][stage]['rows'] > 0
+  assert result['stages']['parse']['megabytes_per_second'] is not None
+
+
+def test_saved_results_are_compared(tmp_path, capsys):
+  out_file = str(tmp_path / 'results.json')
+  arguments = ['benchmark.py', '--questions', '1', '--scales', '1', '--plots', '1']
+  assert benchmark.main_benchmark(arguments + ['--out', out_file]) == 0
+  with open(out_file, encoding='utf-8') as results_file:
+    report = json.load(results_file)
+  assert [(result['question'], result['scale']) for result in report['results']] == [(1, 1)]
+  capsys.readouterr()
+
+  assert benchmark.main_benchmark(arguments + ['--compare', out_file]) == 0
+  lines = capsys.readouterr().out.splitlines()
+  assert len(lines) == 1 + len(benchmark.STAGES)
+  assert all(line.endswith('x') for line in lines[1:])
+  assert benchmark.main_benchmark(arguments + ['--compare', str(tmp_path / 'absent.json')]) == 2
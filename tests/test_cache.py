@@ -0,0 +1,107 @@
+'''
+test_cache.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of cache.py through loader.load_table(): a cached table is used while its
+    data file is the same, kept when the file is only touched, and thrown away when
+    the content changes, even at the same size.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'os' changes the timestamps of the data file
+import os
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' is the module tested
+from vacancies import cache
+
+# 'loader' loads the tables through the cache
+from vacancies import loader
+
+
+def reload(file_name, parses):
+  '''
+    Loads a file as a new process would, counting the times it is parsed.
+  '''
+  loader._loaded_tables = {}
+  parse_file = loader.parse_file
+
+  def counted(path):
+    parses.append(path)
+    return parse_file(path)
+  with pytest.MonkeyPatch.context() as monkeypatch:
+    monkeypatch.setattr(loader, 'parse_file', counted)
+    return loader.load_table(file_name)
+
+
+def assert_same_table(table, expected):
+  assert table.dictionaries == expected.dictionaries
+  for name, _ in loader.ENCODED_COLUMNS:
+    assert memoryview(table.codes[name]).tobytes() == memoryview(expected.codes[name]).tobytes()
+  # Compared as bytes, so the NaNs of missing values compare equal
+  assert memoryview(table.values).tobytes() == memoryview(expected.values).tobytes()
+
+
+def touch(file_name):
+  stat = os.stat(file_name)
+  os.utime(file_name, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+
+def test_cached_table_is_used(data_file):
+  parses = []
+  first = reload(data_file, parses)
+  assert os.path.exists(cache.cache_path(data_file))
+  second = reload(data_file, parses)
+  assert len(parses) == 1
+  assert_same_table(second, first)
+
+
+def test_touched_file_keeps_its_cache(data_file):
+  parses = []
+  reload(data_file, parses)
+  touch(data_file)
+  reload(data_file, parses)
+  assert len(parses) == 1
+  # The new timestamp was written to the cache, so the file is not hashed again
+  assert cache.read_store(cache.cache_path(data_file))[0]['mtime_ns'] == os.stat(data_file).st_mtime_ns
+
+
+def test_changed_content_of_the_same_size_is_parsed_again(data_file):
+  parses = []
+  before = reload(data_file, parses)
+  with open(data_file, 'r+b') as data:
+    content = data.read()
+    position = content.index(b'"Canada"')
+    data.seek(position)
+    data.write(b'"Canadb"')
+  touch(data_file)
+  after = reload(data_file, parses)
+  assert len(parses) == 2
+  assert 'Canadb' in after.dictionaries['geo'] and 'Canadb' not in before.dictionaries['geo']
+
+
+def test_damaged_cache_is_parsed_again(data_file):
+  parses = []
+  expected = reload(data_file, parses)
+  with open(cache.cache_path(data_file), 'r+b') as cached:
+    cached.write(b'XXXX')
+  assert_same_table(reload(data_file, parses), expected)
+  assert len(parses) == 2
+
+
+def test_cache_can_be_turned_off(data_file, monkeypatch):
+  monkeypatch.setenv(cache.NO_CACHE_VARIABLE, '1')
+  parses = []
+  reload(data_file, parses)
+  reload(data_file, parses)
+  assert len(parses) == 2
+  assert not os.path.exists(cache.cache_path(data_file))
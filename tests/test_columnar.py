@@ -0,0 +1,81 @@
+'''
+test_columnar.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of columnar.py: a table written as a Parquet or Arrow IPC file reads back
+    as the same table, and selects the same rows, as the CSV file it came from. They
+    are skipped when the optional 'pyarrow' package is not installed.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'sys' hides pyarrow to test the error without it
+import sys
+
+# 'numpy' compares the columns
+import numpy as np
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' hashes the source file
+from vacancies import cache
+
+# 'columnar' is the module tested
+from vacancies import columnar
+
+# 'cube' gives the code columns as arrays
+from vacancies import cube
+
+# 'filters' selects rows of the files
+from vacancies import filters
+
+# 'loader' parses the CSV files
+from vacancies import loader
+
+# 'output' writes rows as Parquet or Arrow files
+from vacancies import output
+
+pytest.importorskip('pyarrow')
+
+
+@pytest.mark.parametrize('suffix', ['.parquet', '.arrow'])
+def test_table_round_trip(data_file, tmp_path, suffix):
+  path = str(tmp_path / ('table' + suffix))
+  columnar.export_file(data_file, path)
+
+  expected = loader.parse_file(data_file)
+  table = columnar.read_table(path)
+  assert table.dictionaries == expected.dictionaries
+  for name, _ in loader.ENCODED_COLUMNS:
+    assert np.array_equal(cube.code_array(table, name), cube.code_array(expected, name))
+  assert np.array_equal(np.frombuffer(table.values), np.frombuffer(expected.values), equal_nan=True)
+
+  metadata = columnar.table_metadata(columnar.read_arrow(path))
+  assert metadata['rows'] == len(expected) and metadata['sha256'] == cache.file_digest(data_file)
+
+  where = filters.compile_filter('noc = 2 and status <= C')
+  assert filters.select_rows(path, where) == where.select(expected)
+
+
+@pytest.mark.parametrize('kind', ['parquet', 'arrow'])
+def test_rows_round_trip(tmp_path, kind):
+  path = str(tmp_path / f"rows.{kind}")
+  rows = [['2023-01', 'Canada', 'Total', 'Social media', 'Job vacancies', 1250.0],
+          ['2023-04', 'Canada', 'Total', 'Social media', 'Job vacancies', None]]
+  output.write_rows(rows, output.open_sinks(f"{kind}:{path}"))
+  assert columnar.read_rows(path) == rows
+
+
+def test_missing_pyarrow_is_reported(tmp_path, monkeypatch):
+  monkeypatch.setitem(sys.modules, 'pyarrow', None)
+  with pytest.raises(ValueError, match='columnar'):
+    columnar.read_arrow(str(tmp_path / 'table.parquet'))
+  with pytest.raises(output.OutputError, match='columnar'):
+    output.open_sinks(f"parquet:{tmp_path / 'rows.parquet'}")
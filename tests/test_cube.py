@@ -0,0 +1,115 @@
+'''
+test_cube.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of cube.py: the rows sliced from the cube are the rows the table selects,
+    a cell the file has no row for stays missing, and a cube updated after a release
+    is the cube built from the updated file.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the test files
+import csv
+
+# 'numpy' compares the cubes
+import numpy as np
+
+# 'cube' is the module tested
+from vacancies import cube
+
+# 'incremental' applies a release to a loaded file
+from vacancies import incremental
+
+# 'loader' parses the files
+from vacancies import loader
+
+# 'synthetic' writes the rows of the test files
+from vacancies import synthetic
+
+
+def write(path, rows):
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+
+
+def assert_same_cube(built, expected):
+  assert built.labels == expected.labels
+  assert built.statistics == expected.statistics
+  assert np.array_equal(built.values, expected.values, equal_nan=True)
+  assert np.array_equal(built.grades, expected.grades)
+  assert np.array_equal(built.status == cube.NO_ROW_STATUS, expected.status == cube.NO_ROW_STATUS)
+
+
+def test_cube_rows_equal_table_rows(data_file, synthetic_file):
+  for file_name in (data_file, synthetic_file):
+    table = loader.load_table(file_name)
+    data_cube = cube.load_cube(file_name)
+    assert cube.load_cube(file_name) is data_cube
+    for noc in table.dictionaries['noc']:
+      for characteristic in table.dictionaries['characteristic']:
+        selected = table.select(noc=noc, characteristic=characteristic, statistics=data_cube.statistics)
+        assert sorted(data_cube.rows(noc, characteristic), key=lambda row: (row[1], row[0])) == \
+               sorted(selected, key=lambda row: (row[1], row[0]))
+
+
+def test_rows_of_unknown_labels(data_file):
+  data_cube = cube.load_cube(data_file)
+  noc = data_cube.labels['noc'][0]
+  characteristic = data_cube.labels['characteristic'][0]
+  assert data_cube.rows('No such NOC', characteristic) == []
+  assert data_cube.rows(noc, characteristic, geo='No such GEO') == []
+  assert data_cube.index('noc', 'No such NOC') is None
+
+
+def test_cell_without_a_row_is_missing(tmp_path):
+  rows = list(synthetic.generate_rows(quarter_count=3, geo_count=1, noc_count=2, characteristic_count=2,
+                                      suppressed=0, seed=3))
+  dropped = rows.pop(1)
+  path = str(tmp_path / 'gap.csv')
+  write(path, rows)
+
+  data_cube = cube.load_cube(path)
+  assert data_cube.labels['ref_date'] == sorted(data_cube.labels['ref_date'])
+  cell = tuple(data_cube.index(axis, dropped[column]) for axis, column in (
+      ('geo', loader.GEO_COLUMN), ('noc', loader.NOC_COLUMN),
+      ('characteristic', loader.CHARACTERISTIC_COLUMN), ('ref_date', loader.REF_DATE_COLUMN)))
+  assert data_cube.missing[cell]
+  assert data_cube.status[cell] == cube.NO_ROW_STATUS
+  assert data_cube.grades[cell] == cube.NO_GRADE
+  assert len(data_cube.rows(dropped[loader.NOC_COLUMN], dropped[loader.CHARACTERISTIC_COLUMN])) == 2
+
+
+def test_updated_cube_equals_built_cube(tmp_path):
+  rows = list(synthetic.generate_rows(quarter_count=5, geo_count=2, noc_count=2, characteristic_count=3,
+                                      suppressed=0.1, seed=4))
+  dates = sorted({row[loader.REF_DATE_COLUMN] for row in rows})
+  base = [row for row in rows if row[loader.REF_DATE_COLUMN] != dates[-1]]
+  release = [row for row in rows if row[loader.REF_DATE_COLUMN] == dates[-1]]
+  revision = list(base[0])
+  revision[loader.VALUE_COLUMN] = '12345'
+  revision[loader.STATUS_COLUMN] = 'E'
+
+  paths = [str(tmp_path / name) for name in ('data.csv', 'release.csv', 'expected.csv')]
+  write(paths[0], base)
+  write(paths[1], release + [revision])
+  write(paths[2], [revision] + base[1:] + release)
+
+  old_cube = cube.load_cube(paths[0])
+  incremental.apply_release(paths[0], paths[1])
+  updated = cube.built_cube(loader.load_table(paths[0]))
+  assert updated is not None and updated is not old_cube
+  assert_same_cube(updated, cube.build_cube(loader.parse_file(paths[2])))
+
+
+def test_nothing_to_update_without_a_cube(synthetic_file):
+  table = loader.load_table(synthetic_file)
+  assert cube.update_cube(table, table, []) is None
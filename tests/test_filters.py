@@ -0,0 +1,72 @@
+'''
+test_filters.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of filters.py: scanning a file that is not loaded must select the same rows
+    as filtering its loaded table, and bad filters must be reported.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'pytest' runs the tests
+import pytest
+
+# 'filters' is the module tested
+from vacancies import filters
+
+# 'loader' loads the tables the scans are compared with
+from vacancies import loader
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+FILTERS = [
+    'status = F and noc = 1',
+    'noc = 1 and status = F',
+    'noc = 12 and characteristic = 2',
+    'status <= C and noc in (2, 3) and ref_date = 2023',
+    'characteristic = "*media*" and ref_date between 2022-10 and 2023-04',
+    'noc not in (1) and status != A',
+    'geo = 1 and characteristic != 1',
+    'ref_date > 2022',
+]
+
+
+@pytest.mark.parametrize('question_number', [1, 2, 3, 4])
+@pytest.mark.parametrize('text', FILTERS)
+def test_scan_equals_loaded_table(copy_data_file, question_number, text):
+  file_name = str(copy_data_file(question_number))
+  selected = filters.compile_filter(text)
+  assert selected.scan(file_name) == selected.select(loader.parse_file(file_name))
+
+
+def test_scan_equals_loaded_table_on_synthetic_file(synthetic_file):
+  for text in FILTERS + ['geo = 3 and noc = 2', 'status = F and geo in (2, 3)']:
+    selected = filters.compile_filter(text)
+    assert selected.scan(synthetic_file) == selected.select(loader.parse_file(synthetic_file))
+
+
+def test_select_rows_is_the_same_before_and_after_loading(data_file):
+  before = filters.select_rows(data_file, 'status = F and noc = 1')
+  loader.load_table(data_file)
+  assert filters.select_rows(data_file, 'status = F and noc = 1') == before
+
+
+def test_menu_numbers_follow_the_file():
+  selected = filters.compile_filter('noc = 2')
+  assert selected.matches('noc', 'any label', 2)
+  assert not selected.matches('noc', 'any label', 1)
+
+
+@pytest.mark.parametrize('text', ['', 'noc', 'colour = red', 'noc < 3', 'ref_date = 23',
+                                  'status <= G', 'noc in (1, 2', 'noc = 1 or noc = 2'])
+def test_bad_filters_are_reported(text):
+  with pytest.raises(filters.FilterError):
+    filters.compile_filter(text)
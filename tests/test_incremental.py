@@ -0,0 +1,208 @@
+'''
+test_incremental.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of incremental.py: a release of a new quarter and revised values leaves the
+    data file, its table and its row index as if the updated file had been written
+    and parsed from scratch, the file gets a new content hash, and a rewrite that
+    fails or is cut short is undone through the journal.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the test files
+import csv
+
+# 'os' checks the file after the update
+import os
+
+# 'numpy' compares the columns
+import numpy as np
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' reads the store of the updated file
+from vacancies import cache
+
+# 'cube' slices the expected table
+from vacancies import cube
+
+# 'incremental' is the module tested
+from vacancies import incremental
+
+# 'index' reads the updated row index
+from vacancies import index
+
+# 'loader' parses the files
+from vacancies import loader
+
+# 'results' gives the content hash kept for the file
+from vacancies import results
+
+# 'synthetic' writes the rows of the test files
+from vacancies import synthetic
+
+
+def write(path, rows, footnotes=True):
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+    if footnotes:
+      csv_writer.writerows(synthetic.FOOTNOTES)
+
+
+@pytest.fixture
+def release(tmp_path):
+  '''
+    A data file without its last quarter, a release with that quarter and revised
+    values of the quarter before, and the file as it should be after the release.
+
+    Returns:
+    tuple: (data file, release file, expected file)
+  '''
+  rows = list(synthetic.generate_rows(quarter_count=6, geo_count=2, noc_count=3, characteristic_count=4,
+                                      suppressed=0.1, seed=2))
+  dates = sorted({row[loader.REF_DATE_COLUMN] for row in rows})
+  base = [row for row in rows if row[loader.REF_DATE_COLUMN] != dates[-1]]
+  new_quarter = [row for row in rows if row[loader.REF_DATE_COLUMN] == dates[-1]]
+
+  revised = {}
+  for position, row in enumerate(base):
+    if row[loader.REF_DATE_COLUMN] == dates[-2] and row[loader.VALUE_COLUMN]:
+      revision = list(row)
+      revision[loader.VALUE_COLUMN] = str(int(row[loader.VALUE_COLUMN]) + 5)
+      revised[position] = revision
+
+  # A folder of their own, so the tests can check that no temporary file or journal is left there
+  folder = tmp_path / 'files'
+  folder.mkdir()
+  paths = [str(folder / name) for name in ('data.csv', 'release.csv', 'expected.csv')]
+  write(paths[0], base)
+  write(paths[1], new_quarter + list(revised.values()), footnotes=False)
+  write(paths[2], [revised.get(position, row) for position, row in enumerate(base)] + new_quarter)
+  return paths
+
+
+def read(path):
+  with open(path, 'rb') as data_file:
+    return data_file.read()
+
+
+def leftovers(data_file):
+  '''
+    The temporary files and journals left next to 'data_file'.
+  '''
+  return [name for name in os.listdir(os.path.dirname(data_file))
+          if name.endswith(('.tmp', incremental.JOURNAL_SUFFIX))]
+
+
+def fail_rewrite(monkeypatch, data_file, times):
+  '''
+    Makes the first 'times' copies of bytes into 'data_file' fail half-way.
+  '''
+  copy = incremental._copy
+  failures = [times]
+
+  def fail(source_file, target_file, length=None):
+    if target_file.name == data_file and failures[0] > 0:
+      failures[0] -= 1
+      target_file.write(b'half a line')
+      raise OSError("disk full")
+    copy(source_file, target_file, length)
+  monkeypatch.setattr(incremental, '_copy', fail)
+
+
+def test_release_gives_the_updated_file(release):
+  data_file, release_file, expected_file = release
+  loader.load_table(data_file)
+  index.load_index(data_file)
+  mode = os.stat(data_file).st_mode
+
+  summary = incremental.apply_release(data_file, release_file)
+  assert (summary.added, summary.unchanged) == (2 * 3 * 4, 0) and summary.revised > 0
+
+  with open(data_file, 'rb') as updated, open(expected_file, 'rb') as expected:
+    assert updated.read() == expected.read()
+  assert os.stat(data_file).st_mode == mode
+  assert leftovers(data_file) == []
+
+  expected = loader.parse_file(expected_file)
+  table = loader.load_table(data_file)
+  assert table.dictionaries == expected.dictionaries
+  for name, _ in loader.ENCODED_COLUMNS:
+    assert np.array_equal(cube.code_array(table, name), cube.code_array(expected, name))
+  assert np.array_equal(np.frombuffer(table.values), np.frombuffer(expected.values), equal_nan=True)
+
+  row_index = index.load_index(data_file, rebuild=False)
+  expected_cube = cube.build_cube(expected)
+  for noc in expected.dictionaries['noc']:
+    for characteristic in expected.dictionaries['characteristic']:
+      assert row_index.rows(noc, characteristic) == expected_cube.rows(noc, characteristic)
+
+
+def test_updated_file_has_a_new_version(release):
+  data_file, release_file, expected_file = release
+  loader.load_table(data_file)
+  old_version = results.file_version(data_file)
+  incremental.apply_release(data_file, release_file)
+  assert results.file_version(data_file) != old_version
+
+  # Touched, the file no longer hashes to the version of its store, so it is parsed again
+  os.utime(data_file, ns=(0, 0))
+  loader._loaded_tables = {}
+  assert loader.load_table(data_file).dictionaries == loader.parse_file(expected_file).dictionaries
+  stored = cache.read_store(cache.cache_path(os.path.abspath(data_file)))
+  assert stored[0]['sha256'] == cache.file_digest(data_file)
+
+
+def test_failed_write_is_undone(release, monkeypatch):
+  data_file, release_file, _ = release
+  before = read(data_file)
+  fail_rewrite(monkeypatch, data_file, 1)
+  with pytest.raises(OSError):
+    incremental.apply_release(data_file, release_file)
+  assert read(data_file) == before
+  assert leftovers(data_file) == []
+
+
+def test_cut_short_write_is_undone_before_the_next_release(release, monkeypatch):
+  data_file, release_file, expected_file = release
+  before = read(data_file)
+
+  # The old bytes cannot be put back either, as when the process is killed
+  fail_rewrite(monkeypatch, data_file, 2)
+  with pytest.raises(OSError):
+    incremental.apply_release(data_file, release_file)
+  assert read(data_file) != before
+  assert os.path.exists(incremental.journal_path(data_file))
+
+  monkeypatch.undo()
+  assert incremental.recover_file(data_file)
+  assert read(data_file) == before and leftovers(data_file) == []
+  assert not incremental.recover_file(data_file)
+
+  fail_rewrite(monkeypatch, data_file, 2)
+  with pytest.raises(OSError):
+    incremental.apply_release(data_file, release_file)
+  monkeypatch.undo()
+  incremental.apply_release(data_file, release_file)
+  assert read(data_file) == read(expected_file)
+
+
+def test_same_release_twice_changes_nothing(release):
+  data_file, release_file, _ = release
+  incremental.apply_release(data_file, release_file)
+  with open(data_file, 'rb') as updated:
+    before = updated.read()
+  summary = incremental.apply_release(data_file, release_file)
+  assert (summary.added, summary.revised) == (0, 0) and summary.unchanged > 0
+  with open(data_file, 'rb') as kept:
+    assert kept.read() == before
@@ -0,0 +1,145 @@
+'''
+test_index.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of index.py: a selection read through the index of a file that is not
+    loaded must give the same rows, in the same order, as one sliced from the cube of
+    the loaded file, also for files with several statistics and rows out of date order.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the test files
+import csv
+
+# 'math' recognises missing shares
+import math
+
+# 'os' checks the permissions of the index file
+import os
+
+# 'random' shuffles the rows of a test file
+import random
+
+# 'stat' reads the permission bits
+import stat
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' writes the index files
+from vacancies import cache
+
+# 'cube' slices the loaded files
+from vacancies import cube
+
+# 'index' is the module tested
+from vacancies import index
+
+# 'loader' loads the files
+from vacancies import loader
+
+# 'proportions' gives the shares lined up with the rows
+from vacancies import proportions
+
+# 'synthetic' writes the rows of the test files
+from vacancies import synthetic
+
+
+@pytest.fixture
+def mixed_file(tmp_path):
+  '''
+    A file with two statistics, the second one first, and its rows shuffled.
+  '''
+  rows = []
+  for row in synthetic.generate_rows(quarter_count=5, geo_count=3, noc_count=3, characteristic_count=4,
+                                     suppressed=0.1, seed=3):
+    rows.append(row)
+    rate = list(row)
+    rate[loader.STATISTICS_COLUMN] = 'Job vacancy rate'
+    rate[loader.VALUE_COLUMN] = '1.5'
+    rows.append(rate)
+  random.Random(5).shuffle(rows)
+  path = str(tmp_path / 'mixed.csv')
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+  return path
+
+
+def selections(file_name):
+  table = loader.parse_file(file_name)
+  return [(noc, characteristic) for noc in table.dictionaries['noc']
+          for characteristic in table.dictionaries['characteristic']]
+
+
+def assert_same_rows(file_name):
+  wanted = selections(file_name)
+  cold = [index.select_rows(file_name, noc, characteristic) for noc, characteristic in wanted]
+  assert not loader.is_loaded(file_name)
+  loader.load_table(file_name)
+  warm = [index.select_rows(file_name, noc, characteristic) for noc, characteristic in wanted]
+  assert cold == warm
+  assert any(cold)
+
+
+def test_index_rows_equal_cube_rows(data_file):
+  assert_same_rows(data_file)
+
+
+def test_index_rows_equal_cube_rows_with_several_statistics(mixed_file):
+  assert_same_rows(mixed_file)
+  rows = index.select_rows(mixed_file, synthetic.NOCS[0], synthetic.CHARACTERISTICS[0])
+  assert {row[4] for row in rows} == {cube.DEFAULT_STATISTICS}
+
+
+def test_rows_line_up_with_shares(mixed_file):
+  noc, characteristic = synthetic.NOCS[1], synthetic.CHARACTERISTICS[2]
+  rows = index.select_rows(mixed_file, noc, characteristic)
+  computed = proportions.load_proportions(mixed_file)
+  data_cube = computed.cube
+  shares = computed.shares_for(noc, characteristic)
+  assert len(rows) == len(shares)
+  for row, share in zip(rows, shares, strict=True):
+    cell = (data_cube.index('geo', row[1]), data_cube.index('noc', noc),
+            data_cube.index('characteristic', characteristic), data_cube.index('ref_date', row[0]))
+    expected = float(computed.shares[cell])
+    assert share == (None if math.isnan(expected) else expected)
+
+
+def test_index_file_is_readable_by_everyone(data_file):
+  index.load_index(data_file)
+  mode = stat.S_IMODE(os.stat(index.index_path(data_file)).st_mode)
+  assert mode == cache.FILE_MODE
+
+
+def test_unwritable_index_falls_back_to_memory(data_file, monkeypatch):
+  def refuse(*_arguments):
+    raise PermissionError("read-only folder")
+  monkeypatch.setattr(cache, 'write_columns', refuse)
+  row_index = index.load_index(data_file)
+  assert not os.path.exists(index.index_path(data_file))
+  noc, characteristic, geo = row_index.keys[0]
+  assert row_index.rows(noc, characteristic) == cube.load_cube(data_file).rows(noc, characteristic)
+
+
+def test_index_is_rebuilt_when_the_file_changes(data_file):
+  row_index = index.load_index(data_file)
+  assert index.load_index(data_file, rebuild=False).keys == row_index.keys
+  noc, characteristic, geo = row_index.keys[0]
+  rows = row_index.rows(noc, characteristic, geo)
+
+  with open(data_file, encoding='utf-8-sig', newline='') as source_file:
+    lines = source_file.readlines()
+  with open(data_file, 'w', encoding='utf-8-sig', newline='') as source_file:
+    source_file.writelines(lines[:1] + lines[2:])
+  assert index.load_index(data_file, rebuild=False) is None
+  # The first row of the file is gone
+  assert index.load_index(data_file).rows(noc, characteristic, geo) == rows[1:]
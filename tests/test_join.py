@@ -0,0 +1,123 @@
+'''
+test_join.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of join.py: every joined value and share is the one of its own file, an
+    inner join keeps the keys every file has and an outer join the keys any file
+    has, and a column that does not exist is rejected.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cube' gives the values of each file
+from vacancies import cube
+
+# 'join' is the module tested
+from vacancies import join
+
+# 'output' names the environment variable of the output spec
+from vacancies import output
+
+# 'proportions' gives the shares of each file
+from vacancies import proportions
+
+# 'registry' holds the questions joined
+from vacancies import registry
+
+# 'synthetic' writes the files joined
+from vacancies import synthetic
+
+
+@pytest.fixture
+def questions(tmp_path, monkeypatch):
+  '''
+    Two questions of synthetic files; the second one starts a quarter later, has
+    one more quarter and one more NOC.
+
+    Returns:
+    tuple: the numbers of the two questions
+  '''
+  for number, start, quarter_count, noc_count in ((91, '2022-01', 4, 2), (92, '2022-04', 4, 3)):
+    path = str(tmp_path / f"question{number}.csv")
+    synthetic.write_file(path, quarter_count=quarter_count, geo_count=2, noc_count=noc_count, characteristic_count=3,
+                         start=start, suppressed=0.1, seed=number)
+    monkeypatch.setitem(registry.QUESTIONS, number, registry.Question(number, f"Question {number}", path, 'characteristic'))
+  return 91, 92
+
+
+def expected_cell(number, characteristic, date, geo, noc):
+  '''
+    The value and the share of one cell of the file of a question, None when missing.
+  '''
+  data_file = registry.get_question(number).data_file
+  data_cube = cube.load_cube(data_file)
+  cell = tuple(data_cube.index(axis, label) for axis, label in (
+      ('geo', geo), ('noc', noc), ('characteristic', characteristic), ('ref_date', date)))
+  if None in cell:
+    return [None, None]
+  rows = data_cube.rows(noc, characteristic, geo)
+  position = [row[0] for row in rows].index(date)
+  share = proportions.load_proportions(data_file).shares_for(noc, characteristic, geo)[position]
+  return [rows[position][5], None if share is None else round(share, 6)]
+
+
+@pytest.mark.parametrize('how', join.JOIN_TYPES)
+def test_joined_values_are_those_of_each_file(questions, how):
+  first, second = questions
+  characteristics = [registry.get_question(number).choices('characteristic')[2] for number in questions]
+  joined = join.join([f"{first}:2", f"{second}:{characteristics[1]}"], how)
+  assert [column.characteristic for column in joined.columns] == characteristics
+
+  dates = [cube.load_cube(registry.get_question(number).data_file).labels['ref_date'] for number in questions]
+  nocs = [cube.load_cube(registry.get_question(number).data_file).labels['noc'] for number in questions]
+  if how == 'inner':
+    assert joined.labels['ref_date'] == dates[0][1:] and joined.labels['noc'] == nocs[0]
+  else:
+    assert joined.labels['ref_date'] == dates[0] + dates[1][-1:] and joined.labels['noc'] == nocs[1]
+
+  rows = joined.rows()
+  assert len(rows) == len(joined.labels['geo']) * len(joined.labels['noc']) * len(joined.labels['ref_date'])
+  assert len(joined.header()) == len(rows[0]) == 3 + 2 * 2
+  for row in rows:
+    date, geo, noc = row[:3]
+    assert row[3:] == expected_cell(first, characteristics[0], date, geo, noc) + \
+                      expected_cell(second, characteristics[1], date, geo, noc)
+
+
+def test_join_query(questions):
+  first, second = questions
+  answer = join.join_query([f"{first}:1", f"{second}:1"], noc='1')
+  noc = cube.load_cube(registry.get_question(first).data_file).labels['noc'][0]
+  assert answer['header'] == join.KEY_HEADER + [answer['columns'][0], f"{answer['columns'][0]} (proportion)",
+                                                answer['columns'][1], f"{answer['columns'][1]} (proportion)"]
+  assert answer['rows'] and {row[2] for row in answer['rows']} == {noc}
+  # The total characteristic is its own total
+  assert {row[4] for row in answer['rows'] if row[3] is not None} == {1.0}
+
+
+@pytest.mark.parametrize('columns', [[], ['1'], ['x:1'], ['1:'], ['1:99'], ['1:No such characteristic'], ['99:1']])
+def test_invalid_columns(columns):
+  with pytest.raises(ValueError):
+    join.join(columns)
+
+
+def test_unknown_join_type():
+  with pytest.raises(ValueError):
+    join.join(['1:6'], 'left')
+
+
+def test_command_line(questions, monkeypatch, capsys):
+  first, second = questions
+  monkeypatch.setenv(output.OUTPUT_VARIABLE, 'summary')
+  assert join.main(['join.py', f"{first}:2", f"{second}:2", '--outer']) == 0
+  assert capsys.readouterr().out.startswith(f"{2 * 3 * 5} rows")
+  assert join.main(['join.py', f"{first}:99"]) == 3
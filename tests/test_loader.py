@@ -0,0 +1,78 @@
+'''
+test_loader.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of loader.py: every data file is parsed in one pass into the rows a
+    csv.reader finds in it, without its header and footnotes, and is parsed only
+    once per process for all the questions that use it.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' reads the data files the way the question scripts used to
+import csv
+
+# 'math' checks the missing values
+import math
+
+# 'os' changes the timestamps of the data file
+import os
+
+# 'loader' is the module tested
+from vacancies import loader
+
+# 'registry' gives the data file of each question
+from vacancies import registry
+
+
+def csv_rows(file_name):
+  '''
+    The data rows of a file, read with csv.reader.
+  '''
+  with open(file_name, encoding='utf-8-sig', newline='') as data_file:
+    return [row for row in csv.reader(data_file) if loader.is_data_row(row)]
+
+
+def test_every_data_file_is_parsed(copy_data_file):
+  for number in registry.QUESTIONS:
+    file_name = str(copy_data_file(number))
+    rows = csv_rows(file_name)
+    table = loader.parse_file(file_name)
+    assert len(table) == len(rows)
+    for row_id in (0, len(rows) // 2, len(rows) - 1):
+      row = rows[row_id]
+      assert table.output_row(row_id) == [row[loader.REF_DATE_COLUMN], row[loader.GEO_COLUMN], row[loader.NOC_COLUMN],
+                                          row[loader.CHARACTERISTIC_COLUMN], row[loader.STATISTICS_COLUMN],
+                                          loader.output_value(loader.parse_value(row[loader.VALUE_COLUMN]))]
+
+    noc, characteristic = rows[0][loader.NOC_COLUMN], rows[0][loader.CHARACTERISTIC_COLUMN]
+    expected = [row_id for row_id, row in enumerate(rows)
+                if row[loader.NOC_COLUMN] == noc and row[loader.CHARACTERISTIC_COLUMN] == characteristic]
+    assert table.filter(noc=noc, characteristic=characteristic) == expected
+    assert table.filter(noc='No such NOC') == []
+
+
+def test_values():
+  assert loader.output_value(12.0) == 12 and isinstance(loader.output_value(12.0), int)
+  assert loader.output_value(2.5) == 2.5
+  assert loader.output_value(math.nan) is None
+  assert math.isnan(loader.parse_value('')) and math.isnan(loader.parse_value('..'))
+  assert loader.parse_value(b'40') == 40.0
+
+
+def test_file_is_loaded_once(data_file):
+  table = loader.load_table(data_file)
+  assert loader.is_loaded(data_file)
+  assert loader.load_table(os.path.join(os.path.dirname(data_file), '.', os.path.basename(data_file))) is table
+
+  # A file changed since it was loaded is loaded again
+  stat = os.stat(data_file)
+  os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+  assert not loader.is_loaded(data_file)
+  assert loader.load_table(data_file) is not table
@@ -0,0 +1,59 @@
+'''
+test_main.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of the menu of main.py: a question is answered inside the process, without
+    starting another one, and a choice that is not on the menu is reported.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'os' is checked for commands started from main.py
+import os
+
+# 'subprocess' is checked for processes started from main.py
+import subprocess
+
+# 'matplotlib.pyplot' shows the chart
+import matplotlib.pyplot as plt
+
+# 'main' is the module tested
+import main
+
+
+def answer(monkeypatch, *answers):
+  '''
+    Answers the prompts of main.py with 'answers', in order.
+  '''
+  answers = iter(answers)
+  monkeypatch.setattr('builtins.input', lambda _prompt='': next(answers))
+
+
+def test_question_runs_in_process(monkeypatch, capsys):
+  def no_process(*_args, **_kwargs):
+    raise AssertionError("main.py started another process")
+  monkeypatch.setattr(os, 'system', no_process)
+  monkeypatch.setattr(subprocess, 'Popen', no_process)
+  shown = []
+  monkeypatch.setattr(plt, 'show', lambda: shown.append(plt.gcf()))
+
+  # Question 1, characteristic 6 (Social media), NOC 1
+  answer(monkeypatch, '1', '6', '1')
+  main.main(['main.py'])
+  printed = capsys.readouterr().out
+  assert "Social media" in printed
+  assert "of 'Recruitment strategies, all types'" in printed
+  assert len(shown) == 1 and shown[0].axes[0].get_title().endswith("Social media")
+  plt.close('all')
+
+
+def test_invalid_choice(monkeypatch, capsys):
+  answer(monkeypatch, '9')
+  main.main(['main.py'])
+  assert "Invalid choice" in capsys.readouterr().out
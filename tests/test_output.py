@@ -0,0 +1,85 @@
+'''
+test_output.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of output.py: every sink of an output spec gets the same rows, a missing
+    value is shown as ".." on the console and left empty in files, and a file sink
+    leaves no file behind when the rows could not all be written.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' reads the CSV sink
+import csv
+
+# 'json' reads the JSON Lines sink
+import json
+
+# 'os' checks the files written
+import os
+
+# 'pytest' runs the tests
+import pytest
+
+# 'output' is the module tested
+from vacancies import output
+
+HEADER = ['REF_DATE', 'GEO', 'VALUE']
+ROWS = [['2023-04', 'Canada', 10], ['2023-01', 'Canada', None], ['2023-07', 'Ontario', 2.5]]
+
+
+def test_every_sink_gets_the_rows(tmp_path, capsys):
+  csv_file, jsonl_file = str(tmp_path / 'rows.csv'), str(tmp_path / 'rows.jsonl')
+  sinks = output.open_sinks(f"quiet, summary,stdout,csv:{csv_file},jsonl:{jsonl_file}", HEADER)
+  assert output.write_rows(ROWS, sinks) == 3
+  assert [sink.rows for sink in sinks] == [3] * 5
+
+  assert capsys.readouterr().out.splitlines() == [
+      '2023-04, Canada, 10', '2023-01, Canada, ..', '2023-07, Ontario, 2.5', '3 rows, 2023-01 to 2023-07']
+  with open(csv_file, encoding='utf-8', newline='') as rows_file:
+    assert list(csv.reader(rows_file)) == [HEADER] + [['2023-04', 'Canada', '10'], ['2023-01', 'Canada', ''],
+                                                      ['2023-07', 'Ontario', '2.5']]
+  with open(jsonl_file, encoding='utf-8') as rows_file:
+    assert [json.loads(line) for line in rows_file] == [dict(zip(HEADER, row, strict=True)) for row in ROWS]
+  assert sorted(os.listdir(tmp_path)) == ['rows.csv', 'rows.jsonl']
+
+
+def test_spec_from_the_environment(monkeypatch, capsys):
+  monkeypatch.setenv(output.OUTPUT_VARIABLE, 'summary')
+  output.write_rows([], output.open_sinks(header=HEADER))
+  assert capsys.readouterr().out == "0 rows\n"
+
+
+@pytest.mark.parametrize('spec', ['nowhere', 'csv', 'quiet:rows.txt'])
+def test_bad_spec(spec, tmp_path):
+  csv_file = str(tmp_path / 'rows.csv')
+  with pytest.raises(output.OutputError):
+    output.open_sinks(f"csv:{csv_file},{spec}", HEADER)
+  # The sinks opened before the bad entry leave nothing behind
+  assert os.listdir(tmp_path) == []
+
+
+def test_failed_write_leaves_no_file(tmp_path):
+  csv_file = str(tmp_path / 'rows.csv')
+  with open(csv_file, 'w', encoding='utf-8') as rows_file:
+    rows_file.write("rows of an earlier query\n")
+  sinks = output.open_sinks(f"csv:{csv_file},jsonl:{tmp_path / 'rows.jsonl'}", HEADER)
+  # The CSV sink writes every row, then the JSON Lines sink cannot write the last one
+  with pytest.raises(TypeError):
+    output.write_rows(ROWS + [['2023-10', 'Canada', object()]], sinks)
+  assert os.listdir(tmp_path) == ['rows.csv']
+  with open(csv_file, encoding='utf-8') as rows_file:
+    assert rows_file.read() == "rows of an earlier query\n"
+
+
+def test_parquet_sink(tmp_path):
+  pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+  parquet_file = str(tmp_path / 'rows.parquet')
+  output.write_rows(ROWS, output.open_sinks(f"parquet:{parquet_file}", HEADER))
+  assert pyarrow_parquet.read_table(parquet_file).to_pydict() == {name: list(column) for name, column in zip(HEADER, zip(*ROWS, strict=True), strict=True)}
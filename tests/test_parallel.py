@@ -0,0 +1,180 @@
+'''
+test_parallel.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of parallel.py: files cut into byte ranges, parsed or summed in worker
+    processes and merged, give the same tables and the same sums as one pass over the
+    whole file, also when the rows are in no particular order, and a file already in
+    the on-disk cache is fetched from it only once.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the shuffled test file
+import csv
+
+# 'random' shuffles the rows of a test file
+import random
+
+# 'numpy' compares the sums
+import numpy as np
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' is watched for fetches of the cached files
+from vacancies import cache
+
+# 'cube' builds the cube of the whole file
+from vacancies import cube
+
+# 'filters' compiles the filters of the sums
+from vacancies import filters
+
+# 'loader' parses the whole file
+from vacancies import loader
+
+# 'parallel' is the module tested
+from vacancies import parallel
+
+# 'quality' sums the whole file
+from vacancies import quality
+
+# 'synthetic' writes the rows of the test files
+from vacancies import synthetic
+
+#
+#  Small ranges, so every test file is cut into several
+#
+RANGE_BYTES = 2000
+
+
+@pytest.fixture
+def shuffled_file(tmp_path):
+  '''
+    A file with two statistics, the second one first, and its rows shuffled.
+  '''
+  rows = []
+  for row in synthetic.generate_rows(quarter_count=5, geo_count=4, noc_count=3, characteristic_count=4,
+                                     suppressed=0.1, seed=11):
+    rate = list(row)
+    rate[loader.STATISTICS_COLUMN] = 'Job vacancy rate'
+    rate[loader.VALUE_COLUMN] = '2.5'
+    rows.extend([rate, row])
+  random.Random(2).shuffle(rows)
+  path = str(tmp_path / 'shuffled.csv')
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+  return path
+
+
+def test_load_tables_matches_one_pass(synthetic_file, shuffled_file):
+  tables = parallel.load_tables([synthetic_file, shuffled_file], workers=3, min_range_bytes=RANGE_BYTES)
+  for file_name in (synthetic_file, shuffled_file):
+    expected = loader.parse_file(file_name)
+    assert tables[file_name].dictionaries == expected.dictionaries
+    assert list(tables[file_name].values) == pytest.approx(list(expected.values), nan_ok=True)
+    for name, _ in loader.ENCODED_COLUMNS:
+      assert list(tables[file_name].codes[name]) == list(expected.codes[name])
+
+
+@pytest.mark.parametrize('by', [('ref_date', 'characteristic'), ('geo',), ('noc', 'ref_date'), ()])
+@pytest.mark.parametrize('where', [None, 'noc = 2', 'geo = 1 and status <= C',
+                                   'characteristic in (1, 3) and ref_date >= 2023'])
+@pytest.mark.parametrize('statistic', ['sum', 'mean'])
+def test_partial_sums_match_one_pass(synthetic_file, shuffled_file, by, where, statistic):
+  where = None if where is None else filters.compile_filter(where)
+  aggregates = parallel.aggregate_files([synthetic_file, shuffled_file], by, 2, {'E': 0.5}, statistic, where,
+                                        workers=3, min_range_bytes=RANGE_BYTES)
+  for file_name in (synthetic_file, shuffled_file):
+    expected = quality.aggregate(cube.build_cube(loader.parse_file(file_name)), by, 2, {'E': 0.5}, statistic, where)
+    merged = aggregates[file_name]
+    assert merged.labels == expected.labels
+    assert np.allclose(merged.values, expected.values, equal_nan=True)
+    for counts in ('reported', 'suppressed', 'excluded', 'worst_grade'):
+      assert (getattr(merged, counts) == getattr(expected, counts)).all()
+
+
+def test_only_noc_and_characteristic_totals_are_left_out(tmp_path):
+  rows = list(synthetic.generate_rows(quarter_count=3, geo_count=2, noc_count=2, characteristic_count=3,
+                                      suppressed=0, seed=4))
+  # A geography named like a total is still summed, as quality.aggregate() does
+  geo = rows[0][loader.GEO_COLUMN]
+  for row in rows:
+    if row[loader.GEO_COLUMN] == geo:
+      row[loader.GEO_COLUMN] = 'Canada, all regions'
+  path = str(tmp_path / 'regions.csv')
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+
+  # Filtered by menu number, the geographies are summed after the partial sums are merged
+  where = filters.compile_filter('geo in (1, 2)')
+  merged = parallel.aggregate_files([path], ('ref_date',), where=where, workers=2, min_range_bytes=RANGE_BYTES)[path]
+  expected = quality.aggregate(cube.build_cube(loader.parse_file(path)), ('ref_date',), where=where)
+  assert np.allclose(merged.values, expected.values, equal_nan=True)
+  assert (merged.reported == expected.reported).all()
+
+
+def test_cached_files_are_fetched_once(synthetic_file, monkeypatch):
+  loader.load_table(synthetic_file)
+  fetches = []
+  fetch = cache.fetch
+
+  def counted(source_path, stat):
+    fetches.append(source_path)
+    return fetch(source_path, stat)
+  monkeypatch.setattr(cache, 'fetch', counted)
+
+  for run in (parallel.load_tables, parallel.aggregate_files):
+    loader._loaded_tables = {}
+    fetches.clear()
+    run([synthetic_file], workers=2)
+    assert len(fetches) == 1 and loader.is_loaded(synthetic_file)
+
+
+def test_partial_sums_do_not_load_the_file(synthetic_file):
+  parallel.aggregate_files([synthetic_file], workers=2, min_range_bytes=RANGE_BYTES)
+  assert not loader.is_loaded(synthetic_file)
+
+
+def test_unknown_axis_is_rejected(synthetic_file):
+  with pytest.raises(ValueError):
+    parallel.aggregate_files([synthetic_file], ('province',), workers=2)
+
+
+def test_line_ranges_cover_the_file(data_file):
+  ranges = parallel.line_ranges(data_file, 5, min_range_bytes=RANGE_BYTES)
+  assert len(ranges) == 5
+  with open(data_file, 'rb') as source_file:
+    data = source_file.read()
+  assert ranges[0][0] == 0 and ranges[-1][1] == len(data)
+  for (_, end), (start, _) in zip(ranges[:-1], ranges[1:], strict=True):
+    assert end == start and data[start - 1:start] == b'\n'
+  # A small file is not worth cutting
+  assert parallel.line_ranges(data_file, 5) == [(0, len(data))]
+
+
+def test_worker_count(monkeypatch):
+  monkeypatch.setenv(parallel.WORKERS_VARIABLE, '3')
+  assert parallel.worker_count() == 3
+  assert parallel.worker_count(0) == 1
+  assert parallel.worker_count(2) == 2
+  monkeypatch.setenv(parallel.WORKERS_VARIABLE, 'many')
+  with pytest.raises(ValueError):
+    parallel.worker_count()
+
+
+def test_command_line(data_file, tmp_path, capsys):
+  assert parallel.main(['parallel.py', data_file, '--workers', '2']) == 0
+  assert "Loaded 1 file(s) with 2 worker(s)" in capsys.readouterr().out
+  assert parallel.main(['parallel.py', str(tmp_path / 'absent.csv')]) == 2
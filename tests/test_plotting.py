@@ -0,0 +1,96 @@
+'''
+test_plotting.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of the render mode of plotting.py: an image is written in the format its
+    extension names, and a --format that names another one is rejected.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the plotting files
+import csv
+
+# 'os' checks the images written
+import os
+
+# 'datetime' gives the dates of the charts
+from datetime import datetime
+
+# 'pytest' runs the tests
+import pytest
+
+# 'plotting' is the module tested
+import plotting
+
+# 'loader' gives the header of the plotting files
+from vacancies import loader
+
+PNG_SIGNATURE = b'\x89PNG'
+
+
+@pytest.fixture
+def plotting_files(tmp_path):
+  '''
+    Two plotting files, as the question scripts write them.
+  '''
+  paths = []
+  for number in (1, 2):
+    path = str(tmp_path / f"rows{number}.csv")
+    with open(path, 'w', encoding='utf-8', newline='') as data_file:
+      csv_writer = csv.writer(data_file)
+      csv_writer.writerow(loader.OUTPUT_HEADER)
+      csv_writer.writerow(['2023-01', 'Canada', 'Total', 'Social media', 'Job vacancies', 100 * number])
+      csv_writer.writerow(['2023-04', 'Canada', 'Total', 'Social media', 'Job vacancies', ''])
+    paths.append(path)
+  return paths
+
+
+def head(path):
+  with open(path, 'rb') as image:
+    return image.read(256)
+
+
+def test_image_format():
+  assert plotting.image_format('grid.svg') == 'svg'
+  assert plotting.image_format('grid.SVG', 'svg') == 'svg'
+  assert plotting.image_format('grid', 'svg') == 'svg'
+  assert plotting.image_format('grid') == 'png'
+  with pytest.raises(ValueError):
+    plotting.image_format('grid.svg', 'png')
+
+
+def test_grid_takes_the_format_of_its_extension(plotting_files, tmp_path):
+  path = str(tmp_path / 'grid.svg')
+  assert plotting.render_main(plotting_files + ['--out', path, '--grid', '2']) == 0
+  assert b'<svg' in head(path)
+
+
+def test_grid_rejects_another_format(plotting_files, tmp_path):
+  path = str(tmp_path / 'grid.svg')
+  assert plotting.render_main(plotting_files + ['--out', path, '--grid', '2', '--format', 'png']) == 4
+  assert not os.path.exists(path)
+
+
+def test_one_image_per_file(plotting_files, tmp_path):
+  out_dir = str(tmp_path / 'charts')
+  assert plotting.render_main(plotting_files + ['--out', out_dir]) == 0
+  assert sorted(os.listdir(out_dir)) == ['Figure_1.png', 'Figure_2.png']
+  assert head(os.path.join(out_dir, 'Figure_1.png')).startswith(PNG_SIGNATURE)
+
+
+def test_read_chart(plotting_files):
+  title, dates, values = plotting.read_chart(plotting_files[1])
+  assert title == "Total\nSocial media"
+  assert dates == [datetime(2023, 1, 1), datetime(2023, 4, 1)]
+  assert values == [200.0, None]
+
+
+def test_missing_file(tmp_path):
+  assert plotting.render_main([str(tmp_path / 'absent.csv'), '--out', str(tmp_path)]) == 2
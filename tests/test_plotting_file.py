@@ -0,0 +1,121 @@
+'''
+test_plotting_file.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of the files the question scripts write for plotting.py: every query gets a
+    file of its own in VACANCIES_PLOT_DIR, queries running at the same time never mix
+    their rows, and a query that fails, or whose sinks cannot all be opened, leaves
+    no file behind.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'os' lists the files written
+import os
+
+# 'sys' hides pyarrow from the Parquet sink
+import sys
+
+# 'threading' runs queries at the same time
+import threading
+
+# 'pytest' runs the tests
+import pytest
+
+# 'plotting' reads the plotting files
+import plotting
+
+# 'output' writes the plotting files
+from vacancies import output
+
+# 'registry' is the module tested
+from vacancies import registry
+
+
+def run_query(question, data_file, *arguments):
+  '''
+    Runs the script of 'question' on 'data_file' with the command line 'arguments'.
+  '''
+  question.run_script(['question.py', data_file, *arguments])
+
+
+def plotting_files(folder):
+  return sorted(name for name in os.listdir(folder) if name.startswith('dataForPlotting-'))
+
+
+def temporary_files(folder):
+  return [name for name in os.listdir(folder) if name.endswith('.tmp')]
+
+
+def test_every_query_has_a_file_of_its_own(data_file, tmp_path):
+  question = registry.get_question(1)
+  assert question.plotting_file() != question.plotting_file()
+  assert os.path.dirname(question.plotting_file()) == str(tmp_path)
+
+  for characteristic in (1, 6):
+    run_query(question, data_file, registry.WHERE_OPTION, f"noc = 1 and characteristic = {characteristic}")
+  names = plotting_files(tmp_path)
+  assert len(names) == 2 and all(name.startswith('dataForPlotting-q1-') for name in names)
+
+  titles = {plotting.read_chart(str(tmp_path / name))[0] for name in names}
+  choices = question.choices('characteristic', data_file)
+  assert titles == {f"{question.choices('noc', data_file)[1]}\n{choices[number]}" for number in (1, 6)}
+  assert 'dataForPlotting.csv' not in os.listdir(tmp_path)
+
+
+def test_queries_on_the_same_file_do_not_mix(data_file, tmp_path, monkeypatch):
+  monkeypatch.setenv(output.OUTPUT_VARIABLE, 'quiet')
+  question = registry.get_question(1)
+  plotting_file = str(tmp_path / 'shared.csv')
+  filters = [f"noc = 1 and characteristic = {number}" for number in (1, 6)]
+  expected = {}
+  for where in filters:
+    run_query(question, data_file, plotting_file, registry.WHERE_OPTION, where)
+    with open(plotting_file, 'rb') as rows_file:
+      expected[where] = rows_file.read()
+
+  threads = [threading.Thread(target=run_query, args=(question, data_file, plotting_file, registry.WHERE_OPTION, where))
+             for _ in range(4) for where in filters]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  with open(plotting_file, 'rb') as rows_file:
+    assert rows_file.read() in expected.values()
+  assert temporary_files(tmp_path) == []
+
+
+def test_failed_query_leaves_no_file(data_file, tmp_path, monkeypatch):
+  write_rows = output.CsvSink.write_rows
+
+  # The rows reach the temporary file, then the disk fills up
+  def fail(sink, rows):
+    write_rows(sink, rows)
+    raise OSError("disk full")
+  monkeypatch.setattr(output.CsvSink, 'write_rows', fail)
+  with pytest.raises(SystemExit) as exit_info:
+    run_query(registry.get_question(1), data_file, registry.WHERE_OPTION, "noc = 1")
+  assert exit_info.value.code == 3
+  assert plotting_files(tmp_path) == []
+  assert temporary_files(tmp_path) == []
+
+
+def test_sinks_that_cannot_be_opened_leave_no_file(data_file, tmp_path, monkeypatch):
+  # The plotting sink cannot be opened without pyarrow, after the file sink of VACANCIES_OUTPUT would be
+  monkeypatch.setenv(output.OUTPUT_VARIABLE, f"csv:{tmp_path / 'rows.csv'}")
+  monkeypatch.setitem(sys.modules, 'pyarrow', None)
+  with pytest.raises(SystemExit):
+    run_query(registry.get_question(1), data_file, str(tmp_path / 'rows.parquet'), registry.WHERE_OPTION, "noc = 1")
+  assert temporary_files(tmp_path) == []
+
+  # VACANCIES_OUTPUT cannot be opened, after the plotting sink is
+  monkeypatch.setenv(output.OUTPUT_VARIABLE, f"csv:{tmp_path / 'rows.csv'},nothing")
+  with pytest.raises(SystemExit):
+    run_query(registry.get_question(1), data_file, registry.WHERE_OPTION, "noc = 1")
+  assert temporary_files(tmp_path) == [] and plotting_files(tmp_path) == []
@@ -0,0 +1,99 @@
+'''
+test_profiling.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of profiling.py: stages cost nothing while profiling is off, and once it is
+    switched on, from the command line of main.py or the environment, every stage
+    and its rows end up in the trace written at the end.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'json' reads the traces
+import json
+
+# 'os' checks the files written
+import os
+
+# 'pytest' runs the tests
+import pytest
+
+# 'main' switches profiling on from its command line
+import main
+
+# 'profiling' is the module tested
+from vacancies import profiling
+
+
+@pytest.fixture(autouse=True)
+def no_recorder(monkeypatch):
+  '''
+    Starts every test with profiling off, and switches it off again afterwards.
+  '''
+  monkeypatch.setattr(profiling, '_recorder', None)
+  monkeypatch.delenv(profiling.PROFILE_VARIABLE, raising=False)
+  monkeypatch.delenv(profiling.CPROFILE_VARIABLE, raising=False)
+
+
+def read_trace(path):
+  with open(path, encoding='utf-8') as trace_file:
+    return json.load(trace_file)
+
+
+def test_off_by_default():
+  assert not profiling.configure()
+  assert not profiling.enabled()
+  with profiling.stage('parse') as timer:
+    timer.count(10)
+  assert profiling.stage('parse') is profiling.stage('write')
+
+
+def test_stages_are_written(tmp_path):
+  trace_file = str(tmp_path / 'trace.json')
+  assert profiling.configure(trace_file)
+  for rows in (3, 4):
+    with profiling.stage('parse', file='data.csv') as timer:
+      timer.count(rows)
+  with profiling.stage('plot'):
+    pass
+  profiling.finish()
+  assert not profiling.enabled()
+
+  trace = read_trace(trace_file)
+  events = trace['traceEvents']
+  assert [event['name'] for event in events] == ['run', 'parse', 'parse', 'plot']
+  assert events[1]['args'] == {'file': 'data.csv', 'rows': 3} and events[1]['ph'] == 'X'
+  assert trace['otherData']['rows'] == {'parse': 7}
+  assert set(trace['otherData']['stage_seconds']) == {'parse', 'plot'}
+  assert not os.path.exists(trace_file + profiling.PROFILE_SUFFIX)
+
+
+def test_cprofile_from_the_environment(tmp_path, monkeypatch):
+  trace_file = str(tmp_path / 'trace.json')
+  monkeypatch.setenv(profiling.PROFILE_VARIABLE, trace_file)
+  monkeypatch.setenv(profiling.CPROFILE_VARIABLE, '1')
+  assert profiling.configure()
+  profiling.finish()
+  assert os.path.exists(trace_file + profiling.PROFILE_SUFFIX)
+  assert 'cumulative' in read_trace(trace_file)['otherData']['cprofile']
+
+
+def test_profile_option_of_main(tmp_path):
+  trace_file = str(tmp_path / 'trace.json')
+  selection_file = tmp_path / 'selections.json'
+  selection_file.write_text(json.dumps([{'question': 1, 'noc': 1, 'characteristic': 6}]), encoding='utf-8')
+  with pytest.raises(SystemExit) as exit_info:
+    main.main(['main.py', '--profile', trace_file, '--batch', str(selection_file), str(tmp_path / 'results.jsonl')])
+  assert exit_info.value.code == 0
+  profiling.finish()
+
+  trace = read_trace(trace_file)
+  stages = {event['name'] for event in trace['traceEvents']}
+  assert {'run', 'parse', 'select'} <= stages
+  assert trace['otherData']['rows']['parse'] > 0
@@ -0,0 +1,160 @@
+'''
+test_proportions.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of proportions.py: every share is its value divided by its total, missing
+    when either is missing or the total is zero, and shares updated after a release
+    are the shares of the updated file. A share takes the worse STATUS grade of its
+    value and its total, and has no grade when either of them has none, so it is
+    left out once a grade is asked for.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the test file
+import csv
+
+# 'math' checks the shares
+import math
+
+# 'numpy' compares the shares
+import numpy as np
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cube' builds the cube of the expected file
+from vacancies import cube
+
+# 'incremental' applies a release to a loaded file
+from vacancies import incremental
+
+# 'loader' knows the layout of a StatCan row
+from vacancies import loader
+
+# 'proportions' is the module tested
+from vacancies import proportions
+
+# 'synthetic' writes the rows of the test file
+from vacancies import synthetic
+
+#
+#  (total VALUE, part VALUE) of each quarter, and the share of the part
+#
+VALUES = [('200', '50', 0.25), ('400', '', None), ('', '30', None), ('0', '0', None), ('80', '100', 1.25)]
+
+#
+#  (total STATUS, part STATUS) of each quarter, and the grade of its share
+#
+QUARTERS = [('A', 'C', 'C'), ('D', 'B', 'D'), ('A', '', ''), ('', 'B', ''), ('', '', '')]
+
+
+def write(path, rows):
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+
+
+@pytest.fixture
+def valued_file(tmp_path):
+  '''
+    One NOC with a total and one part, their VALUE as in VALUES.
+  '''
+  rows = list(synthetic.generate_rows(quarter_count=len(VALUES), geo_count=1, noc_count=1,
+                                      characteristic_count=2, suppressed=0, seed=1))
+  for position, (total_value, part_value, _) in enumerate(VALUES):
+    rows[position][loader.VALUE_COLUMN] = total_value
+    rows[len(VALUES) + position][loader.VALUE_COLUMN] = part_value
+  path = str(tmp_path / 'valued.csv')
+  write(path, rows)
+  return path, rows[0][loader.NOC_COLUMN], rows[0][loader.CHARACTERISTIC_COLUMN], \
+      rows[len(VALUES)][loader.CHARACTERISTIC_COLUMN]
+
+
+@pytest.fixture
+def graded_file(tmp_path):
+  '''
+    One NOC with a total and one part, their STATUS as in QUARTERS.
+  '''
+  rows = list(synthetic.generate_rows(quarter_count=len(QUARTERS), geo_count=1, noc_count=1,
+                                      characteristic_count=2, suppressed=0, seed=1))
+  for position, (total_status, part_status, _) in enumerate(QUARTERS):
+    rows[position][loader.STATUS_COLUMN] = total_status
+    rows[len(QUARTERS) + position][loader.STATUS_COLUMN] = part_status
+  path = str(tmp_path / 'graded.csv')
+  write(path, rows)
+  return path, rows[0][loader.NOC_COLUMN], rows[len(QUARTERS)][loader.CHARACTERISTIC_COLUMN]
+
+
+def test_share_grades(graded_file):
+  file_name, noc, characteristic = graded_file
+  shares = proportions.load_proportions(file_name)
+  assert shares.status_for(noc, characteristic) == [grade for _, _, grade in QUARTERS]
+
+  # Only the shares graded C or better are kept; those without a grade are left out
+  kept = shares.shares_for(noc, characteristic, min_grade=2)
+  assert [share is not None for share in kept] == [True, False, False, False, False]
+  assert all(share is not None for share in shares.shares_for(noc, characteristic))
+
+
+def test_shares(valued_file):
+  file_name, noc, total, characteristic = valued_file
+  shares = proportions.load_proportions(file_name)
+  assert shares.total_label == total
+  assert shares.shares_for(noc, characteristic) == [share for _, _, share in VALUES]
+  assert shares.shares_for(noc, total) == [1.0, 1.0, None, None, 1.0]
+
+  # A change needs the shares of both quarters
+  changes = [row[7] for row in proportions.share_rows(shares) if row[3] == characteristic]
+  assert changes == [None, None, None, None, None]
+
+
+def test_changes(synthetic_file):
+  shares = proportions.load_proportions(synthetic_file)
+  data_cube = shares.cube
+  with np.errstate(divide='ignore', invalid='ignore'):
+    expected = data_cube.values / data_cube.values[:, :, shares.total:shares.total + 1, :]
+  assert np.allclose(shares.shares, expected, equal_nan=True)
+  assert np.isnan(shares.changes[..., 0]).all()
+  assert np.allclose(shares.changes[..., 1:], np.diff(expected, axis=-1), equal_nan=True)
+  for row in proportions.share_rows(shares):
+    if row[4] is None or row[5] is None:
+      assert row[6] is None
+    else:
+      assert math.isclose(row[6], row[4] / row[5], abs_tol=1e-6)
+
+
+def test_unknown_total(synthetic_file):
+  with pytest.raises(ValueError):
+    proportions.load_proportions(synthetic_file, total_label='No such characteristic')
+
+
+def test_updated_shares_equal_computed_shares(tmp_path):
+  rows = list(synthetic.generate_rows(quarter_count=5, geo_count=2, noc_count=2, characteristic_count=3,
+                                      suppressed=0.1, seed=5))
+  dates = sorted({row[loader.REF_DATE_COLUMN] for row in rows})
+  base = [row for row in rows if row[loader.REF_DATE_COLUMN] != dates[-1]]
+  release = [row for row in rows if row[loader.REF_DATE_COLUMN] == dates[-1]]
+  revision = list(base[1])
+  revision[loader.VALUE_COLUMN] = '12345'
+
+  paths = [str(tmp_path / name) for name in ('data.csv', 'release.csv', 'expected.csv')]
+  write(paths[0], base)
+  write(paths[1], release + [revision])
+  write(paths[2], base[:1] + [revision] + base[2:] + release)
+
+  old = proportions.load_proportions(paths[0])
+  incremental.apply_release(paths[0], paths[1])
+  updated = proportions.load_proportions(paths[0])
+  assert updated is not old and updated.cube is cube.built_cube(loader.load_table(paths[0]))
+  expected = proportions.compute_proportions(cube.build_cube(loader.parse_file(paths[2])))
+  assert np.allclose(updated.shares, expected.shares, equal_nan=True)
+  assert np.allclose(updated.changes, expected.changes, equal_nan=True)
+  assert np.array_equal(updated.grades, expected.grades)
@@ -0,0 +1,111 @@
+'''
+test_registry.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of registry.py: the menus of a question are the labels of its data file,
+    in file order, and the shared script asks for a selection (or takes a --where
+    filter), prints the matching rows and writes them for plotting.py.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' reads the plotting files
+import csv
+
+# 'pytest' runs the tests
+import pytest
+
+# 'loader' parses the data files
+from vacancies import loader
+
+# 'registry' is the module tested
+from vacancies import registry
+
+
+def answer(monkeypatch, *answers):
+  '''
+    Answers the prompts of the question scripts with 'answers', in order.
+  '''
+  answers = iter(answers)
+  monkeypatch.setattr('builtins.input', lambda _prompt='': next(answers))
+
+
+def read_rows(path):
+  with open(path, encoding='utf-8', newline='') as rows_file:
+    return list(csv.reader(rows_file))
+
+
+def test_choices_are_the_labels_of_the_file(copy_data_file):
+  for number, question in registry.QUESTIONS.items():
+    file_name = str(copy_data_file(number))
+    table = loader.parse_file(file_name)
+    for axis in ('noc', 'characteristic'):
+      expected = dict(enumerate(table.dictionaries[axis], start=1))
+      # From the row index, then from the loaded table
+      assert question.choices(axis, file_name) == expected
+      loader.load_table(file_name)
+      assert question.choices(axis, file_name) == expected
+      loader._loaded_tables = {}
+    assert ', all ' in question.total(file_name)
+
+
+def test_unknown_question():
+  assert registry.get_question(1) is registry.QUESTIONS[1]
+  with pytest.raises(ValueError):
+    registry.get_question(max(registry.QUESTIONS) + 1)
+
+
+def test_registered_question(synthetic_file):
+  question = registry.Question(99, "A question of synthetic data", synthetic_file, 'recruitment strategy',
+                               total_label='Social media')
+  try:
+    assert registry.register(question) is registry.get_question(99)
+    assert question.total() == 'Social media'
+  finally:
+    del registry.QUESTIONS[99]
+
+
+def test_script_writes_the_selected_rows(data_file, tmp_path, monkeypatch, capsys):
+  question = registry.get_question(1)
+  noc = question.choices('noc', data_file)[1]
+  characteristic = question.choices('characteristic', data_file)[6]
+  expected = question.find_rows(data_file, noc, characteristic)
+  plotting_file = str(tmp_path / 'rows.csv')
+
+  # A wrong answer is asked again
+  answer(monkeypatch, '6', 'x', '0', '1')
+  question.run_script(['question1.py', data_file, plotting_file])
+  printed = capsys.readouterr().out
+  assert "Please enter a valid integer." in printed and "Please enter an integer between" in printed
+  assert ', '.join('..' if value is None else str(value) for value in expected[0]) in printed
+
+  rows = read_rows(plotting_file)
+  assert rows[0] == loader.OUTPUT_HEADER
+  assert rows[1:] == [['' if value is None else str(value) for value in row] for row in expected]
+
+
+def test_script_takes_a_filter(data_file, tmp_path, monkeypatch):
+  monkeypatch.setattr('builtins.input', lambda _prompt='': pytest.fail("asked for a selection"))
+  question = registry.get_question(1)
+  plotting_file = str(tmp_path / 'rows.csv')
+  question.run_script(['question1.py', data_file, plotting_file, registry.WHERE_OPTION, 'noc = 1 and characteristic = 6'])
+  rows = read_rows(plotting_file)[1:]
+  selection = (question.choices('noc', data_file)[1], question.choices('characteristic', data_file)[6])
+  assert rows and {(row[2], row[3]) for row in rows} == {selection}
+
+
+@pytest.mark.parametrize('argv, code', [
+    (['question1.py'], 1),
+    (['question1.py', 'absent.csv'], 2),
+    (['question1.py', '{data_file}', registry.WHERE_OPTION, 'noc ='], 1),
+])
+def test_script_errors(argv, code, data_file):
+  with pytest.raises(SystemExit) as exit_info:
+    registry.get_question(1).run_script([argument.format(data_file=data_file) for argument in argv])
+  assert exit_info.value.code == code
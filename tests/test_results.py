@@ -0,0 +1,156 @@
+'''
+test_results.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of vacancies/results.py: answers and charts are kept until their data file
+    changes, the caches stay under their cap, the server takes its charts from the
+    result cache, and the interactive path shows a live chart whose image it keeps
+    there.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'asyncio' runs the server's chart requests
+import asyncio
+
+# 'os' changes the timestamps of the data file
+import os
+
+# 'matplotlib.pyplot' shows the interactive chart
+import matplotlib.pyplot as plt
+
+# 'main' is the interactive path tested
+import main
+
+# 'plotting' renders the charts
+import plotting
+
+# 'server' is the server tested
+import server
+
+# 'results' is the module tested
+from vacancies import results
+
+
+def counting(calls, value):
+  '''
+    Returns a function that records the format it is called with and returns 'value'.
+  '''
+  def render(file_format):
+    calls.append(file_format)
+    return value
+  return render
+
+
+def test_figure_is_rendered_once_per_file_version(data_file):
+  calls = []
+  first = results.query_figure(data_file, 1, '1', 'Social media', counting(calls, b'one'))
+  again = results.query_figure(data_file, 1, '1', 'Social media', counting(calls, b'two'))
+  assert first == again == b'one'
+  assert calls == ['png']
+
+  results.query_figure(data_file, 1, '1', 'Social media', counting(calls, b'svg'), 'svg')
+  assert calls == ['png', 'svg']
+
+  # A changed data file has another content hash, so the chart is drawn again
+  with open(data_file, 'a', encoding='utf-8') as data:
+    data.write('\n')
+  stat = os.stat(data_file)
+  os.utime(data_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+  assert results.query_figure(data_file, 1, '1', 'Social media', counting(calls, b'three')) == b'three'
+
+
+def test_series_is_computed_once(data_file):
+  calls = []
+  def compute():
+    calls.append(1)
+    return [[1.0, None]]
+  assert results.query_series(data_file, 1, '1', 'Social media', 'rows', compute) == [[1.0, None]]
+  assert results.query_series(data_file, 1, '1', 'Social media', 'rows', compute) == [[1.0, None]]
+  assert calls == [1]
+
+
+def test_no_cache_renders_every_time(data_file, monkeypatch):
+  monkeypatch.setenv(results.MAX_BYTES_VARIABLE, '0')
+  calls = []
+  results.query_figure(data_file, 1, '1', 'Social media', counting(calls, b'one'))
+  results.query_figure(data_file, 1, '1', 'Social media', counting(calls, b'one'))
+  assert calls == ['png', 'png']
+
+
+def test_result_cache_evicts_least_recently_used(tmp_path):
+  result_cache = results.ResultCache(str(tmp_path / 'results'), max_bytes=10)
+  result_cache.put('a', b'aaaa')
+  result_cache.put('b', b'bbbb')
+  # Make 'a' the most recently used answer
+  os.utime(result_cache._path('b'), ns=(0, 0))
+  assert result_cache.get('a') == b'aaaa'
+  result_cache.put('c', b'cccc')
+  assert result_cache.get('b') is None
+  assert result_cache.get('a') == b'aaaa' and result_cache.get('c') == b'cccc'
+
+  result_cache.put('big', b'x' * 11)
+  assert result_cache.get('big') is None
+
+
+def test_memory_cache_evicts_least_recently_used():
+  memory_cache = results.MemoryCache(max_bytes=10)
+  memory_cache.put('a', b'aaaa')
+  memory_cache.put('b', b'bbbb')
+  assert memory_cache.get('a') == b'aaaa'
+  memory_cache.put('c', b'cccc')
+  assert memory_cache.get('b') is None
+  assert memory_cache.get('a') == b'aaaa' and memory_cache.get('c') == b'cccc'
+
+
+def test_server_chart_comes_from_the_result_cache(monkeypatch):
+  calls = []
+  query_figure = results.query_figure
+
+  def spy(file_name, question, noc, characteristic, render, file_format='png', result_cache=None):
+    def counted(chart_format):
+      calls.append(chart_format)
+      return render(chart_format)
+    return query_figure(file_name, question, noc, characteristic, counted, file_format, result_cache)
+
+  monkeypatch.setattr(results, 'query_figure', spy)
+  service = server.QueryService(render_workers=1)
+  try:
+    service.load()
+    selection = {'question': '1', 'noc': '1', 'characteristic': '6'}
+    first = asyncio.run(service.chart(dict(selection), 'svg'))
+    again = asyncio.run(service.chart(dict(selection), 'svg'))
+  finally:
+    service.close()
+  assert b'<svg' in first and again == first
+  assert calls == ['svg']
+
+
+def test_interactive_chart_is_live_and_its_image_is_kept(monkeypatch):
+  answers = iter(['6', '1', '6', '1'])
+  monkeypatch.setattr('builtins.input', lambda _prompt='': next(answers))
+  shown = []
+  monkeypatch.setattr(plt, 'show', lambda: shown.append(plt.gcf()))
+  saved = []
+  figure_bytes = plotting.figure_bytes
+
+  def counted(figure, file_format='png'):
+    saved.append(file_format)
+    return figure_bytes(figure, file_format)
+
+  monkeypatch.setattr(plotting, 'figure_bytes', counted)
+  try:
+    main.run_question(1)
+    main.run_question(1)
+    # Each time a figure of its own with the selected series, the image kept only once
+    assert len(shown) == 2 and shown[0] is not shown[1]
+    assert all(figure.axes[0].lines[0].get_xydata().size for figure in shown)
+    assert saved == ['png']
+  finally:
+    plt.close('all')
@@ -0,0 +1,136 @@
+'''
+test_server.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of server.py, over a real connection: the routes answer from memory, and a
+    request that cannot be read or that fails gets an answer instead of a dropped
+    connection, and a chart is rendered by workers started before the first one.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'asyncio' runs the server and the client
+import asyncio
+
+# 'json' reads the answers
+import json
+
+# 'os' checks that no answer was written to disk
+import os
+
+# 'pytest' runs the tests
+import pytest
+
+# 'server' is the module tested
+import server
+
+# 'cache' gives the cache folder
+from vacancies import cache
+
+# 'results' gives the folder of the on-disk answers
+from vacancies import results
+
+
+@pytest.fixture
+def service():
+  service = server.QueryService(render_workers=1)
+  service.load()
+  yield service
+  service.close()
+
+
+def exchange(service, *requests):
+  '''
+    Sends raw requests to a server on one connection and returns the raw answer.
+  '''
+  async def run():
+    listening = await asyncio.start_server(lambda reader, writer: server.handle_connection(service, reader, writer),
+                                           '127.0.0.1', 0)
+    port = listening.sockets[0].getsockname()[1]
+    async with listening:
+      reader, writer = await asyncio.open_connection('127.0.0.1', port)
+      writer.write(b''.join(requests))
+      await writer.drain()
+      answer = await asyncio.wait_for(reader.read(), timeout=30)
+      writer.close()
+      return answer
+  return asyncio.run(run())
+
+
+def parse(answer):
+  '''
+    Cuts a raw answer of one response into (status, body as JSON).
+  '''
+  head, _, body = answer.partition(b'\r\n\r\n')
+  return int(head.split()[1]), json.loads(body)
+
+
+def get(target, connection='close'):
+  return f"GET {target} HTTP/1.1\r\nHost: test\r\nConnection: {connection}\r\n\r\n".encode('latin-1')
+
+
+def test_series_is_answered_from_memory(service):
+  status, body = parse(exchange(service, get('/series?question=1&noc=1&characteristic=6')))
+  assert status == 200
+  assert body['characteristic'] == 'Social media'
+  assert len(body['rows']) == len(body['proportions']) == len(body['status']) > 0
+  assert parse(exchange(service, get('/series?question=1&noc=1&characteristic=6')))[1] == body
+  assert not os.path.exists(os.path.join(cache.cache_dir(), results.RESULTS_FOLDER))
+
+
+def test_keep_alive_serves_several_requests(service):
+  answer = exchange(service, get('/questions', 'keep-alive'), get('/select?question=2&where=noc%20%3D%201'))
+  assert answer.count(b'HTTP/1.1 200 OK') == 2
+
+
+def test_batch_reports_bad_selections(service):
+  body = json.dumps([{'question': 1, 'noc': 1, 'characteristic': 6}, {'question': 9, 'noc': 1, 'characteristic': 1}])
+  request = (f"POST /batch HTTP/1.1\r\nContent-Length: {len(body)}\r\nConnection: close\r\n\r\n{body}").encode('latin-1')
+  status, answers = parse(exchange(service, request))
+  assert status == 200
+  assert 'rows' in answers[0] and 'error' in answers[1]
+
+
+def test_invalid_content_length_is_a_bad_request(service):
+  answer = exchange(service, b"POST /batch HTTP/1.1\r\nContent-Length: lots\r\n\r\n[]")
+  assert parse(answer)[0] == 400
+  assert b'Connection: close' in answer
+
+
+def test_invalid_request_line_is_a_bad_request(service):
+  assert parse(exchange(service, b"NONSENSE\r\n\r\n"))[0] == 400
+
+
+def test_unexpected_error_is_an_internal_error(service, monkeypatch):
+  def fail():
+    raise RuntimeError("broken")
+  monkeypatch.setattr(service, 'describe_questions', fail)
+  status, body = parse(exchange(service, get('/questions', 'keep-alive')))
+  assert status == 500
+  assert body == {'error': 'Internal Server Error'}
+
+
+def test_select(service):
+  status, body = parse(exchange(service, get('/select?question=2&where=noc%20%3D%201')))
+  assert status == 200
+  assert body['rows'] and len({row[2] for row in body['rows']}) == 1
+  assert parse(exchange(service, get('/select?question=2&where=noc%20%3D')))[0] == 400
+
+
+def test_unknown_paths_and_methods(service):
+  assert parse(exchange(service, get('/nothing')))[0] == 404
+  assert parse(exchange(service, b"DELETE /series HTTP/1.1\r\nConnection: close\r\n\r\n"))[0] == 405
+
+
+def test_chart_is_answered_over_the_connection(service):
+  # The render workers are forked before the first connection, so they hold none of its sockets
+  answer = exchange(service, get('/chart?question=1&noc=1&characteristic=6&format=svg'))
+  head, _, body = answer.partition(b'\r\n\r\n')
+  assert int(head.split()[1]) == 200
+  assert b'image/svg+xml' in head and b'<svg' in body
@@ -0,0 +1,123 @@
+'''
+test_streaming.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of streaming.py: a streamed store holds the same table as parse_file(),
+    whatever the chunk size, keeps only the GEOs and Statistics asked for, and
+    skips the byte order mark, the blank lines and the footnotes.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the test files
+import csv
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' names the cache file of a data file
+from vacancies import cache
+
+# 'loader' parses the data files and opens the stores
+from vacancies import loader
+
+# 'streaming' is the module tested
+from vacancies import streaming
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+HEADER = ["REF_DATE", "GEO", "DGUID", "National Occupational Classification", "Job vacancy characteristics",
+          "Statistics", "UOM", "UOM_ID", "SCALAR_FACTOR", "SCALAR_ID", "VECTOR", "COORDINATE", "VALUE", "STATUS",
+          "SYMBOL", "TERMINATED", "DECIMALS"]
+GEOS = ["Canada", "Ontario", "Quebec"]
+STATISTICS = ["Job vacancies", "Proportion of job vacancies"]
+FOOTNOTES = [[], ["Footnotes:"], ["1", "Job vacancies are counted on the last day of the quarter."],
+             ["How to cite:", "Statistics Canada. Table 14-10-0328-01"]]
+
+
+def statcan_rows():
+  '''
+    The data rows of a small file, one per GEO, Statistics and quarter.
+  '''
+  return [[date, geo, "2016A000011124", "Total, all occupations", "Social media", statistic, "Number", "223", "units",
+           "0", "v1", "1.1.1.1", str(number), "", "", "", "0"]
+          for number, (geo, statistic, date) in enumerate(
+              (geo, statistic, date) for geo in GEOS for statistic in STATISTICS for date in ('2023-01', '2023-04'))]
+
+
+def write(path, rows, encoding='utf-8-sig', footnotes=FOOTNOTES):
+  with open(path, 'w', encoding=encoding, newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(HEADER)
+    csv_writer.writerows(rows)
+    csv_writer.writerows(footnotes)
+
+
+def assert_same_table(table, expected):
+  assert table.dictionaries == expected.dictionaries
+  for name, _ in loader.ENCODED_COLUMNS:
+    assert list(table.codes[name]) == list(expected.codes[name])
+  # Compared as bytes, so the NaNs of missing values compare equal
+  assert memoryview(table.values).tobytes() == memoryview(expected.values).tobytes()
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 7, streaming.CHUNK_ROWS])
+def test_store_is_the_parsed_file(data_file, tmp_path, chunk_rows):
+  store_path = streaming.ingest(data_file, str(tmp_path / 'store.bin'), chunk_rows=chunk_rows)
+  assert_same_table(loader.open_store(store_path), loader.parse_file(data_file))
+
+
+def test_store_of_the_whole_file_is_its_cache(data_file):
+  assert streaming.ingest(data_file) == cache.cache_path(data_file)
+  assert cache.read_store(cache.cache_path(data_file))[0]['filter'] is None
+
+
+@pytest.mark.parametrize('geos, statistics', [
+    ({"Ontario"}, None),
+    (None, {"Proportion of job vacancies"}),
+    ({"Canada", "Quebec"}, {"Job vacancies"}),
+    ({"Yukon"}, None),
+])
+def test_filters(tmp_path, geos, statistics):
+  source_path = str(tmp_path / 'source.csv')
+  rows = statcan_rows()
+  write(source_path, rows)
+  store_path = streaming.ingest(source_path, str(tmp_path / 'store.bin'), geos=geos, statistics=statistics, chunk_rows=5)
+
+  kept = [row for row in rows if (geos is None or row[loader.GEO_COLUMN] in geos) and
+          (statistics is None or row[loader.STATISTICS_COLUMN] in statistics)]
+  write(str(tmp_path / 'expected.csv'), kept)
+  assert_same_table(loader.open_store(store_path), loader.parse_file(str(tmp_path / 'expected.csv')))
+
+  # A filtered store never replaces the cache of the whole file
+  assert cache.read_store(store_path)[0]['filter'] is not None
+  with pytest.raises(ValueError):
+    streaming.ingest(source_path, geos=geos, statistics=statistics)
+
+
+@pytest.mark.parametrize('encoding', ['utf-8-sig', 'utf-8'])
+def test_byte_order_mark_and_footnotes_are_skipped(tmp_path, encoding):
+  source_path = str(tmp_path / 'source.csv')
+  rows = statcan_rows()
+  write(source_path, rows, encoding=encoding)
+  write(str(tmp_path / 'expected.csv'), rows, footnotes=[])
+
+  table = loader.open_store(streaming.ingest(source_path, str(tmp_path / 'store.bin'), chunk_rows=3))
+  assert len(table) == len(rows)
+  assert table.dictionaries['ref_date'] == ['2023-01', '2023-04']
+  assert_same_table(table, loader.parse_file(str(tmp_path / 'expected.csv')))
+
+
+def test_command_line(data_file, tmp_path):
+  store_path = str(tmp_path / 'store.bin')
+  assert streaming.main(['streaming.py', data_file, store_path, '--geo', 'Canada', '--chunk-rows', '50']) == 0
+  assert len(loader.open_store(store_path)) == len(loader.parse_file(data_file))
+  assert streaming.main(['streaming.py', str(tmp_path / 'absent.csv'), store_path]) == 2
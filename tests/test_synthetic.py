@@ -0,0 +1,78 @@
+'''
+test_synthetic.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of synthetic.py: a file has one row per quarter, geography, occupation and
+    characteristic, reads back like a StatCan file, and is the same for the same seed.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'numpy' checks the values
+import numpy as np
+
+# 'cube' builds the cube of the files written
+from vacancies import cube
+
+# 'loader' parses the files written
+from vacancies import loader
+
+# 'proportions' finds the total characteristic
+from vacancies import proportions
+
+# 'synthetic' is the module tested
+from vacancies import synthetic
+
+
+def read(path):
+  with open(path, 'rb') as data_file:
+    return data_file.read()
+
+
+def test_quarters():
+  assert synthetic.quarters('2023-07', 3) == ['2023-07', '2023-10', '2024-01']
+
+
+def test_file_shape(tmp_path):
+  path = str(tmp_path / 'synthetic.csv')
+  # More geographies and characteristics than the known labels, so numbered ones are made up
+  count = synthetic.write_file(path, quarter_count=4, geo_count=len(synthetic.GEOS) + 2, noc_count=3,
+                               characteristic_count=len(synthetic.CHARACTERISTICS) + 1, suppressed=0.2, seed=3)
+  shape = (len(synthetic.GEOS) + 2, 3, len(synthetic.CHARACTERISTICS) + 1, 4)
+  assert count == np.prod(shape)
+
+  table = loader.parse_file(path)
+  assert len(table) == count
+  assert table.dictionaries['statistics'] == [cube.DEFAULT_STATISTICS]
+  data_cube = cube.build_cube(table)
+  assert data_cube.shape == shape
+  assert not (data_cube.status == cube.NO_ROW_STATUS).any()
+
+  # Suppressed cells have no value and the suppressed STATUS, the others a graded one
+  suppressed = data_cube.status == table.code('status', synthetic.SUPPRESSED_STATUS)
+  assert np.array_equal(suppressed, data_cube.missing) and 0 < suppressed.mean() < 0.4
+  assert set(table.dictionaries['status']) <= set(synthetic.STATUS_GRADES) | {synthetic.SUPPRESSED_STATUS}
+  assert proportions.total_position(data_cube) == 0
+
+
+def test_same_seed_same_file(tmp_path):
+  paths = [str(tmp_path / name) for name in ('first.csv', 'second.csv', 'third.csv')]
+  for path, seed in zip(paths, (5, 5, 6), strict=True):
+    synthetic.write_file(path, quarter_count=3, geo_count=2, noc_count=2, characteristic_count=3, seed=seed)
+  first, second, third = (read(path) for path in paths)
+  assert first == second and first != third
+
+
+def test_command_line(tmp_path, capsys):
+  path = str(tmp_path / 'synthetic.csv')
+  assert synthetic.main(['synthetic.py', path, '--quarters', '2', '--geos', '1', '--nocs', '2',
+                         '--characteristics', '2', '--no-footnotes']) == 0
+  assert "Wrote 8 rows" in capsys.readouterr().out
+  with open(path, encoding='utf-8-sig') as data_file:
+    assert len(data_file.read().splitlines()) == 1 + 8
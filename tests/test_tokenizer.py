@@ -0,0 +1,111 @@
+'''
+test_tokenizer.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of tokenizer.py and of streaming.py, which reads through it: both give the
+    same table as csv.reader rows encoded by loader.py, and a VALUE that is not a
+    number (e.g. '..') is missing rather than an error.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' reads the files the way the tokenizer must match, and writes the test files
+import csv
+
+# 'math' recognises missing values
+import math
+
+# 'numpy' compares the columns
+import numpy as np
+
+# 'pytest' runs the tests
+import pytest
+
+# 'cache' hashes the files
+from vacancies import cache
+
+# 'cube' gives the code columns as arrays
+from vacancies import cube
+
+# 'filters' scans files that are not loaded
+from vacancies import filters
+
+# 'loader' encodes csv.reader rows
+from vacancies import loader
+
+# 'streaming' is one of the modules tested
+from vacancies import streaming
+
+# 'synthetic' writes the rows of the test files
+from vacancies import synthetic
+
+# 'tokenizer' is one of the modules tested
+from vacancies import tokenizer
+
+
+def csv_table(file_name):
+  with open(file_name, encoding='utf-8-sig', newline='') as csv_file:
+    return loader.encode_rows(csv.reader(csv_file))
+
+
+def assert_same_table(table, expected):
+  assert table.dictionaries == expected.dictionaries
+  for name, _ in loader.ENCODED_COLUMNS:
+    assert np.array_equal(cube.code_array(table, name), cube.code_array(expected, name))
+  assert np.array_equal(np.frombuffer(table.values), np.frombuffer(expected.values), equal_nan=True)
+
+
+@pytest.fixture
+def odd_values_file(tmp_path):
+  '''
+    A file whose VALUE cells include '..', 'x' and a label holding '","'.
+  '''
+  rows = list(synthetic.generate_rows(quarter_count=3, geo_count=2, noc_count=2, characteristic_count=3, seed=4))
+  rows[0][loader.VALUE_COLUMN] = '..'
+  rows[1][loader.VALUE_COLUMN] = 'x'
+  rows[2][loader.CHARACTERISTIC_COLUMN] = 'Quoted "," label'
+  path = str(tmp_path / 'odd.csv')
+  with open(path, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerows(rows)
+    csv_writer.writerows(synthetic.FOOTNOTES)
+  return path
+
+
+def test_tokenizer_matches_csv_reader(synthetic_file, odd_values_file):
+  for file_name in (synthetic_file, odd_values_file):
+    assert_same_table(tokenizer.encode_file(file_name), csv_table(file_name))
+
+
+def test_values_that_are_not_numbers_are_missing(odd_values_file):
+  assert math.isnan(loader.parse_value('..')) and math.isnan(loader.parse_value(b'x'))
+  assert loader.parse_value(b'12.5') == 12.5
+
+  table = loader.parse_file(odd_values_file)
+  assert math.isnan(table.values[0]) and math.isnan(table.values[1])
+  scanned = filters.compile_filter('noc = 1').scan(odd_values_file)
+  assert scanned[0][-1] is None and scanned[1][-1] is None
+
+
+@pytest.mark.parametrize('chunk_rows', [7, streaming.CHUNK_ROWS])
+def test_streamed_store_matches_csv_reader(synthetic_file, odd_values_file, tmp_path, chunk_rows):
+  for file_name in (synthetic_file, odd_values_file):
+    store_path = streaming.ingest(file_name, str(tmp_path / 'store.vtc'), chunk_rows=chunk_rows)
+    assert_same_table(loader.open_store(store_path), csv_table(file_name))
+    assert cache.read_store(store_path)[0]['sha256'] == cache.file_digest(file_name)
+
+
+def test_streamed_store_keeps_the_rows_asked_for(synthetic_file, tmp_path):
+  expected = csv_table(synthetic_file)
+  geo = expected.dictionaries['geo'][1]
+  store_path = streaming.ingest(synthetic_file, str(tmp_path / 'store.vtc'), geos={geo}, chunk_rows=5)
+  table = loader.open_store(store_path)
+  assert table.dictionaries['geo'] == [geo]
+  assert table.select(geo=geo) == expected.select(geo=geo)
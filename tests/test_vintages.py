@@ -0,0 +1,81 @@
+'''
+test_vintages.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Tests of vintages.py: vintages recorded within the same second get their own
+    names, a release applied to the data file is recorded as a vintage, and a
+    point-in-time query gives the figures as they were in each vintage.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the release file
+import csv
+
+# 'datetime' fixes the time the vintages are recorded at
+import datetime
+
+# 'pytest' runs the tests
+import pytest
+
+# 'incremental' applies a release to the data file
+from vacancies import incremental
+
+# 'loader' knows the layout of a StatCan row
+from vacancies import loader
+
+# 'synthetic' writes the rows of the test files
+from vacancies import synthetic
+
+# 'vintages' is the module tested
+from vacancies import vintages
+
+
+class FixedTime(datetime.datetime):
+  @classmethod
+  def now(cls, _tz=None):
+    return cls(2026, 10, 18, 9, 30, 0)
+
+
+def test_vintages_recorded_in_the_same_second(synthetic_file, monkeypatch):
+  monkeypatch.setattr(datetime, 'datetime', FixedTime)
+  names = [vintages.record_file(synthetic_file)['name'] for _ in range(3)]
+  assert names == ['2026-10-18T09:30:00', '2026-10-18T09:30:00-2', '2026-10-18T09:30:00-3']
+  assert vintages.load_history(synthetic_file).vintage_number('2026-10-18T09:30:00-2') == 2
+
+
+def test_a_name_given_twice_is_rejected(synthetic_file):
+  vintages.record_file(synthetic_file, 'first')
+  with pytest.raises(ValueError):
+    vintages.record_file(synthetic_file, 'first')
+
+
+def test_figures_as_of_each_vintage(synthetic_file, tmp_path):
+  first = vintages.record_file(synthetic_file, 'first')
+  before = vintages.load_history(synthetic_file).figures()
+  assert first['records'] == len(before) == len(loader.parse_file(synthetic_file))
+
+  # Revise the first row of the file, through a release
+  row = next(synthetic.generate_rows(quarter_count=6, geo_count=3, noc_count=4, characteristic_count=5,
+                                     suppressed=0.1, seed=7))
+  row[loader.VALUE_COLUMN] = '123456'
+  row[loader.STATUS_COLUMN] = 'A'
+  release_file = str(tmp_path / 'release.csv')
+  with open(release_file, 'w', encoding='utf-8-sig', newline='') as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(synthetic.HEADER)
+    csv_writer.writerow(row)
+  # Applying the release records it in the history
+  second = incremental.apply_release(synthetic_file, release_file, vintage_name='second').vintage
+  assert second['name'] == 'second' and second['records'] == 1
+
+  history = vintages.load_history(synthetic_file)
+  assert history.figures('first') == before
+  assert history.changes('second') == [[row[loader.REF_DATE_COLUMN], row[loader.VECTOR_COLUMN],
+                                        row[loader.COORDINATE_COLUMN], before[0][3], before[0][4], 123456, 'A']]
@@ -0,0 +1,16 @@
+'''
+vacancies
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Shared code used by main.py, plotting.py and the question scripts to load and
+    query the StatCan job vacancy files in dataFiles/.
+'''
+
+# 'loader' gives the table and the loader most callers need
+from vacancies.loader import VacancyTable, load_table
+
+__all__ = ['VacancyTable', 'load_table']
@@ -0,0 +1,182 @@
+'''
+batch.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This module answers many question selections in one go, without asking the user
+    anything. The selections are read from a file and each one needs three fields:
+      1. question        - the question number (1-4)
+      2. characteristic  - the menu number of the job vacancy characteristic, or its
+                           label exactly as written in the data file
+      3. noc             - the menu number of the National Occupation Classification,
+                           or its label exactly as written in the data file
+
+    Supported selection files:
+      - JSON: a list of objects, or an object with a "queries" list
+      - CSV:  a header row with question,characteristic,noc and one selection per row
+      - TOML: one [[query]] table per selection
+
+    Every data file is parsed once (see loader.py), whatever the number of selections,
+    and one JSON object is written per selection (JSON Lines).
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' reads selection files written as CSV
+import csv
+
+# 'json' reads JSON selection files and writes the results
+import json
+
+# 'os' tells the selection file formats apart by extension
+import os
+
+# 'profiling' times every selection when profiling is on
+from vacancies import profiling
+
+# 'proportions' gives the share of its total of every row
+from vacancies import proportions
+
+# 'results' answers repeated selections from its cache
+from vacancies import results
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+SELECTION_FIELDS = ('question', 'characteristic', 'noc')
+
+
+class SelectionError(ValueError):
+  '''
+    Raised when a selection file or one of its selections cannot be used.
+  '''
+
+
+def _load_toml(selection_file):
+  try:
+    import tomllib
+  except ImportError:
+    # Python 3.10 has no tomllib, but the 'tomli' package offers the same API
+    try:
+      import tomli as tomllib
+    except ImportError:
+      raise SelectionError("Reading TOML selection files needs Python 3.11 or the 'tomli' package") from None
+  with open(selection_file, 'rb') as toml_file:
+    return tomllib.load(toml_file).get('query', [])
+
+
+def read_selections(selection_file):
+  '''
+    Reads the selections from a JSON, CSV or TOML file.
+
+    Parameters:
+    selection_file (str): the path to the selection file
+
+    Returns:
+    list: one dict per selection, with the keys in SELECTION_FIELDS
+  '''
+  extension = os.path.splitext(selection_file)[1].lower()
+
+  if extension == '.json':
+    with open(selection_file, encoding='utf-8') as json_file:
+      selections = json.load(json_file)
+    if isinstance(selections, dict):
+      selections = selections.get('queries', [])
+  elif extension == '.csv':
+    with open(selection_file, encoding='utf-8-sig', newline='') as csv_file:
+      selections = list(csv.DictReader(csv_file))
+  elif extension == '.toml':
+    selections = _load_toml(selection_file)
+  else:
+    raise SelectionError(f"Unknown selection file type '{extension}', use .json, .csv or .toml")
+
+  for number, selection in enumerate(selections, start=1):
+    missing = [field for field in SELECTION_FIELDS if field not in selection]
+    if missing:
+      raise SelectionError(f"Selection {number} is missing: {', '.join(missing)}")
+  return selections
+
+
+def resolve_choice(choice, choices):
+  '''
+    Turns a menu number (as an int or as text) into the label it stands for in
+    'choices'. Anything else is taken to be the label itself.
+  '''
+  if isinstance(choice, int) or (isinstance(choice, str) and choice.strip().isdigit()):
+    number = int(choice)
+    if number not in choices:
+      raise SelectionError(f"Invalid choice {number}, expected one of {min(choices)}-{max(choices)}")
+    return choices[number]
+  return choice
+
+
+def answer_selection(selection, load_question, result_cache=None):
+  '''
+    Answers one selection.
+
+    Parameters:
+    selection (dict): the selection, with the keys in SELECTION_FIELDS
+    load_question (function): takes a question number and returns the question
+      (a registry.Question) and the path of its data file
+    result_cache (ResultCache): where the answers are kept, see results.query_series()
+
+    Returns:
+    dict: the selection as labels, plus the matching rows (a suppressed value is
+    None, not 0), the share of its total of each row and the STATUS grade of each
+    share (see proportions.Proportions.status_for())
+  '''
+  question_number = int(selection['question'])
+  question, data_file = load_question(question_number)
+
+  noc = resolve_choice(selection['noc'], question.choices('noc', data_file))
+  characteristic = resolve_choice(selection['characteristic'], question.choices('characteristic', data_file))
+
+  rows = results.query_rows(data_file, question_number, noc, characteristic, question.find_rows, result_cache)
+  shares = results.query_series(data_file, question_number, noc, characteristic, 'proportions',
+                                lambda: proportions.load_proportions(data_file, question.total_label).shares_for(noc, characteristic),
+                                result_cache)
+  status = results.query_series(data_file, question_number, noc, characteristic, 'status',
+                                lambda: proportions.load_proportions(data_file, question.total_label).status_for(noc, characteristic),
+                                result_cache)
+
+  return {
+      'question': question_number,
+      'noc': noc,
+      'characteristic': characteristic,
+      'rows': rows,
+      'proportions': shares,
+      'status': status,
+  }
+
+
+def run_batch(selections, load_question, out_file):
+  '''
+    Answers every selection and writes one JSON line per selection to 'out_file'.
+    A selection that cannot be answered gets a line with an "error" field instead
+    of stopping the whole batch.
+
+    Parameters:
+    selections (list): the selections, see read_selections()
+    load_question (function): see answer_selection()
+    out_file (file): where to write the results
+
+    Returns:
+    int: the number of selections that failed
+  '''
+  failures = 0
+  for number, selection in enumerate(selections, start=1):
+    try:
+      with profiling.stage('query', query=number):
+        result = answer_selection(selection, load_question)
+    except (KeyError, ValueError, OSError) as e:
+      failures += 1
+      result = {'error': str(e), 'selection': selection}
+    result = {'query': number, **result}
+    out_file.write(json.dumps(result) + '\n')
+  return failures
@@ -0,0 +1,286 @@
+'''
+cache.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This module keeps a binary copy of every parsed data file on disk so the next run
+    can skip CSV parsing completely.
+
+    Each cache file holds:
+      1. a short JSON header with the source file's path, size, modification time and
+         SHA-256 hash, plus the label dictionaries of the encoded columns
+      2. the integer code columns and the VALUE column as raw machine arrays
+
+    The arrays are read back through mmap, so opening a cached table costs a header
+    parse and no copying. A cache file is used as long as the source file has the same
+    size and modification time; if those changed but the content hash did not (e.g. the
+    file was copied or touched) the cache is refreshed without re-parsing, otherwise the
+    source file is parsed again.
+
+    Environment variables:
+      VACANCIES_CACHE_DIR  folder for the cache files (default: .cache/vacancies in the project)
+      VACANCIES_NO_CACHE   set to 1 to turn the cache off
+'''
+
+#
+#   Packages and modules
+#
+
+# 'contextlib' ignores a cache file that cannot be refreshed
+import contextlib
+
+# 'hashlib' computes the content hash of the source file
+import hashlib
+
+# 'json' stores the header of a cache file
+import json
+
+# 'mmap' maps the cached arrays straight into memory
+import mmap
+
+# 'os' gives access to file timestamps, paths and atomic renames
+import os
+
+# 'struct' packs the fixed-size prefix of a cache file
+import struct
+
+# 'sys' tells us the byte order the arrays were written with
+import sys
+
+# 'tempfile' gives each writer its own temporary file before the atomic rename
+import tempfile
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+MAGIC = b'VTC1'
+PREFIX = struct.Struct('<4sI')
+ALIGNMENT = 8
+HASH_CHUNK_SIZE = 1 << 20
+CACHE_SUFFIX = '.vtc'
+
+#
+#  The permissions of the files written, e.g. the index files next to the data
+#  files (mkstemp() would leave them readable by their owner only)
+#
+FILE_MODE = 0o644
+
+CACHE_DIR_VARIABLE = 'VACANCIES_CACHE_DIR'
+NO_CACHE_VARIABLE = 'VACANCIES_NO_CACHE'
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_CACHE_DIR = os.path.join(PROJECT_DIR, '.cache', 'vacancies')
+
+
+def enabled():
+  '''
+    Tells if the on-disk cache should be used.
+  '''
+  return os.environ.get(NO_CACHE_VARIABLE, '') in ('', '0')
+
+
+def cache_dir():
+  '''
+    Returns the folder the cache files are kept in.
+  '''
+  return os.environ.get(CACHE_DIR_VARIABLE) or DEFAULT_CACHE_DIR
+
+
+def cache_path(source_path):
+  '''
+    Returns the cache file used for 'source_path'. The name mixes a hash of the
+    absolute path with the file name, so two files called the same in different
+    folders do not share a cache file.
+  '''
+  source_path = os.path.abspath(source_path)
+  path_hash = hashlib.sha1(source_path.encode('utf-8')).hexdigest()[:16]
+  return os.path.join(cache_dir(), f"{os.path.basename(source_path)}-{path_hash}{CACHE_SUFFIX}")
+
+
+def file_digest(path):
+  '''
+    Returns the SHA-256 hash of a file's content, reading it in chunks.
+  '''
+  digest = hashlib.sha256()
+  with open(path, 'rb') as source_file:
+    for chunk in iter(lambda: source_file.read(HASH_CHUNK_SIZE), b''):
+      digest.update(chunk)
+  return digest.hexdigest()
+
+
+def source_key(path, stat, digest):
+  '''
+    Builds the part of the header that identifies the source file version.
+  '''
+  return {
+      'path': os.path.abspath(path),
+      'size': stat.st_size,
+      'mtime_ns': stat.st_mtime_ns,
+      'sha256': digest,
+  }
+
+
+def _padding(length):
+  return (-length) % ALIGNMENT
+
+
+def write_store(store_path, key, dictionaries, codes, values):
+  '''
+    Writes a table to 'store_path' in the cache format.
+
+    Parameters:
+    store_path (str): where to write the cache file
+    key (dict): the source file version, see source_key()
+    dictionaries (dict): column name -> list of labels
+    codes (dict): column name -> array of integer codes
+    values (array): the VALUE column
+  '''
+  columns = []
+  for name, column in list(codes.items()) + [('value', values)]:
+    view = memoryview(column)
+    columns.append((name, view.format, len(view), [view.cast('B')]))
+  write_columns(store_path, key, dictionaries, columns)
+
+
+def write_columns(store_path, key, dictionaries, columns):
+  '''
+    Writes a cache file whose columns are given as pieces of raw bytes, so a column
+    does not have to be in memory all at once. The file is first written under a
+    temporary name and then renamed, so readers never see half a file.
+
+    Parameters:
+    store_path (str): where to write the cache file
+    key (dict): the source file version, see source_key()
+    dictionaries (dict): column name -> list of labels
+    columns (list): (name, typecode, length, pieces) for each column, the VALUE
+      column being called 'value'; 'pieces' yields the column's bytes in order
+  '''
+  #
+  #  Lay out the arrays one after another, each starting on an aligned offset
+  #  relative to the start of the data section
+  #
+  layout = {}
+  offset = 0
+  for name, typecode, length, _ in columns:
+    size = length * struct.calcsize(typecode)
+    layout[name] = {'offset': offset, 'length': length, 'typecode': typecode}
+    offset += size + _padding(size)
+
+  header = json.dumps({
+      'key': key,
+      'byteorder': sys.byteorder,
+      'dictionaries': dictionaries,
+      'columns': layout,
+  }).encode('utf-8')
+  header += b' ' * _padding(PREFIX.size + len(header))
+
+  directory = os.path.dirname(store_path) or '.'
+  os.makedirs(directory, exist_ok=True)
+  descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+  try:
+    os.chmod(temporary_path, FILE_MODE)
+    with os.fdopen(descriptor, 'wb') as store_file:
+      store_file.write(PREFIX.pack(MAGIC, len(header)))
+      store_file.write(header)
+      for _, typecode, length, pieces in columns:
+        for piece in pieces:
+          store_file.write(piece)
+        store_file.write(b'\0' * _padding(length * struct.calcsize(typecode)))
+    os.replace(temporary_path, store_path)
+  except BaseException:
+    if os.path.exists(temporary_path):
+      os.remove(temporary_path)
+    raise
+
+
+def read_store(store_path):
+  '''
+    Opens a cache file written by write_store().
+
+    Parameters:
+    store_path (str): the cache file
+
+    Returns:
+    tuple: (key, dictionaries, codes, values) where the arrays are memoryviews over
+    the mapped file (values being None for a file without a 'value' column), or None
+    if the file is missing, damaged or was written on a machine with a different
+    byte order.
+  '''
+  try:
+    with open(store_path, 'rb') as store_file:
+      mapped = mmap.mmap(store_file.fileno(), 0, access=mmap.ACCESS_READ)
+  except (OSError, ValueError):
+    return None
+
+  try:
+    magic, header_length = PREFIX.unpack_from(mapped, 0)
+    if magic != MAGIC:
+      return None
+    header = json.loads(mapped[PREFIX.size:PREFIX.size + header_length])
+  except (struct.error, ValueError):
+    return None
+  if header.get('byteorder') != sys.byteorder:
+    return None
+
+  #
+  #  Every column is a zero-copy view of its slice of the mapped file
+  #
+  data = memoryview(mapped)[PREFIX.size + header_length:]
+  arrays = {}
+  for name, column in header['columns'].items():
+    start = column['offset']
+    end = start + column['length'] * struct.calcsize(column['typecode'])
+    arrays[name] = data[start:end].cast(column['typecode'])
+
+  values = arrays.pop('value', None)
+  return header['key'], header['dictionaries'], arrays, values
+
+
+def fetch(source_path, stat):
+  '''
+    Looks for an up to date cached copy of 'source_path'.
+
+    Parameters:
+    source_path (str): the CSV file
+    stat (os.stat_result): the current stat of the CSV file
+
+    Returns:
+    tuple: (dictionaries, codes, values) or None when the file has to be parsed.
+  '''
+  store_path = cache_path(source_path)
+  stored = read_store(store_path)
+  if stored is None:
+    return None
+  key, dictionaries, codes, values = stored
+
+  # A store holding only some of the rows is not a copy of the file
+  if key.get('filter') or key['size'] != stat.st_size:
+    return None
+
+  #
+  #  Same size but a different timestamp: only trust the cache if the content
+  #  hash still matches, and remember the new timestamp for next time
+  #
+  if key['mtime_ns'] != stat.st_mtime_ns:
+    digest = file_digest(source_path)
+    if digest != key['sha256']:
+      return None
+    with contextlib.suppress(OSError):
+      write_store(store_path, source_key(source_path, stat, digest), dictionaries, codes, values)
+
+  return dictionaries, codes, values
+
+
+def store(source_path, stat, table):
+  '''
+    Saves a freshly parsed table in the cache. The cache is only a speed-up, so a
+    folder we cannot write to is not an error.
+  '''
+  try:
+    key = source_key(source_path, stat, file_digest(source_path))
+    write_store(cache_path(source_path), key, table.dictionaries, table.codes, table.values)
+  except OSError:
+    pass
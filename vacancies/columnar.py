@@ -0,0 +1,439 @@
+'''
+columnar.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    A loaded table (see loader.py) can be written as an Apache Arrow table, to a
+    Parquet file or an Arrow IPC file, and read back later without parsing any text.
+    The file has one column per column of the table, plus the shares of the
+    proportions (see proportions.py):
+
+      ref_date, geo, noc, characteristic, statistics, status
+                    dictionary-encoded, the int32 codes and the labels of the table
+      value         float64, null where the VALUE was empty (e.g. suppressed)
+      share         the share of the total characteristic, null for the other
+                    statistics and where there is no share
+      share_change  the change of that share since the previous quarter
+
+    The question, the source file and its SHA-256 hash, the statistic and the total
+    characteristic of the shares are kept in the metadata of the file.
+
+    An Arrow IPC file is mapped from disk when read: the code and value columns of
+    the table read back, and the arrays of read_arrays(), point into the mapped file
+    instead of being copied. A Parquet file is smaller, but is decompressed into
+    memory when read.
+
+    loader.load_table() reads these files by their suffix (.parquet, .arrow or
+    .feather), so the question scripts, the filters, main.py and plotting.py take
+    them in place of the CSV files.
+
+    Needs the 'pyarrow' package (the 'columnar' extra of pyproject.toml), which is only
+    imported when a file is written or read.
+
+    Commandline Parameters (run as "python -m vacancies.columnar"):
+      export <folder> [--format parquet|arrow] [--questions <N>...]
+                    writes the table of every question (default: 1 2 3 4) to <folder>,
+                    as dataForQuestion<N>.parquet (or .arrow)
+      show <file>   prints the columns and the metadata of a file
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'json' keeps the metadata in the file
+import json
+
+# 'os' builds the paths of the files written
+import os
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'numpy' holds the columns read back, without copying them
+import numpy as np
+
+# 'cache' hashes the source file
+from vacancies import cache
+
+# 'cube' gives the code columns as arrays
+from vacancies import cube
+
+# 'loader' loads the tables written and builds the tables read
+from vacancies import loader
+
+# 'output' gives every file written a temporary name before the atomic rename
+from vacancies import output
+
+# 'profiling' times the writing and the reading when profiling is on
+from vacancies import profiling
+
+# 'proportions' computes the shares written with the table
+from vacancies import proportions
+
+# 'registry' knows the data file of every question
+from vacancies import registry
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+FORMATS = ('parquet', 'arrow')
+FORMAT_SUFFIXES = {'parquet': '.parquet', 'arrow': '.arrow'}
+VALUE_NAME = 'value'
+SHARE_NAME = 'share'
+SHARE_CHANGE_NAME = 'share_change'
+
+#
+#  The key of the metadata in the schema of the file
+#
+METADATA_KEY = b'vacancies'
+
+
+def _import_pyarrow():
+  try:
+    import pyarrow
+  except ImportError:
+    raise ValueError("Reading or writing Parquet or Arrow files needs the 'pyarrow' package "
+                     "(the 'columnar' extra)") from None
+  return pyarrow
+
+
+def row_shares(table, data_proportions):
+  '''
+    Lines the shares of a cube up with the rows of the table the cube was built from.
+
+    Parameters:
+    table (VacancyTable): the loaded file
+    data_proportions (Proportions): the shares of its cube
+
+    Returns:
+    tuple: (shares, changes) float64 arrays with one entry per row, NaN for the rows
+    of other statistics and where there is no share
+  '''
+  data_cube = data_proportions.cube
+  shares = np.full(len(table), np.nan)
+  changes = np.full(len(table), np.nan)
+  statistics_code = table.code('statistics', data_cube.statistics)
+  if statistics_code is None:
+    return shares, changes
+
+  # The cube keeps the GEO, NOC and characteristic codes of the table, but puts
+  # the quarters in date order
+  date_position = np.array([data_cube.index('ref_date', label) for label in table.dictionaries['ref_date']],
+                           dtype=np.intp)
+  keep = cube.code_array(table, 'statistics') == statistics_code
+  cells = (
+      cube.code_array(table, 'geo')[keep],
+      cube.code_array(table, 'noc')[keep],
+      cube.code_array(table, 'characteristic')[keep],
+      date_position[cube.code_array(table, 'ref_date')[keep]],
+  )
+  shares[keep] = data_proportions.shares[cells]
+  changes[keep] = data_proportions.changes[cells]
+  return shares, changes
+
+
+def arrow_table(table, data_proportions=None, metadata=None):
+  '''
+    Builds the Arrow table of a loaded table. The codes and the values are handed to
+    Arrow without being copied.
+
+    Parameters:
+    table (VacancyTable): the loaded file
+    data_proportions (Proportions): the shares of its cube, or None for empty share
+      columns
+    metadata (dict): what to keep in the metadata of the table
+
+    Returns:
+    pyarrow.Table: the table
+  '''
+  pa = _import_pyarrow()
+  columns = {}
+  for name, _ in loader.ENCODED_COLUMNS:
+    columns[name] = pa.DictionaryArray.from_arrays(pa.array(cube.code_array(table, name), type=pa.int32()),
+                                                   pa.array(table.dictionaries[name], type=pa.string()))
+
+  # The missing values stay NaN under the null bitmap, so they read back as NaN
+  # without a copy
+  values = np.frombuffer(table.values, dtype=np.float64)
+  columns[VALUE_NAME] = pa.array(values, mask=np.isnan(values))
+
+  if data_proportions is None:
+    shares = changes = np.full(len(table), np.nan)
+  else:
+    shares, changes = row_shares(table, data_proportions)
+  columns[SHARE_NAME] = pa.array(shares, mask=np.isnan(shares))
+  columns[SHARE_CHANGE_NAME] = pa.array(changes, mask=np.isnan(changes))
+
+  return pa.table(columns, metadata={METADATA_KEY: json.dumps(metadata or {})})
+
+
+def write_table(table, path, file_format=None, data_proportions=None, metadata=None):
+  '''
+    Writes a loaded table to a Parquet or Arrow IPC file, under a temporary name
+    that is renamed to 'path' once complete.
+
+    Parameters:
+    table (VacancyTable): the loaded file
+    path (str): the file to write
+    file_format (str): 'parquet' or 'arrow', by default from the suffix of 'path'
+    data_proportions (Proportions): the shares written with the table, see arrow_table()
+    metadata (dict): what to keep in the metadata of the file
+
+    Raises:
+    ValueError: when the format is unknown or pyarrow is missing
+  '''
+  file_format = file_format or loader.columnar_format(path)
+  if file_format not in FORMATS:
+    raise ValueError(f"Unknown format for {path}, use one of: {', '.join(FORMATS)}")
+
+  pa = _import_pyarrow()
+  with profiling.stage('export', file=os.path.basename(path)) as timer:
+    written = arrow_table(table, data_proportions, metadata)
+    descriptor, temporary_path = output.temporary_file(path)
+    os.close(descriptor)
+    try:
+      if file_format == 'parquet':
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(written, temporary_path)
+      else:
+        # Left uncompressed, so the file can be mapped and read without a copy
+        with pa.OSFile(temporary_path, 'wb') as sink, pa.ipc.new_file(sink, written.schema) as writer:
+          writer.write_table(written)
+      os.replace(temporary_path, path)
+    except BaseException:
+      output.remove_file(temporary_path)
+      raise
+    timer.count(len(table))
+
+
+def export_file(file_name, path, file_format=None, total_label=None, metadata=None):
+  '''
+    Writes the table of a data file, with its shares, to a Parquet or Arrow IPC file.
+    The share columns are left empty when the file has no total characteristic.
+
+    Parameters:
+    file_name (str): the path to the data file
+    path (str): the file to write
+    file_format (str): 'parquet' or 'arrow', see write_table()
+    total_label (str): the label of the total characteristic, found by default
+    metadata (dict): more to keep in the metadata of the file
+  '''
+  table = loader.load_table(file_name)
+  try:
+    data_proportions = proportions.load_proportions(file_name, total_label)
+  except ValueError:
+    data_proportions = None
+
+  metadata = dict(metadata or {})
+  metadata.update({
+      'source': os.path.basename(file_name),
+      'sha256': cache.file_digest(file_name),
+      'rows': len(table),
+      'statistics': None if data_proportions is None else data_proportions.cube.statistics,
+      'total': None if data_proportions is None else data_proportions.total_label,
+  })
+  write_table(table, path, file_format, data_proportions, metadata)
+
+
+def export_questions(out_dir, file_format='parquet', questions=None):
+  '''
+    Writes the table of the data file of every question to a folder.
+
+    Parameters:
+    out_dir (str): the folder, created when missing
+    file_format (str): 'parquet' or 'arrow'
+    questions (list): the question numbers, by default every question
+
+    Returns:
+    list: the paths of the files written
+  '''
+  if file_format not in FORMATS:
+    raise ValueError(f"Unknown format '{file_format}', use one of: {', '.join(FORMATS)}")
+  os.makedirs(out_dir, exist_ok=True)
+  paths = []
+  for number in questions or sorted(registry.QUESTIONS):
+    question = registry.get_question(number)
+    name = os.path.splitext(os.path.basename(question.data_file))[0]
+    path = os.path.join(out_dir, name + FORMAT_SUFFIXES[file_format])
+    export_file(question.data_file, path, file_format, question.total_label,
+                {'question': question.number, 'title': question.title})
+    paths.append(path)
+  return paths
+
+
+def read_arrow(path):
+  '''
+    Reads a Parquet or Arrow IPC file as an Arrow table, mapping an Arrow IPC file
+    from disk rather than reading it.
+
+    Raises:
+    ValueError: when the suffix of 'path' is not a known one or pyarrow is missing
+  '''
+  file_format = loader.columnar_format(path)
+  if file_format is None:
+    raise ValueError(f"Not a Parquet or Arrow file: {path}")
+
+  pa = _import_pyarrow()
+  if file_format == 'parquet':
+    import pyarrow.parquet
+    return pyarrow.parquet.read_table(path, memory_map=True)
+  # Feather files are Arrow IPC files too
+  return pa.ipc.open_file(pa.memory_map(path, 'r')).read_all()
+
+
+def table_metadata(arrow):
+  '''
+    Returns the metadata written with an Arrow table by export_file(), or an empty dict.
+  '''
+  metadata = arrow.schema.metadata or {}
+  return json.loads(metadata.get(METADATA_KEY, b'{}'))
+
+
+def _single_array(column):
+  # One chunk is used as it is; only a file of several chunks (e.g. a Parquet file
+  # of several row groups) is put together in a new array
+  if column.num_chunks == 1:
+    return column.chunk(0)
+  return column.combine_chunks()
+
+
+def _dictionary_column(pa, arrow, name):
+  '''
+    Returns the codes (as an int32 NumPy array) and the labels of a column.
+  '''
+  array = _single_array(arrow.column(name))
+  if not pa.types.is_dictionary(array.type):
+    array = array.dictionary_encode()
+  if array.null_count:
+    raise ValueError(f"The '{name}' column has missing labels")
+  indices = array.indices
+  if indices.type != pa.int32():
+    indices = indices.cast(pa.int32())
+  return indices.to_numpy(zero_copy_only=True), array.dictionary.to_pylist()
+
+
+def _float_column(pa, arrow, name):
+  '''
+    Returns a column as a float64 NumPy array, NaN where null, without copying it
+    when the nulls hold NaN already (as in the files written by write_table()).
+  '''
+  array = _single_array(arrow.column(name))
+  if array.type != pa.float64():
+    array = array.cast(pa.float64())
+  if not array.null_count:
+    return array.to_numpy(zero_copy_only=True)
+  data = np.frombuffer(array.buffers()[1], dtype=np.float64, count=array.offset + len(array))[array.offset:]
+  if np.isnan(data[array.is_null().to_numpy(zero_copy_only=False)]).all():
+    return data
+  return array.to_numpy(zero_copy_only=False)
+
+
+def read_arrays(path):
+  '''
+    Reads a file written by export_file() as NumPy arrays, pointing into the mapped
+    file for an Arrow IPC file.
+
+    Returns:
+    tuple: (dictionaries, arrays), the labels of each encoded column and the arrays
+    of every column: the int32 codes of the encoded columns and the float64 value,
+    share and share_change columns, NaN where null
+
+    Raises:
+    ValueError: when the file is not a table of this kind
+  '''
+  pa = _import_pyarrow()
+  with profiling.stage('columnar', file=os.path.basename(path)) as timer:
+    arrow = read_arrow(path)
+    missing = [name for name, _ in loader.ENCODED_COLUMNS if name not in arrow.column_names]
+    missing += [name for name in (VALUE_NAME,) if name not in arrow.column_names]
+    if missing:
+      raise ValueError(f"Not a job vacancy table: {path} has no column {', '.join(missing)}")
+
+    dictionaries = {}
+    arrays = {}
+    for name, _ in loader.ENCODED_COLUMNS:
+      arrays[name], dictionaries[name] = _dictionary_column(pa, arrow, name)
+    for name in (VALUE_NAME, SHARE_NAME, SHARE_CHANGE_NAME):
+      if name in arrow.column_names:
+        arrays[name] = _float_column(pa, arrow, name)
+    timer.count(arrow.num_rows)
+  return dictionaries, arrays
+
+
+def read_table(path):
+  '''
+    Reads a file written by export_file() as a VacancyTable. Its code and value
+    columns are memoryviews of the arrays of read_arrays(), like those of a table
+    mapped from the cache (see cache.py).
+
+    Raises:
+    ValueError: when the file is not a table of this kind
+  '''
+  dictionaries, arrays = read_arrays(path)
+  codes = {name: memoryview(arrays[name]) for name, _ in loader.ENCODED_COLUMNS}
+  return loader.VacancyTable(dictionaries, codes, memoryview(arrays[VALUE_NAME]))
+
+
+def read_frame(path):
+  '''
+    Reads a Parquet or Arrow IPC file as a pandas DataFrame, the encoded columns
+    becoming categoricals and nulls becoming NaN.
+  '''
+  return read_arrow(path).to_pandas()
+
+
+def read_rows(path):
+  '''
+    Reads a Parquet or Arrow IPC file as a list of rows, e.g. the rows written for
+    plotting.py (see output.ArrowSink), nulls becoming None.
+  '''
+  arrow = read_arrow(path)
+  return [list(row) for row in zip(*(column.to_pylist() for column in arrow.columns), strict=True)]
+
+
+def main(argv):
+  '''
+    Exports the tables of the questions, or shows a file, from the command line.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.columnar',
+                                   description='Write the job vacancy tables as Parquet or Arrow files.')
+  commands = parser.add_subparsers(dest='command', required=True)
+  export_parser = commands.add_parser('export', help='write the table of every question to a folder')
+  export_parser.add_argument('out_dir', help='the folder to write to')
+  export_parser.add_argument('--format', choices=FORMATS, default='parquet', help='the file format')
+  export_parser.add_argument('--questions', type=int, nargs='+', choices=sorted(registry.QUESTIONS))
+  show_parser = commands.add_parser('show', help='print the columns and the metadata of a file')
+  show_parser.add_argument('file_name', help='the Parquet or Arrow file')
+  arguments = parser.parse_args(argv[1:])
+
+  try:
+    if arguments.command == 'export':
+      for path in export_questions(arguments.out_dir, arguments.format, arguments.questions):
+        print(path)
+    else:
+      arrow = read_arrow(arguments.file_name)
+      print(f"{arrow.num_rows} rows")
+      for field in arrow.schema:
+        print(f"  {field.name}: {field.type}")
+      for key, value in table_metadata(arrow).items():
+        print(f"{key}: {value}")
+  except FileNotFoundError as e:
+    print(f"File not found: {e.filename or getattr(arguments, 'file_name', '')}")
+    return 2
+  except ValueError as e:
+    print(f"Cannot {arguments.command}: {e}")
+    return 3
+  return 0
+
+
+if __name__ == "__main__":
+  profiling.configure()
+  sys.exit(main(sys.argv))
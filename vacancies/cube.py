@@ -0,0 +1,323 @@
+'''
+cube.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The rows of a StatCan file form a small dense cube: every geography has every
+    occupation (NOC), every occupation every job vacancy characteristic, and every
+    characteristic one value per quarter (REF_DATE). This module turns a loaded table
+    (see loader.py) into NumPy arrays shaped
+
+        (GEO, NOC, characteristic, REF_DATE)
+
+    holding the VALUE of each cell, its STATUS code, and a mask of the cells that are
+    missing, either because VALUE was empty (e.g. the F-status "Unclassified occupations"
+    rows) or because the file has no row for that cell. A whole time series is then one
+    array slice instead of a scan of the file.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'weakref' lets a built cube go away together with the table it was built from
+import weakref
+
+# 'numpy' holds the cube arrays
+import numpy as np
+
+# 'loader' parses the data file into a table the cube is built from
+from vacancies import loader
+
+# 'profiling' times building the cube when profiling is on
+from vacancies import profiling
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+AXES = ('geo', 'noc', 'characteristic', 'ref_date')
+
+#
+#  STATUS code of a cell the file has no row for
+#
+NO_ROW_STATUS = -1
+
+#
+#  Grade of a cell whose STATUS is not a quality grade (e.g. empty) or that has no
+#  row, see loader.STATUS_GRADES
+#
+NO_GRADE = -1
+
+#
+#  The statistic the question scripts look at, when a file has more than one
+#
+DEFAULT_STATISTICS = 'Job vacancies'
+
+#
+#  Cubes already built in this process, keyed by the table they were built from
+#
+_built_cubes = weakref.WeakKeyDictionary()
+
+
+class VacancyCube:
+  '''
+    The values of one statistic of a StatCan file as dense arrays.
+
+    Attributes:
+    labels (dict): axis name (see AXES) -> list of labels along that axis; the
+      REF_DATE axis is in date order, the others in the order of the file
+    values (numpy.ndarray): float64 cube of VALUE, NaN where missing
+    status (numpy.ndarray): int8 cube of STATUS codes, NO_ROW_STATUS where the file
+      has no row for the cell
+    missing (numpy.ndarray): bool cube, True where there is no usable VALUE
+    status_labels (list): the STATUS text of each status code
+    statistics (str): the statistic the cube holds
+    grades (numpy.ndarray): int8 cube of the quality grade of each cell, 0 for A to
+      5 for F, NO_GRADE where STATUS is not a grade or there is no row
+  '''
+
+  def __init__(self, labels, values, status, status_labels, statistics):
+    self.labels = labels
+    self.values = values
+    self.status = status
+    self.missing = np.isnan(values)
+    self.status_labels = status_labels
+    self.statistics = statistics
+
+    # Reverse lookups from label to position, one per axis
+    self._positions = {
+        axis: {label: position for position, label in enumerate(axis_labels)}
+        for axis, axis_labels in labels.items()
+    }
+
+  @property
+  def shape(self):
+    return self.values.shape
+
+  @property
+  def grades(self):
+    # The lookup ends with the grade of NO_ROW_STATUS (-1), so every status code indexes it
+    lookup = np.array([grade_rank(label) for label in self.status_labels] + [NO_GRADE], dtype=np.int8)
+    return lookup[self.status]
+
+  def index(self, axis, label):
+    '''
+      Returns the position of 'label' along 'axis', or None when the label is not
+      in the file.
+    '''
+    return self._positions[axis].get(label)
+
+  def series(self, noc, characteristic, geo=0):
+    '''
+      Returns the time series of one cell of the cube, by position on each axis.
+
+      Parameters:
+      noc (int): position on the NOC axis
+      characteristic (int): position on the characteristic axis
+      geo (int): position on the GEO axis
+
+      Returns:
+      tuple: (values, status, missing), each a view of one row of the cube along REF_DATE
+    '''
+    cell = (geo, noc, characteristic)
+    return self.values[cell], self.status[cell], self.missing[cell]
+
+  def rows(self, noc, characteristic, geo=None):
+    '''
+      Returns the rows of one selection, by label, in the same form as
+      VacancyTable.select(): [ref date, geo, NOC, characteristic, statistics, value].
+
+      Parameters:
+      noc (str): the National Occupation Classification, as written in the file
+      characteristic (str): the job vacancy characteristic, as written in the file
+      geo (str): the geography, or None for every geography in the file
+
+      Returns:
+      list: one row per quarter the file has a row for, in date order
+    '''
+    noc_position = self.index('noc', noc)
+    characteristic_position = self.index('characteristic', characteristic)
+    if noc_position is None or characteristic_position is None:
+      return []
+
+    if geo is None:
+      geo_positions = range(len(self.labels['geo']))
+    else:
+      geo_position = self.index('geo', geo)
+      geo_positions = [] if geo_position is None else [geo_position]
+
+    rows = []
+    for geo_position in geo_positions:
+      values, status, _ = self.series(noc_position, characteristic_position, geo_position)
+      for date_position in np.flatnonzero(status != NO_ROW_STATUS):
+        rows.append([
+            self.labels['ref_date'][date_position],
+            self.labels['geo'][geo_position],
+            noc,
+            characteristic,
+            self.statistics,
+            loader.output_value(values[date_position]),
+        ])
+    return rows
+
+
+def grade_rank(label):
+  '''
+    Returns the quality grade of a STATUS label, 0 for A to 5 for F, or NO_GRADE.
+  '''
+  return loader.STATUS_GRADES.index(label) if label in loader.STATUS_GRADES else NO_GRADE
+
+
+def grade_label(grade):
+  '''
+    Returns the STATUS letter of a quality grade, or '' for NO_GRADE.
+  '''
+  return '' if grade == NO_GRADE else loader.STATUS_GRADES[grade]
+
+
+def default_statistics(statistics_labels):
+  '''
+    Returns the statistic the question scripts look at: DEFAULT_STATISTICS if the
+    file has it, otherwise the first statistic in the file (or None for no rows).
+  '''
+  if DEFAULT_STATISTICS in statistics_labels:
+    return DEFAULT_STATISTICS
+  return statistics_labels[0] if statistics_labels else None
+
+
+def code_array(table, column):
+  '''
+    Returns a code column of a table as a NumPy array, without copying it.
+  '''
+  return np.frombuffer(table.codes[column], dtype=np.intc)
+
+
+def build_cube(table, statistics=None):
+  '''
+    Builds the cube of one statistic of a loaded table.
+
+    Parameters:
+    table (VacancyTable): the loaded file
+    statistics (str): the statistic to keep; by default DEFAULT_STATISTICS if the file
+      has it, otherwise the first statistic in the file
+
+    Returns:
+    VacancyCube: the cube
+  '''
+  if statistics is None:
+    statistics = default_statistics(table.dictionaries['statistics'])
+
+  labels = {axis: list(table.dictionaries[axis]) for axis in AXES}
+
+  #
+  #  Put the quarters in date order ("YYYY-MM" sorts as text); 'date_position'
+  #  gives the new position of each REF_DATE code
+  #
+  date_order = np.argsort(labels['ref_date'], kind='stable')
+  labels['ref_date'] = [labels['ref_date'][code] for code in date_order]
+  date_position = np.empty(len(date_order), dtype=np.intp)
+  date_position[date_order] = np.arange(len(date_order))
+
+  #
+  #  Scatter every row of the wanted statistic into its cell in one go
+  #
+  keep = code_array(table, 'statistics') == table.code('statistics', statistics)
+  cells = (
+      code_array(table, 'geo')[keep],
+      code_array(table, 'noc')[keep],
+      code_array(table, 'characteristic')[keep],
+      date_position[code_array(table, 'ref_date')[keep]],
+  )
+  shape = tuple(len(labels[axis]) for axis in AXES)
+
+  values = np.full(shape, np.nan)
+  values[cells] = np.frombuffer(table.values, dtype=np.float64)[keep]
+
+  status = np.full(shape, NO_ROW_STATUS, dtype=np.int8)
+  status[cells] = code_array(table, 'status')[keep]
+
+  return VacancyCube(labels, values, status, list(table.dictionaries['status']), statistics)
+
+
+def built_cube(table):
+  '''
+    Returns the cube already built from 'table' in this process, or None.
+  '''
+  return _built_cubes.get(table)
+
+
+def update_cube(old_table, table, row_ids):
+  '''
+    Builds the cube of 'table' from the cube of 'old_table', an older version of the
+    same file, when the two only differ in the rows 'row_ids' (rows added at the end
+    or revised in place, see incremental.py). The old cube is copied as a block and
+    only those rows are scattered into it. Nothing is done when no cube of
+    'old_table' was built.
+
+    Parameters:
+    old_table (VacancyTable): the table before the update
+    table (VacancyTable): the table after the update; it keeps the codes of
+      'old_table' and gives new labels the next ones
+    row_ids (sequence): the ids of the added and revised rows in 'table'
+
+    Returns:
+    VacancyCube: the cube of 'table', or None
+  '''
+  old_cube = built_cube(old_table)
+  if old_cube is None:
+    return None
+
+  labels = {axis: list(table.dictionaries[axis]) for axis in AXES}
+  labels['ref_date'] = sorted(labels['ref_date'])
+  date_positions = {label: position for position, label in enumerate(labels['ref_date'])}
+  shape = tuple(len(labels[axis]) for axis in AXES)
+
+  #
+  #  The other axes only grow at the end, so the old cube is a corner of the new one
+  #  once its quarters are put in their new places
+  #
+  old_cells = np.ix_(*(np.arange(length) for length in old_cube.shape[:-1]),
+                     np.array([date_positions[label] for label in old_cube.labels['ref_date']], dtype=np.intp))
+  values = np.full(shape, np.nan)
+  values[old_cells] = old_cube.values
+  status = np.full(shape, NO_ROW_STATUS, dtype=np.int8)
+  status[old_cells] = old_cube.status
+
+  row_ids = np.asarray(row_ids, dtype=np.intp)
+  row_ids = row_ids[code_array(table, 'statistics')[row_ids] == table.code('statistics', old_cube.statistics)]
+  date_position = np.array([date_positions[label] for label in table.dictionaries['ref_date']], dtype=np.intp)
+  cells = (
+      code_array(table, 'geo')[row_ids],
+      code_array(table, 'noc')[row_ids],
+      code_array(table, 'characteristic')[row_ids],
+      date_position[code_array(table, 'ref_date')[row_ids]],
+  )
+  values[cells] = np.frombuffer(table.values, dtype=np.float64)[row_ids]
+  status[cells] = code_array(table, 'status')[row_ids]
+
+  built = VacancyCube(labels, values, status, list(table.dictionaries['status']), old_cube.statistics)
+  _built_cubes[table] = built
+  return built
+
+
+def load_cube(file_name):
+  '''
+    Returns the cube of 'file_name', building it only once per loaded table.
+
+    Parameters:
+    file_name (str): The path to the CSV file.
+
+    Returns:
+    VacancyCube: the cube of the file's DEFAULT_STATISTICS.
+  '''
+  table = loader.load_table(file_name)
+  built = _built_cubes.get(table)
+  if built is None:
+    with profiling.stage('cube', rows=len(table)):
+      built = build_cube(table)
+    _built_cubes[table] = built
+  return built
@@ -0,0 +1,435 @@
+'''
+filters.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The question scripts select one NOC and one characteristic at a time. This module
+    selects any set of rows of a data file in one pass, from a filter such as
+
+        characteristic = "Social media*" and ref_date = 2023 and status <= C
+
+    A filter is a list of conditions joined by "and", each on one column: ref_date,
+    geo, noc, characteristic, statistics or status.
+
+      column = value                    column != value
+      column in (value, ...)            column not in (value, ...)
+      column < value  (also <=, >, >=)  column between value and value
+
+    A value is a word or a quoted label ("..." or '...', a quote inside doubled).
+      - for geo, noc and characteristic, a number is the menu number the question
+        scripts show, e.g. noc in (1, 3)
+      - a '*' in a label matches any text, in any case, e.g. characteristic = "*media*"
+      - a REF_DATE is a quarter (2023-01) or a whole year (2023)
+      - the order (<, <=, >, >=, between) only applies to ref_date and status; for
+        status it is the quality grade, A (excellent) being the best, so
+        "status <= C" keeps the rows graded A, B or C
+
+    A filter is compiled once into one test per column. A loaded table is filtered
+    with one lookup array per column: every label of the column is tested once, and
+    the codes of all the rows are looked up at once with NumPy. A file that is not
+    loaded is scanned once with tokenizer.py, testing each label the first time it is
+    seen and decoding only the rows that are kept.
+
+    Commandline Parameters (run as "python -m vacancies.filters"):
+      argv[1] = path to the input file
+      argv[2] = the filter
+      The rows are written through the sinks of VACANCIES_OUTPUT (see output.py).
+'''
+
+#
+#   Packages and modules
+#
+
+# 'operator' gives the comparison of each order operator
+import operator
+
+# 'os' gives access to the data file's name and timestamps
+import os
+
+# 're' reads the filters and matches labels with a '*'
+import re
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'numpy' tests the codes of every row at once
+import numpy as np
+
+# 'cache' tells if the table of a file is already on disk
+from vacancies import cache
+
+# 'cube' gives the code columns of a table as NumPy arrays
+from vacancies import cube
+
+# 'loader' knows the columns of a StatCan row and loads the tables
+from vacancies import loader
+
+# 'output' writes the selected rows
+from vacancies import output
+
+# 'profiling' times the selection when profiling is on
+from vacancies import profiling
+
+# 'tokenizer' scans the files that are not loaded
+from vacancies import tokenizer
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+COLUMN_POSITIONS = dict(loader.ENCODED_COLUMNS)
+MENU_COLUMNS = ('geo', 'noc', 'characteristic')
+ORDERED_COLUMNS = ('ref_date', 'status')
+ORDER_OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge}
+DATE_PATTERN = re.compile(r'(\d{4})(-\d{2})?')
+
+#
+#  One token of a filter: a quoted label, an operator or punctuation, or a word
+#
+TOKEN_PATTERN = re.compile(r'''\s*(?:"((?:[^"]|"")*)"|'((?:[^']|'')*)'|(<=|>=|!=|=|<|>|\(|\)|,)|([^\s,()=<>!"']+))''')
+
+
+class FilterError(ValueError):
+  '''
+    Raised when a filter cannot be read.
+  '''
+
+
+class Filter:
+  '''
+    A compiled filter.
+
+    Attributes:
+    text (str): the filter as it was written
+    tests (dict): column name -> list of tests, each a function (label, menu number)
+      -> bool; a row is kept when every test of every column is true for its labels
+  '''
+
+  def __init__(self, text, tests):
+    self.text = text
+    self.tests = tests
+
+  def __str__(self):
+    return self.text
+
+  def matches(self, column, label, number=None):
+    '''
+      Tells if a label of a column passes the tests of that column.
+
+      Parameters:
+      column (str): the column name
+      label (str): the label, as written in the file
+      number (int): the menu number of the label, its position (from 1) in the order
+        the file lists the labels of the column
+    '''
+    return all(test(label, number) for test in self.tests.get(column, ()))
+
+  def row_ids(self, table):
+    '''
+      Finds the rows of a loaded table that pass the filter.
+
+      Returns:
+      numpy.ndarray: the row ids, in file order
+    '''
+    mask = np.ones(len(table), dtype=bool)
+    for column in self.tests:
+      labels = table.dictionaries[column]
+      allowed = np.fromiter((self.matches(column, label, number) for number, label in enumerate(labels, start=1)),
+                            dtype=bool, count=len(labels))
+      mask &= allowed[cube.code_array(table, column)]
+    return np.flatnonzero(mask)
+
+  def select(self, table):
+    '''
+      Returns the rows of a loaded table that pass the filter, in the same form as
+      VacancyTable.select().
+    '''
+    return [table.output_row(row_id) for row_id in self.row_ids(table).tolist()]
+
+  def scan(self, file_name):
+    '''
+      Returns the rows of a data file that pass the filter, reading the file once
+      without loading it, in the same form as VacancyTable.select().
+    '''
+    # The labels seen so far in each filtered column: raw bytes -> passes or not.
+    # Every column of every row is looked at, even after a test failed, so a label
+    # gets its menu number from the order of the whole file, as in a loaded table.
+    checks = [(COLUMN_POSITIONS[column], column, {}) for column in self.tests]
+    rows = []
+    for line in tokenizer.iter_lines(file_name):
+      fields = tokenizer.raw_fields(line)
+      if fields is None:
+        continue
+      kept = True
+      for position, column, seen in checks:
+        field = fields[position]
+        passes = seen.get(field)
+        if passes is None:
+          passes = seen[field] = self.matches(column, tokenizer.decode(field), len(seen) + 1)
+        kept = kept and passes
+      if kept:
+        rows.append([tokenizer.decode(fields[position]) for position in (
+            loader.REF_DATE_COLUMN, loader.GEO_COLUMN, loader.NOC_COLUMN,
+            loader.CHARACTERISTIC_COLUMN, loader.STATISTICS_COLUMN)]
+            + [loader.output_value(loader.parse_value(fields[loader.VALUE_COLUMN]))])
+    return rows
+
+
+def _tokenize(text):
+  '''
+    Cuts a filter into (kind, text) tokens, kind being 'label', 'symbol' or 'word'.
+  '''
+  tokens = []
+  position = 0
+  text = text.rstrip()
+  while position < len(text):
+    match = TOKEN_PATTERN.match(text, position)
+    if match is None:
+      raise FilterError(f"Cannot read the filter from: {text[position:].strip()}")
+    double_quoted, single_quoted, symbol, word = match.groups()
+    if double_quoted is not None:
+      tokens.append(('label', double_quoted.replace('""', '"')))
+    elif single_quoted is not None:
+      tokens.append(('label', single_quoted.replace("''", "'")))
+    elif symbol is not None:
+      tokens.append(('symbol', symbol))
+    else:
+      tokens.append(('word', word))
+    position = match.end()
+  return tokens
+
+
+def _date_bounds(value):
+  '''
+    Returns the first and last quarter of a REF_DATE value: a quarter, or a year.
+  '''
+  match = DATE_PATTERN.fullmatch(value)
+  if match is None:
+    raise FilterError(f"Invalid REF_DATE '{value}', expected a quarter (2023-01) or a year (2023)")
+  if match.group(2):
+    return value, value
+  return f"{value}-01", f"{value}-12"
+
+
+def _grade(value):
+  '''
+    Returns the position of a STATUS grade, 0 being the best.
+  '''
+  grade = value.upper()
+  if grade not in loader.STATUS_GRADES:
+    raise FilterError(f"Invalid STATUS grade '{value}', expected one of: {', '.join(loader.STATUS_GRADES)}")
+  return loader.STATUS_GRADES.index(grade)
+
+
+def _equal_test(column, value, quoted):
+  '''
+    Returns the test of "column = value".
+  '''
+  if column in MENU_COLUMNS and not quoted and value.isdigit():
+    number = int(value)
+    return lambda _label, position: position == number
+  if column == 'ref_date':
+    first, last = _date_bounds(value)
+    return lambda label, _position: first <= label <= last
+  if column == 'status' and not quoted:
+    value = value.upper()
+  if '*' in value:
+    pattern = re.compile('.*'.join(re.escape(part) for part in value.split('*')), re.DOTALL | re.IGNORECASE)
+    return lambda label, _position: pattern.fullmatch(label) is not None
+  return lambda label, _position: label == value
+
+
+def _order_test(column, symbol, value):
+  '''
+    Returns the test of "column <symbol> value", symbol being one of ORDER_OPERATORS.
+  '''
+  compare = ORDER_OPERATORS[symbol]
+  if column == 'ref_date':
+    first, last = _date_bounds(value)
+    # "ref_date <= 2023" keeps the whole of 2023, "ref_date < 2023" none of it
+    bound = first if symbol in ('<', '>=') else last
+    return lambda label, _position: compare(label, bound)
+  if column == 'status':
+    bound = _grade(value)
+    grades = {grade: position for position, grade in enumerate(loader.STATUS_GRADES)}
+    # A STATUS that is not a grade (e.g. empty) is neither better nor worse than one
+    return lambda label, _position: label in grades and compare(grades[label], bound)
+  raise FilterError(f"'{symbol}' only applies to {' and '.join(ORDERED_COLUMNS)}, not to {column}")
+
+
+def _any_test(tests, negate):
+  '''
+    Returns a test passing when any of 'tests' passes, or when none does if 'negate'.
+  '''
+  if negate:
+    return lambda label, position: not any(test(label, position) for test in tests)
+  return lambda label, position: any(test(label, position) for test in tests)
+
+
+class _Parser:
+  '''
+    Reads the conditions of a filter, one token at a time.
+  '''
+
+  def __init__(self, text):
+    self.tokens = _tokenize(text)
+    self.position = 0
+
+  def peek(self):
+    if self.position < len(self.tokens):
+      return self.tokens[self.position]
+    return ('end', '')
+
+  def take(self):
+    token = self.peek()
+    self.position += 1
+    return token
+
+  def keyword(self, word):
+    '''
+      Takes the next token if it is the (unquoted, any case) word given.
+    '''
+    kind, text = self.peek()
+    if kind == 'word' and text.lower() == word:
+      self.position += 1
+      return True
+    return False
+
+  def expect(self, kind, text, expected):
+    token = self.take()
+    if token != (kind, text):
+      raise FilterError(f"Expected {expected}, found {token[1] or 'the end of the filter'}")
+
+  def value(self):
+    '''
+      Returns the next value as (text, quoted).
+    '''
+    kind, text = self.take()
+    if kind not in ('label', 'word'):
+      raise FilterError(f"Expected a value, found {text or 'the end of the filter'}")
+    return text, kind == 'label'
+
+  def values(self):
+    '''
+      Returns the values of a "(value, ...)" list.
+    '''
+    self.expect('symbol', '(', "'(' after 'in'")
+    values = [self.value()]
+    while self.peek() == ('symbol', ','):
+      self.take()
+      values.append(self.value())
+    self.expect('symbol', ')', "',' or ')' in the list of values")
+    return values
+
+  def condition(self):
+    '''
+      Returns (column, test) for the next condition.
+    '''
+    kind, column = self.take()
+    column = column.lower()
+    if kind != 'word' or column not in COLUMN_POSITIONS:
+      raise FilterError(f"Unknown column '{column}', expected one of: {', '.join(COLUMN_POSITIONS)}")
+
+    if self.keyword('between'):
+      low, _ = self.value()
+      if not self.keyword('and'):
+        raise FilterError("Expected 'and' in 'between ... and ...'")
+      high, _ = self.value()
+      tests = [_order_test(column, '>=', low), _order_test(column, '<=', high)]
+      return column, lambda label, position: all(test(label, position) for test in tests)
+
+    negate = self.keyword('not')
+    if self.keyword('in'):
+      return column, _any_test([_equal_test(column, *value) for value in self.values()], negate)
+    if negate:
+      raise FilterError("Expected 'in' after 'not'")
+
+    kind, symbol = self.take()
+    if kind != 'symbol' or symbol not in ('=', '!=', *ORDER_OPERATORS):
+      raise FilterError(f"Expected an operator after {column}, found {symbol or 'the end of the filter'}")
+    if symbol in ORDER_OPERATORS:
+      return column, _order_test(column, symbol, self.value()[0])
+    return column, _any_test([_equal_test(column, *self.value())], symbol == '!=')
+
+  def conditions(self):
+    '''
+      Returns the tests of every condition, by column.
+    '''
+    tests = {}
+    while True:
+      column, test = self.condition()
+      tests.setdefault(column, []).append(test)
+      if self.peek()[0] == 'end':
+        return tests
+      if not self.keyword('and'):
+        raise FilterError(f"Expected 'and' between two conditions, found {self.peek()[1]}")
+
+
+def compile_filter(text):
+  '''
+    Compiles a filter, see the module summary.
+
+    Returns:
+    Filter: the compiled filter
+
+    Raises:
+    FilterError: when the filter cannot be read
+  '''
+  if not text or not text.strip():
+    raise FilterError("The filter is empty")
+  return Filter(text.strip(), _Parser(text).conditions())
+
+
+def select_rows(file_name, where):
+  '''
+    Finds the rows of a data file that pass a filter, in one pass over the loaded
+    table when there is one (in memory, in the cache or a Parquet or Arrow file),
+    otherwise over the file.
+
+    Parameters:
+    file_name (str): the path to the CSV file
+    where (str): the filter, or a Filter compiled already
+
+    Returns:
+    list: the rows, in file order, in the same form as VacancyTable.select()
+
+    Raises:
+    FilterError: when the filter cannot be read
+  '''
+  selected = where if isinstance(where, Filter) else compile_filter(where)
+  stat = os.stat(file_name)
+  with profiling.stage('select', file=os.path.basename(file_name)) as timer:
+    if loader.is_loaded(file_name) or loader.columnar_format(file_name) or (cache.enabled() and cache.fetch(file_name, stat) is not None):
+      rows = selected.select(loader.load_table(file_name))
+    else:
+      rows = selected.scan(file_name)
+    timer.count(len(rows))
+  return rows
+
+
+def main(argv):
+  '''
+    Writes the rows of the file given on the command line that pass the filter.
+  '''
+  if len(argv) != 3:
+    print("Usage: python -m vacancies.filters <file_name> <filter>")
+    return 1
+
+  try:
+    rows = select_rows(argv[1], argv[2])
+    output.write_rows(rows, output.open_sinks())
+  except FileNotFoundError:
+    print(f"File not found: {argv[1]}")
+    return 2
+  except ValueError as e:
+    print(f"Cannot select: {e}")
+    return 3
+  return 0
+
+
+if __name__ == "__main__":
+  profiling.configure()
+  sys.exit(main(sys.argv))
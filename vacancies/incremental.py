@@ -0,0 +1,525 @@
+'''
+incremental.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    StatCan publishes a new quarter every three months, and may revise the last few
+    quarters at the same time. This module applies such a release (a CSV file in the
+    StatCan layout with only the new and revised rows) to a data file, doing work
+    proportional to the release rather than to the whole history:
+
+      1. every row of the release is matched to the row of the data file with the same
+         REF_DATE, GEO, NOC, characteristic and statistic (the series its VECTOR /
+         COORDINATE names, at that quarter); only the rows of the quarters the release
+         holds are looked at, so a new quarter needs no lookup at all
+      2. a row with no match is added after the data, before the footnotes; a match
+         whose VALUE or STATUS differs is a revision and its line is rewritten in
+         place; an identical match is skipped
+      3. the data file is rewritten in place from the first changed byte on, so adding
+         a quarter only rewrites the footnotes; the old bytes from there on are first
+         saved to a journal (<data file>.journal), so a rewrite that fails or is cut
+         short is undone, at once or by recover_file() before the next release
+      4. the compact store of the file (see cache.py) gets the new rows appended and
+         the revised ones patched, by copying its columns as raw bytes
+      5. the row index (see index.py), and the cube and proportions of a file loaded in
+         this process (see cube.py and proportions.py), are updated from the changed
+         rows only
+
+    The store's content hash is not the SHA-256 hash of the new file but the hash of
+    the file's old content hash and the release's hash, so the file is not read again
+    to hash it; answers kept by results.py for the old version are not used for the
+    new one. A store whose file is only touched afterwards is parsed again, since the
+    file no longer hashes to it.
+
+    When the data file has a history of its vintages (see vintages.py), the release is
+    recorded in it as a new vintage.
+
+    Commandline Parameters (run as "python -m vacancies.incremental"):
+      argv[1] = path to the data file to update
+      argv[2] = path to the release file
+'''
+
+#
+#   Packages and modules
+#
+
+# 'array' builds the columns when the on-disk cache is turned off
+import array
+
+# 'csv' reads the release and writes its rows in the StatCan quoting
+import csv
+
+# 'contextlib' ignores a failed undo, which recover_file() then does later
+import contextlib
+
+# 'hashlib' derives the content hash of the updated file
+import hashlib
+
+# 'io' formats the rewritten lines
+import io
+
+# 'os' gives access to file sizes and timestamps and writes the journal safely
+import os
+
+# 'struct' packs the header of the journal
+import struct
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'time' measures how long an update takes
+import time
+
+# 'numpy' finds the rows of the quarters in the release and patches the columns
+import numpy as np
+
+# 'cache' writes the updated store
+from vacancies import cache
+
+# 'cube' updates the cube of a loaded file
+from vacancies import cube
+
+# 'index' finds the lines of revised rows and updates the row index
+from vacancies import index
+
+# 'loader' loads the data file and encodes the release with its codes
+from vacancies import loader
+
+# 'output' creates the temporary file the journal is written to
+from vacancies import output
+
+# 'profiling' times the update when profiling is on
+from vacancies import profiling
+
+# 'proportions' updates the shares of a loaded file
+from vacancies import proportions
+
+# 'results' gives the content hash of the file before the release
+from vacancies import results
+
+# 'vintages' records the release in the history of the file, when it has one
+from vacancies import vintages
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+
+#
+#  The columns that tell which row of the data file a release row stands for
+#
+KEY_COLUMNS = ('ref_date', 'geo', 'noc', 'characteristic', 'statistics')
+
+TAIL_BLOCK_SIZE = 64 * 1024
+COPY_BLOCK_SIZE = 1024 * 1024
+
+#
+#  The journal of a data file: its suffix, and the header in front of the old bytes
+#  (where they start in the data file, and the size of the data file before the rewrite)
+#
+JOURNAL_SUFFIX = '.journal'
+JOURNAL_HEADER = struct.Struct('<qq')
+
+
+class ReleaseSummary:
+  '''
+    What applying a release changed.
+
+    Attributes:
+    added (int): the number of rows added
+    revised (int): the number of rows whose VALUE or STATUS changed
+    unchanged (int): the number of release rows the data file already had
+    dates (list): the REF_DATE of every added or revised row, without repeats
+    vintage (dict): the vintage the release was recorded as (see vintages.py), or
+      None when the data file has no history
+  '''
+
+  def __init__(self, added, revised, unchanged, dates):
+    self.added = added
+    self.revised = revised
+    self.unchanged = unchanged
+    self.dates = dates
+    self.vintage = None
+
+
+def read_release(release_file):
+  '''
+    Reads the data rows of a release file, skipping its header and footnotes.
+  '''
+  # 'utf-8-sig' drops the byte order mark in front of the first header cell
+  with open(release_file, encoding='utf-8-sig', newline='') as csv_file:
+    return [row for row in csv.reader(csv_file) if loader.is_data_row(row)]
+
+
+def match_rows(table, release):
+  '''
+    Finds the row of 'table' each row of 'release' stands for.
+
+    Parameters:
+    table (VacancyTable): the data file
+    release (VacancyTable): the release, encoded with the codes of 'table'
+
+    Returns:
+    list: one row id of 'table' per release row, or None when there is no such row
+  '''
+  release_keys = list(zip(*(release.codes[column] for column in KEY_COLUMNS), strict=True))
+
+  # Only quarters 'table' already has can match; a new quarter has a code past its labels
+  known_dates = [code for code in set(release.codes['ref_date']) if code < len(table.dictionaries['ref_date'])]
+  if not known_dates:
+    return [None] * len(release_keys)
+
+  row_ids = np.flatnonzero(np.isin(cube.code_array(table, 'ref_date'), known_dates))
+  columns = [cube.code_array(table, column)[row_ids].tolist() for column in KEY_COLUMNS]
+  rows_by_key = dict(zip(zip(*columns, strict=True), row_ids.tolist(), strict=True))
+  return [rows_by_key.get(key) for key in release_keys]
+
+
+def _is_same(table, row_id, release, release_id):
+  if table.codes['status'][row_id] != release.codes['status'][release_id]:
+    return False
+  value, release_value = table.values[row_id], release.values[release_id]
+  return value == release_value or (value != value and release_value != release_value)
+
+
+def _format_line(row, ending):
+  text = io.StringIO()
+  csv.writer(text, quoting=csv.QUOTE_ALL, lineterminator=ending.decode('ascii')).writerow(row)
+  return text.getvalue().encode('utf-8')
+
+
+def _data_end(file_name):
+  '''
+    Finds where the data of a file ends, before the blank lines and footnotes.
+
+    Returns:
+    tuple: (offset just after the last data row, the line ending it uses)
+  '''
+  with open(file_name, 'rb') as data_file:
+    size = data_file.seek(0, os.SEEK_END)
+    block_size = TAIL_BLOCK_SIZE
+    while True:
+      start = max(0, size - block_size)
+      data_file.seek(start)
+      lines = data_file.read().splitlines(keepends=True)
+      # The first line of a block may be cut, unless the block starts the file
+      complete = lines if start == 0 else lines[1:]
+
+      offset = size
+      for line in reversed(complete):
+        row = next(csv.reader([line.decode('utf-8-sig')]), [])
+        if loader.is_data_row(row):
+          return offset, line[len(line.rstrip(b'\r\n')):]
+        offset -= len(line)
+
+      if start == 0:
+        # No data at all: add the rows after the header
+        return (len(lines[0]) if lines else 0), b'\r\n'
+      block_size *= 2
+
+
+def _revised_lines(row_index, release_rows, revised):
+  '''
+    Finds the lines of the revised rows through the row index of the data file.
+
+    Returns:
+    list: (offset, old length, new line) for every revised row
+  '''
+  edits = []
+  with open(row_index.file_name, 'rb') as data_file:
+    for release_id in revised:
+      row = release_rows[release_id]
+      key = (row[loader.NOC_COLUMN], row[loader.CHARACTERISTIC_COLUMN], row[loader.GEO_COLUMN])
+      for offset in row_index.row_offsets(*key):
+        data_file.seek(offset)
+        line = data_file.readline()
+        old_row = next(csv.reader([line.decode('utf-8')]))
+        if (old_row[loader.REF_DATE_COLUMN], old_row[loader.STATISTICS_COLUMN]) == \
+           (row[loader.REF_DATE_COLUMN], row[loader.STATISTICS_COLUMN]):
+          edits.append((offset, len(line), _format_line(row, line[len(line.rstrip(b'\r\n')):])))
+          break
+  return edits
+
+
+def _copy(source_file, target_file, length=None):
+  '''
+    Copies 'length' bytes, or the rest of the file for None, from one file to another
+    in blocks.
+  '''
+  while length is None or length > 0:
+    block = source_file.read(COPY_BLOCK_SIZE if length is None else min(COPY_BLOCK_SIZE, length))
+    if not block:
+      break
+    target_file.write(block)
+    if length is not None:
+      length -= len(block)
+
+
+def journal_path(file_name):
+  '''
+    Returns the path of the journal of a data file.
+  '''
+  return file_name + JOURNAL_SUFFIX
+
+
+def _write_journal(file_name, start):
+  '''
+    Saves the bytes of a file from 'start' on to its journal. The journal is written
+    to a temporary file that is renamed once it is on disk, so a journal that exists
+    is complete.
+  '''
+  descriptor, temporary_path = output.temporary_file(journal_path(file_name))
+  try:
+    with open(file_name, 'rb') as data_file, os.fdopen(descriptor, 'wb') as journal:
+      size = data_file.seek(0, os.SEEK_END)
+      journal.write(JOURNAL_HEADER.pack(start, size))
+      data_file.seek(start)
+      _copy(data_file, journal)
+      journal.flush()
+      os.fsync(journal.fileno())
+    os.replace(temporary_path, journal_path(file_name))
+  except BaseException:
+    output.remove_file(temporary_path)
+    raise
+
+
+def recover_file(file_name):
+  '''
+    Undoes a rewrite of a data file that failed or was cut short, by putting back the
+    bytes saved in its journal.
+
+    Returns:
+    bool: True when there was a rewrite to undo
+  '''
+  if not os.path.exists(journal_path(file_name)):
+    return False
+  with open(journal_path(file_name), 'rb') as journal, open(file_name, 'r+b') as data_file:
+    start, size = JOURNAL_HEADER.unpack(journal.read(JOURNAL_HEADER.size))
+    data_file.seek(start)
+    _copy(journal, data_file)
+    data_file.truncate(size)
+    data_file.flush()
+    os.fsync(data_file.fileno())
+  os.remove(journal_path(file_name))
+  return True
+
+
+def rewrite_file(file_name, edits):
+  '''
+    Replaces byte ranges of a file, rewriting it only from the first edit on. The old
+    bytes from there on are saved to the journal of the file first, and read back from
+    it in blocks as the new ones are written.
+
+    Parameters:
+    file_name (str): the file
+    edits (list): (offset, old length, new bytes), sorted by offset and not overlapping
+
+    Returns:
+    function: takes a NumPy array of old offsets of lines that were not replaced and
+    returns where those lines start now
+  '''
+  start = edits[0][0]
+  _write_journal(file_name, start)
+  try:
+    with open(journal_path(file_name), 'rb') as old_bytes, open(file_name, 'r+b') as data_file:
+      old_bytes.seek(JOURNAL_HEADER.size)
+      data_file.seek(start)
+      position = start
+      for offset, old_length, data in edits:
+        _copy(old_bytes, data_file, offset - position)
+        data_file.write(data)
+        old_bytes.seek(old_length, os.SEEK_CUR)
+        position = offset + old_length
+      _copy(old_bytes, data_file)
+      data_file.truncate()
+      data_file.flush()
+      os.fsync(data_file.fileno())
+  except BaseException:
+    # When the old bytes cannot be put back now, the journal keeps them for recover_file()
+    with contextlib.suppress(OSError):
+      recover_file(file_name)
+    raise
+  os.remove(journal_path(file_name))
+
+  edit_offsets = np.array([offset for offset, _, _ in edits], dtype=np.int64)
+  growth = np.cumsum([len(data) - old_length for _, old_length, data in edits])
+  growth = np.concatenate(([0], growth)).astype(np.int64)
+
+  def shift_offsets(offsets):
+    return offsets + growth[np.searchsorted(edit_offsets, offsets, side='left')]
+  return shift_offsets
+
+
+def _column_pieces(old_column, patches, added_column):
+  '''
+    Returns the bytes of an updated column: the old column, with 'patches' (row id
+    -> new value) applied to a copy when there are any, then the added rows.
+  '''
+  if patches:
+    old_column = np.frombuffer(old_column, dtype=np.dtype(memoryview(old_column).format)).copy()
+    old_column[list(patches)] = list(patches.values())
+  return [memoryview(old_column).cast('B'), memoryview(added_column).cast('B')]
+
+
+def update_table(file_name, table, release, revisions, added, digest):
+  '''
+    Builds the updated table of a data file and writes it to the on-disk cache.
+
+    Parameters:
+    file_name (str): the data file, already rewritten
+    table (VacancyTable): the table before the update
+    release (VacancyTable): the release, encoded with the codes of 'table'
+    revisions (dict): row id in 'table' -> release row id of every revised row
+    added (list): the release row ids of the added rows, in file order
+    digest (str): the content hash to store
+
+    Returns:
+    VacancyTable: the updated table
+  '''
+  codes = {}
+  for name, _ in loader.ENCODED_COLUMNS:
+    patches = {row_id: release.codes[name][release_id] for row_id, release_id in revisions.items()} if name == 'status' else {}
+    codes[name] = _column_pieces(table.codes[name], patches,
+                                 array.array(loader.CODE_TYPECODE, (release.codes[name][release_id] for release_id in added)))
+  value_patches = {row_id: release.values[release_id] for row_id, release_id in revisions.items()}
+  values = _column_pieces(table.values, value_patches,
+                          array.array(loader.VALUE_TYPECODE, (release.values[release_id] for release_id in added)))
+
+  length = len(table) + len(added)
+  dictionaries = release.dictionaries
+  if cache.enabled():
+    columns = [(name, loader.CODE_TYPECODE, length, codes[name]) for name, _ in loader.ENCODED_COLUMNS]
+    columns.append(('value', loader.VALUE_TYPECODE, length, values))
+    store_path = cache.cache_path(file_name)
+    cache.write_columns(store_path, cache.source_key(file_name, os.stat(file_name), digest), dictionaries, columns)
+    return loader.open_store(store_path)
+
+  def joined(typecode, pieces):
+    column = array.array(typecode)
+    for piece in pieces:
+      column.frombytes(piece)
+    return column
+
+  return loader.VacancyTable(
+      dictionaries,
+      {name: joined(loader.CODE_TYPECODE, codes[name]) for name, _ in loader.ENCODED_COLUMNS},
+      joined(loader.VALUE_TYPECODE, values))
+
+
+def _write_release(file_name, table, release_rows, release, revisions, added, digest, dates):
+  '''
+    Writes the added and revised rows of a release to a data file, then updates its
+    store, row index, cube and proportions, see the module summary.
+  '''
+  #
+  #  Rewrite the data file: revised lines in place, added lines after the data.
+  #  The revised lines are found through the row index, built if need be; an index
+  #  that is not there and not needed is left to be built when first used.
+  #
+  row_index = index.load_index(file_name, rebuild=bool(revisions))
+  edits = _revised_lines(row_index, release_rows, revisions.values()) if revisions else []
+  data_end, ending = _data_end(file_name)
+  added_lines = [_format_line(release_rows[release_id], ending or b'\r\n') for release_id in added]
+  if added_lines:
+    edits.append((data_end, 0, (b'' if ending else b'\r\n') + b''.join(added_lines)))
+  edits.sort(key=lambda edit: edit[0])
+  shift_offsets = rewrite_file(file_name, edits)
+
+  #
+  #  Update the store, then everything built from the old table
+  #
+  updated = update_table(file_name, table, release, revisions, added, digest)
+  loader.remember_table(file_name, updated)
+
+  changed_rows = list(revisions) + list(range(len(table), len(updated)))
+  old_cube = cube.built_cube(table)
+  new_cube = cube.update_cube(table, updated, changed_rows)
+  if new_cube is not None:
+    proportions.update_proportions(old_cube, new_cube, dates)
+
+  if row_index is not None:
+    first_added = int(shift_offsets(np.array([data_end], dtype=np.int64))[0]) + (0 if ending else len(b'\r\n'))
+    added_keys = []
+    for release_id, line in zip(added, added_lines, strict=True):
+      row = release_rows[release_id]
+      added_keys.append(((row[loader.NOC_COLUMN], row[loader.CHARACTERISTIC_COLUMN], row[loader.GEO_COLUMN]), first_added))
+      first_added += len(line)
+    index.update_index(row_index, shift_offsets, added_keys,
+                       [release_rows[release_id][loader.STATISTICS_COLUMN] for release_id in added])
+
+
+def apply_release(file_name, release_file, vintage_name=None):
+  '''
+    Applies a release to a data file, see the module summary. A rewrite of the file
+    left unfinished by an earlier release is undone first.
+
+    Parameters:
+    file_name (str): the data file to update
+    release_file (str): the release, in the StatCan layout
+    vintage_name (str): the name of the vintage the release is recorded as, when the
+      data file has a history; by default the time it is recorded
+
+    Returns:
+    ReleaseSummary: what changed
+  '''
+  file_name = os.path.abspath(file_name)
+  recover_file(file_name)
+  table = loader.load_table(file_name)
+  old_digest = results.file_version(file_name)
+
+  with profiling.stage('release', file=os.path.basename(file_name)) as timer:
+    release_rows = read_release(release_file)
+    release = loader.encode_rows(release_rows, table.dictionaries)
+    timer.count(len(release_rows))
+
+    revisions = {}
+    added = []
+    unchanged = 0
+    for release_id, row_id in enumerate(match_rows(table, release)):
+      if row_id is None:
+        added.append(release_id)
+      elif _is_same(table, row_id, release, release_id):
+        unchanged += 1
+      else:
+        revisions[row_id] = release_id
+    dates = list(dict.fromkeys(release_rows[release_id][loader.REF_DATE_COLUMN]
+                               for release_id in added + list(revisions.values())))
+    summary = ReleaseSummary(len(added), len(revisions), unchanged, dates)
+    if added or revisions:
+      digest = hashlib.sha256(f"{old_digest}+{cache.file_digest(release_file)}".encode('utf-8')).hexdigest()
+      _write_release(file_name, table, release_rows, release, revisions, added, digest, dates)
+
+  if vintages.has_history(file_name):
+    summary.vintage = vintages.record_release(file_name, release_file, vintage_name)
+  return summary
+
+
+def main(argv):
+  '''
+    Applies the release given on the command line and reports what changed.
+  '''
+  if len(argv) != 3:
+    print("Usage: python -m vacancies.incremental <data_file> <release_file>")
+    return 1
+
+  started = time.perf_counter()
+  try:
+    summary = apply_release(argv[1], argv[2])
+  except FileNotFoundError as e:
+    print(f"File not found: {e.filename}")
+    return 2
+  elapsed = time.perf_counter() - started
+
+  print(f"{summary.added} rows added, {summary.revised} revised, {summary.unchanged} unchanged "
+        f"({', '.join(summary.dates) or 'no quarter changed'}) in {elapsed:.3f} s")
+  if summary.vintage is not None:
+    print(f"Recorded vintage '{summary.vintage['name']}' with {summary.vintage['records']} changed figure(s)")
+  return 0
+
+
+if __name__ == "__main__":
+  profiling.configure()
+  sys.exit(main(sys.argv))
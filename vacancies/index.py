@@ -0,0 +1,296 @@
+'''
+index.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    A selection (one NOC and one job vacancy characteristic) matches a handful of rows
+    of a data file, one per quarter and GEO. This module builds, next to each data file,
+    an index file (<data file>.idx) mapping every (NOC, characteristic, GEO) key to the
+    byte offsets of its rows. A selection then reads only its own rows, seeking
+    straight to them, instead of parsing the whole file.
+
+    The index uses the store format of cache.py: the keys (and the statistics of the
+    file) are kept in the header and the offsets in one array, grouped by key. It is
+    rebuilt automatically when the data file's size or modification time changes. The
+    index is only a speed-up: when it cannot be written (e.g. the folder of the data
+    file is read-only), the index built in memory is used for this process only.
+
+    A selection read through the index gives the same rows, in the same order, as
+    one sliced from the cube of the loaded file (see cube.py): only the rows of the
+    statistic the cube holds, GEO by GEO in the order of the file, each GEO in date
+    order. Callers line the rows up with the shares of the cube by position.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'array' holds the offsets while the index is built
+import array
+
+# 'os' gives access to file sizes and timestamps
+import os
+
+# 'numpy' regroups the offsets when an index is updated
+import numpy as np
+
+# 'cache' reads and writes the index in its store format
+from vacancies import cache
+
+# 'cube' slices files that are already loaded
+from vacancies import cube
+
+# 'loader' knows the layout of a StatCan row
+from vacancies import loader
+
+# 'profiling' times building the index and the selections when profiling is on
+from vacancies import profiling
+
+# 'tokenizer' reads only the fields of a row that are needed
+from vacancies import tokenizer
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+INDEX_SUFFIX = '.idx'
+OFFSET_TYPECODE = 'Q'
+
+#
+#  Fields read back for each indexed row, in the order of VacancyTable.select()
+#
+ROW_COLUMNS = (loader.REF_DATE_COLUMN, loader.GEO_COLUMN, loader.NOC_COLUMN,
+               loader.CHARACTERISTIC_COLUMN, loader.STATISTICS_COLUMN, loader.VALUE_COLUMN)
+STATISTICS_FIELD = ROW_COLUMNS.index(loader.STATISTICS_COLUMN)
+
+
+class RowIndex:
+  '''
+    The byte offsets of the rows of a data file, by (NOC, characteristic, GEO).
+
+    Attributes:
+    file_name (str): the data file
+    keys (list): the (NOC, characteristic, GEO) keys, in the order first seen in the file
+    statistics (list): the Statistics labels of the file, in the order first seen
+    starts (sequence): the offsets of key number k are offsets[starts[k]:starts[k + 1]]
+    offsets (sequence): the byte offsets of the rows, grouped by key
+  '''
+
+  def __init__(self, file_name, keys, statistics, starts, offsets):
+    self.file_name = file_name
+    self.keys = [tuple(key) for key in keys]
+    self.statistics = list(statistics)
+    self.starts = starts
+    self.offsets = offsets
+
+    # The GEOs in the order first seen in the file: the first key of a GEO is
+    # always the first row of that GEO
+    geo_order = {geo: position for position, geo in enumerate(dict.fromkeys(key[2] for key in self.keys))}
+
+    # The key numbers of every (NOC, characteristic), one per GEO, in GEO order
+    self._selections = {}
+    for number, (noc, characteristic, _) in enumerate(self.keys):
+      self._selections.setdefault((noc, characteristic), []).append(number)
+    for numbers in self._selections.values():
+      numbers.sort(key=lambda number: geo_order[self.keys[number][2]])
+
+  def row_offsets(self, noc, characteristic, geo=None):
+    '''
+      Returns the byte offsets of the rows of one selection, GEO by GEO in the order
+      of the file, in file order within each GEO.
+    '''
+    offsets = []
+    for number in self._selections.get((noc, characteristic), []):
+      if geo is None or self.keys[number][2] == geo:
+        offsets.extend(self.offsets[self.starts[number]:self.starts[number + 1]])
+    return offsets
+
+  def rows(self, noc, characteristic, geo=None):
+    '''
+      Reads the rows of one selection from the data file, in the same form and order
+      as VacancyCube.rows(): [ref date, geo, NOC, characteristic, statistics, value],
+      only for the statistic of the cube (see cube.default_statistics()), GEO by GEO
+      and in date order within each GEO.
+    '''
+    statistics = cube.default_statistics(self.statistics)
+    rows = []
+    with open(self.file_name, 'rb') as data_file:
+      for number in self._selections.get((noc, characteristic), []):
+        if geo is not None and self.keys[number][2] != geo:
+          continue
+        geo_rows = []
+        for offset in self.offsets[self.starts[number]:self.starts[number + 1]]:
+          data_file.seek(offset)
+          row = tokenizer.fields(data_file.readline(), ROW_COLUMNS)
+          if row[STATISTICS_FIELD] == statistics:
+            row[-1] = loader.output_value(loader.parse_value(row[-1]))
+            geo_rows.append(row)
+        # A stable sort, so rows of the same quarter keep their file order
+        geo_rows.sort(key=lambda row: row[0])
+        rows.extend(geo_rows)
+    return rows
+
+
+def index_path(file_name):
+  '''
+    Returns the path of the index file of a data file.
+  '''
+  return file_name + INDEX_SUFFIX
+
+
+def _write_index(file_name, stat, keys, statistics, starts, offset_pieces):
+  '''
+    Writes the index file of a data file and returns the index mapped from it. When
+    the file cannot be written, the index is kept in memory instead, like cache.store()
+    does with tables.
+
+    Parameters:
+    starts (array): the start of the offsets of each key, see RowIndex
+    offset_pieces (list): the offsets, as arrays of OFFSET_TYPECODE in key order
+  '''
+  try:
+    cache.write_columns(index_path(file_name), cache.source_key(file_name, stat, None),
+                        {'keys': keys, 'statistics': statistics}, [
+                            ('starts', OFFSET_TYPECODE, len(starts), [memoryview(starts).cast('B')]),
+                            ('offsets', OFFSET_TYPECODE, int(starts[-1]), [memoryview(piece).cast('B') for piece in offset_pieces]),
+                        ])
+  except OSError:
+    offsets = array.array(OFFSET_TYPECODE)
+    for piece in offset_pieces:
+      offsets.frombytes(memoryview(piece).cast('B'))
+    return RowIndex(file_name, keys, statistics, starts, offsets)
+  return load_index(file_name, rebuild=False)
+
+
+def build_index(file_name):
+  '''
+    Scans a data file once and writes its index file.
+
+    Parameters:
+    file_name (str): the path to the CSV file
+
+    Returns:
+    RowIndex: the new index
+  '''
+  stat = os.stat(file_name)
+
+  # Keyed by the raw bytes of the key fields; they are decoded once per key at the end
+  key_offsets = {}
+  raw_statistics = {}
+
+  with profiling.stage('index', file=os.path.basename(file_name)) as timer:
+    offset = 0
+    for line in tokenizer.iter_lines(file_name):
+      fields = tokenizer.raw_fields(line)
+      if fields is not None:
+        key = (fields[loader.NOC_COLUMN], fields[loader.CHARACTERISTIC_COLUMN], fields[loader.GEO_COLUMN])
+        offsets = key_offsets.get(key)
+        if offsets is None:
+          offsets = key_offsets[key] = array.array(OFFSET_TYPECODE)
+        offsets.append(offset)
+        raw_statistics[fields[loader.STATISTICS_COLUMN]] = None
+      offset += len(line)
+    timer.count(sum(len(offsets) for offsets in key_offsets.values()))
+
+  raw_keys = list(key_offsets)
+  keys = [tuple(tokenizer.decode(field) for field in key) for key in raw_keys]
+  statistics = [tokenizer.decode(field) for field in raw_statistics]
+  starts = array.array(OFFSET_TYPECODE, [0])
+  for key in raw_keys:
+    starts.append(starts[-1] + len(key_offsets[key]))
+
+  return _write_index(file_name, stat, keys, statistics, starts, [key_offsets[key] for key in raw_keys])
+
+
+def update_index(row_index, shift_offsets, added, statistics=()):
+  '''
+    Rewrites the index of a data file after some of its rows were rewritten in
+    place and others added after the data (see incremental.py), without scanning
+    the file again.
+
+    Parameters:
+    row_index (RowIndex): the index before the update
+    shift_offsets (function): takes a NumPy array of old offsets and returns where
+      those rows start now
+    added (list): (key, offset) of every added row, in file order, the key being
+      (NOC, characteristic, GEO)
+    statistics (iterable): the Statistics labels of the added rows
+
+    Returns:
+    RowIndex: the new index
+  '''
+  file_name = row_index.file_name
+  stat = os.stat(file_name)
+  keys = list(row_index.keys)
+  numbers = {key: number for number, key in enumerate(keys)}
+
+  starts = np.frombuffer(row_index.starts, dtype=np.uint64).astype(np.int64)
+  key_numbers = [np.repeat(np.arange(len(keys)), np.diff(starts))]
+  offsets = [shift_offsets(np.frombuffer(row_index.offsets, dtype=np.uint64).astype(np.int64))]
+
+  added_numbers = []
+  for key, _ in added:
+    key = tuple(key)
+    if key not in numbers:
+      numbers[key] = len(keys)
+      keys.append(key)
+    added_numbers.append(numbers[key])
+  key_numbers.append(np.array(added_numbers, dtype=np.int64))
+  offsets.append(np.array([offset for _, offset in added], dtype=np.int64))
+
+  #
+  #  Group the offsets by key again; the sort is stable and the added rows come
+  #  after the others in the file, so every key keeps its rows in file order
+  #
+  key_numbers = np.concatenate(key_numbers)
+  order = np.argsort(key_numbers, kind='stable')
+  offsets = np.concatenate(offsets)[order].astype(np.uint64)
+  starts = np.concatenate(([0], np.cumsum(np.bincount(key_numbers, minlength=len(keys))))).astype(np.uint64)
+
+  statistics = list(dict.fromkeys(list(row_index.statistics) + list(statistics)))
+  return _write_index(file_name, stat, keys, statistics, starts, [offsets])
+
+
+def load_index(file_name, rebuild=True):
+  '''
+    Opens the index file of a data file, building or rebuilding it if it is missing
+    or older than the data file.
+
+    Parameters:
+    file_name (str): the path to the CSV file
+    rebuild (bool): False to return None instead of building the index
+
+    Returns:
+    RowIndex: the index of the file
+  '''
+  stat = os.stat(file_name)
+  stored = cache.read_store(index_path(file_name))
+  if stored is not None:
+    key, dictionaries, arrays, _ = stored
+    # An index written before the statistics were kept in it is built again
+    if key['size'] == stat.st_size and key['mtime_ns'] == stat.st_mtime_ns and 'statistics' in dictionaries:
+      return RowIndex(file_name, dictionaries['keys'], dictionaries['statistics'], arrays['starts'], arrays['offsets'])
+  if not rebuild:
+    return None
+  return build_index(file_name)
+
+
+def select_rows(file_name, noc, characteristic, geo=None):
+  '''
+    Returns the rows of one selection. A file already loaded in this process, or a
+    Parquet or Arrow file (see columnar.py), is sliced from its cube (see cube.py);
+    any other file is read through its index, so only the selected rows are parsed.
+
+    Returns:
+    list: one [ref date, geo, NOC, characteristic, statistics, value] row per match
+  '''
+  with profiling.stage('select') as timer:
+    if loader.is_loaded(file_name) or loader.columnar_format(file_name):
+      rows = cube.load_cube(file_name).rows(noc, characteristic, geo)
+    else:
+      rows = load_index(file_name).rows(noc, characteristic, geo)
+    timer.count(len(rows))
+  return rows
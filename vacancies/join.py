@@ -0,0 +1,283 @@
+'''
+join.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Each question is answered from its own data file, but the files share their
+    quarters (REF_DATE), geographies (GEO) and occupations (NOC). This module joins
+    characteristics of several questions on (REF_DATE, GEO, NOC), e.g. the social media
+    recruitment share of question 1 next to the "less than 15 days" share of question
+    4, for the same occupation and quarter, in one call.
+
+    The join works on the cubes of the loaded files (see cube.py and proportions.py),
+    so a file already in memory is not read again: every characteristic is lined up
+    on the joined axes with one NumPy gather.
+
+    A column of the join is written "<question>:<characteristic>", the characteristic
+    being its menu number or its label, e.g. "1:6" or "4:Less than 15 days".
+
+    Commandline Parameters (run as "python -m vacancies.join"):
+      <column> ...     the columns to join, at least one
+      --noc <choice>   keep one NOC, by menu number or label (default: every NOC)
+      --geo <label>    keep one geography (default: every geography)
+      --outer          keep the keys some files lack, with empty values, instead of
+                       only the keys every file has
+      The rows are written through the sinks of VACANCIES_OUTPUT (see output.py).
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'numpy' lines the cubes up on the joined axes
+import numpy as np
+
+# 'batch' turns menu numbers into labels the way batch mode does
+from vacancies import batch
+
+# 'cube' gives the values of every loaded file
+from vacancies import cube
+
+# 'loader' turns stored values back into the numbers written in the file
+from vacancies import loader
+
+# 'output' writes the joined rows
+from vacancies import output
+
+# 'parallel' loads the files that are not in memory yet
+from vacancies import parallel
+
+# 'profiling' times the join when profiling is on
+from vacancies import profiling
+
+# 'proportions' gives the share of its total of every value
+from vacancies import proportions
+
+# 'registry' gives the data file and the choices of each question
+from vacancies import registry
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+KEY_AXES = ('ref_date', 'geo', 'noc')
+KEY_HEADER = ["Ref Date", "Geo", "National Occupation Classification"]
+JOIN_TYPES = ('inner', 'outer')
+
+
+class JoinColumn:
+  '''
+    One characteristic of one question, as a column of a join.
+
+    Attributes:
+    question (registry.Question): the question whose data file holds it
+    characteristic (str): the characteristic, as written in the data file
+  '''
+
+  def __init__(self, question, characteristic):
+    self.question = question
+    self.characteristic = characteristic
+
+  @property
+  def name(self):
+    return f"Q{self.question.number}: {self.characteristic}"
+
+
+class JoinedSeries:
+  '''
+    The values and shares of several columns, lined up on the same axes.
+
+    Attributes:
+    columns (list): the JoinColumns, in order
+    labels (dict): 'geo', 'noc' and 'ref_date' -> the labels of the joined axes
+    values (numpy.ndarray): float64, shaped (column, GEO, NOC, REF_DATE), NaN where missing
+    shares (numpy.ndarray): the share of its total of each value, shaped like 'values'
+  '''
+
+  def __init__(self, columns, labels, values, shares):
+    self.columns = columns
+    self.labels = labels
+    self.values = values
+    self.shares = shares
+
+  def header(self):
+    '''
+      Returns the names of the columns of rows().
+    '''
+    names = []
+    for column in self.columns:
+      names += [column.name, f"{column.name} (proportion)"]
+    return KEY_HEADER + names
+
+  def rows(self, noc=None, geo=None):
+    '''
+      Returns the joined rows: [ref date, geo, NOC, then the value and the share of
+      each column], one per key, missing numbers as None.
+
+      Parameters:
+      noc (str): keep one NOC, or None for every NOC
+      geo (str): keep one geography, or None for every geography
+
+      Returns:
+      list: the rows, by geography, NOC and date
+    '''
+    positions = {}
+    for axis, label in (('geo', geo), ('noc', noc)):
+      if label is None:
+        positions[axis] = range(len(self.labels[axis]))
+      else:
+        positions[axis] = [self.labels[axis].index(label)] if label in self.labels[axis] else []
+
+    rows = []
+    for geo_position in positions['geo']:
+      for noc_position in positions['noc']:
+        values = self.values[:, geo_position, noc_position, :]
+        shares = self.shares[:, geo_position, noc_position, :]
+        for date_position, date in enumerate(self.labels['ref_date']):
+          row = [date, self.labels['geo'][geo_position], self.labels['noc'][noc_position]]
+          for value, share in zip(values[:, date_position], shares[:, date_position], strict=True):
+            row += [loader.output_value(value), None if np.isnan(share) else round(float(share), 6)]
+          rows.append(row)
+    return rows
+
+
+def parse_column(spec):
+  '''
+    Turns a "<question>:<characteristic>" column spec into a JoinColumn.
+
+    Raises:
+    ValueError: when the spec, the question or the characteristic is not valid
+  '''
+  number, separator, characteristic = str(spec).partition(':')
+  if not separator or not number.strip().isdigit() or not characteristic.strip():
+    raise ValueError(f"Invalid column '{spec}', expected <question>:<characteristic>")
+  question = registry.get_question(int(number))
+  characteristic = batch.resolve_choice(characteristic.strip(), question.choices('characteristic'))
+  if characteristic not in question.choices('characteristic').values():
+    raise ValueError(f"Question {question.number} has no characteristic '{characteristic}'")
+  return JoinColumn(question, characteristic)
+
+
+def _joined_labels(cubes, axis, how):
+  '''
+    Returns the labels of one joined axis: those of every cube for an inner join,
+    those of any cube for an outer join, in the order the files list them.
+  '''
+  labels = dict.fromkeys(label for data_cube in cubes for label in data_cube.labels[axis])
+  if how == 'inner':
+    labels = [label for label in labels if all(data_cube.index(axis, label) is not None for data_cube in cubes)]
+  labels = list(labels)
+  return sorted(labels) if axis == 'ref_date' else labels
+
+
+def _gather(array, data_cube, characteristic, labels):
+  '''
+    Takes one characteristic of a cube-shaped array onto the joined axes, NaN where
+    the cube has no such label.
+  '''
+  geo, noc, date = (np.array([-1 if data_cube.index(axis, label) is None else data_cube.index(axis, label)
+                              for label in labels[axis]], dtype=np.intp)
+                    for axis in ('geo', 'noc', 'ref_date'))
+  gathered = array[:, :, characteristic, :][np.ix_(np.maximum(geo, 0), np.maximum(noc, 0), np.maximum(date, 0))]
+  gathered[(geo < 0)[:, None, None] | (noc < 0)[None, :, None] | (date < 0)[None, None, :]] = np.nan
+  return gathered
+
+
+def join(columns, how='inner'):
+  '''
+    Joins several columns on (REF_DATE, GEO, NOC).
+
+    Parameters:
+    columns (list): JoinColumns, or "<question>:<characteristic>" specs
+    how (str): 'inner' keeps the keys every file has, 'outer' the keys any file has
+
+    Returns:
+    JoinedSeries: the lined up values and shares
+
+    Raises:
+    ValueError: when there is no column, a column is not valid or 'how' is unknown
+  '''
+  if how not in JOIN_TYPES:
+    raise ValueError(f"Unknown join '{how}', use one of: {', '.join(JOIN_TYPES)}")
+  columns = [column if isinstance(column, JoinColumn) else parse_column(column) for column in columns]
+  if not columns:
+    raise ValueError("Nothing to join, give at least one column")
+
+  # Files already in memory are used as they are; the others are loaded together
+  parallel.load_tables([column.question.data_file for column in columns])
+
+  with profiling.stage('join', columns=len(columns)):
+    cubes = [cube.load_cube(column.question.data_file) for column in columns]
+    labels = {axis: _joined_labels(cubes, axis, how) for axis in KEY_AXES}
+
+    shape = (len(columns), len(labels['geo']), len(labels['noc']), len(labels['ref_date']))
+    values = np.full(shape, np.nan)
+    shares = np.full(shape, np.nan)
+    for position, (column, data_cube) in enumerate(zip(columns, cubes, strict=True)):
+      characteristic = data_cube.index('characteristic', column.characteristic)
+      computed = proportions.load_proportions(column.question.data_file, column.question.total_label)
+      values[position] = _gather(data_cube.values, data_cube, characteristic, labels)
+      shares[position] = _gather(computed.shares, data_cube, characteristic, labels)
+
+  return JoinedSeries(columns, labels, values, shares)
+
+
+def join_query(columns, noc=None, geo=None, how='inner'):
+  '''
+    Answers a join query, in a form that can be written as JSON.
+
+    Parameters:
+    columns (list): "<question>:<characteristic>" specs
+    noc (str): keep one NOC, by menu number or label, or None for every NOC
+    geo (str): keep one geography, or None for every geography
+    how (str): 'inner' or 'outer', see join()
+
+    Returns:
+    dict: the header and the rows, see JoinedSeries.rows()
+  '''
+  joined = join(columns, how)
+  if noc is not None:
+    noc = batch.resolve_choice(noc, dict(enumerate(joined.labels['noc'], start=1)))
+  return {
+      'columns': [column.name for column in joined.columns],
+      'header': joined.header(),
+      'rows': joined.rows(noc, geo),
+  }
+
+
+def main(argv):
+  '''
+    Joins the columns given on the command line and writes the rows.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.join',
+                                   description='Join characteristics of several questions on (REF_DATE, GEO, NOC).')
+  parser.add_argument('columns', nargs='+', help='<question>:<characteristic>, e.g. 1:6')
+  parser.add_argument('--noc', help='NOC menu number or label (default: every NOC)')
+  parser.add_argument('--geo', help='geography (default: every geography)')
+  parser.add_argument('--outer', action='store_true', help='keep the keys some files lack')
+  arguments = parser.parse_args(argv[1:])
+
+  try:
+    answer = join_query(arguments.columns, arguments.noc, arguments.geo, 'outer' if arguments.outer else 'inner')
+    output.write_rows(answer['rows'], output.open_sinks(header=answer['header']))
+  except FileNotFoundError as e:
+    print(f"File not found: {e.filename}")
+    return 2
+  except ValueError as e:
+    print(f"Cannot join: {e}")
+    return 3
+  return 0
+
+
+if __name__ == "__main__":
+  profiling.configure()
+  sys.exit(main(sys.argv))
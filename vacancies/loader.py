@@ -0,0 +1,401 @@
+'''
+loader.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This module reads one of the StatCan job vacancy CSV files (dataFiles/*.csv) a single
+    time and keeps it in memory as a columnar, dictionary-encoded table:
+
+      - every text column we care about (REF_DATE, GEO, National Occupational Classification,
+        Job vacancy characteristics, Statistics and STATUS) is stored as an array of integer
+        codes plus a list of the distinct labels those codes refer to
+      - the VALUE column is stored as an array of floats, with NaN marking empty cells
+
+    The question scripts call load_table() and then filter the table with integer
+    comparisons instead of comparing strings on every row of the file. Tables are
+    remembered per file, so asking several questions of the same file in one process
+    only parses it once.
+
+    A table written as a Parquet or Arrow IPC file (see columnar.py) is read back
+    from that file instead of being parsed: load_table() takes such a file wherever
+    it takes a CSV file.
+'''
+
+#
+#   Packages and modules
+#
+
+# The 'array' module gives us compact, typed arrays for the columns
+import array
+
+# The 'math' module is used to recognise missing (NaN) values
+import math
+
+# The 'os' module is used to build absolute paths and check file timestamps
+import os
+
+# The 'cache' module keeps parsed tables on disk between runs
+from vacancies import cache
+
+# The 'profiling' module times the parsing when profiling is on
+from vacancies import profiling
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+
+#
+#  Positions of the fields we use in a StatCan row
+#
+REF_DATE_COLUMN = 0
+GEO_COLUMN = 1
+NOC_COLUMN = 3
+CHARACTERISTIC_COLUMN = 4
+STATISTICS_COLUMN = 5
+VECTOR_COLUMN = 10
+COORDINATE_COLUMN = 11
+VALUE_COLUMN = 12
+STATUS_COLUMN = 13
+
+#
+#  Text columns that are dictionary-encoded, in the order they are stored,
+#  with the position of each one in a StatCan row
+#
+ENCODED_COLUMNS = (
+    ('ref_date', REF_DATE_COLUMN),
+    ('geo', GEO_COLUMN),
+    ('noc', NOC_COLUMN),
+    ('characteristic', CHARACTERISTIC_COLUMN),
+    ('statistics', STATISTICS_COLUMN),
+    ('status', STATUS_COLUMN),
+)
+
+#
+#  The quality grades of the STATUS column, from best to worst: A (excellent) to
+#  F (too unreliable to be published)
+#
+STATUS_GRADES = ('A', 'B', 'C', 'D', 'E', 'F')
+
+#
+#  Typecodes used for the code columns and for the VALUE column
+#
+CODE_TYPECODE = 'i'
+VALUE_TYPECODE = 'd'
+
+#
+#  Header printed / written by the question scripts for each matched row
+#
+OUTPUT_HEADER = ["Ref Date", "Geo", "National Occupation Classification", "Recruitment Strategy", "Statistics", "Value"]
+
+#
+#  Files at least this big are read by streaming.py in chunks rather than all at once
+#
+STREAMING_THRESHOLD = 64 * 1024 * 1024
+
+#
+#  Files holding a table already, by suffix, and the format they are in (Feather
+#  files are Arrow IPC files)
+#
+COLUMNAR_SUFFIXES = {'.parquet': 'parquet', '.arrow': 'arrow', '.feather': 'arrow'}
+
+#
+#  Tables already loaded in this process, keyed by absolute path
+#
+_loaded_tables = {}
+
+
+class VacancyTable:
+  '''
+    A parsed StatCan file held column by column.
+
+    Attributes:
+    dictionaries (dict): column name -> list of the distinct labels in that column
+    codes (dict): column name -> array of integer codes, one per row
+    values (array): the VALUE column as floats, NaN where the cell was empty
+  '''
+
+  def __init__(self, dictionaries, codes, values):
+    self.dictionaries = dictionaries
+    self.codes = codes
+    self.values = values
+
+    # Reverse lookups from label to code, one per encoded column
+    self._code_lookup = {
+        name: {label: code for code, label in enumerate(labels)}
+        for name, labels in dictionaries.items()
+    }
+
+  def __len__(self):
+    return len(self.values)
+
+  def code(self, column, label):
+    '''
+      Returns the integer code of 'label' in 'column', or None when the
+      label never appears in the file.
+    '''
+    return self._code_lookup[column].get(label)
+
+  def label(self, column, row_id):
+    '''
+      Returns the text of 'column' for the row 'row_id'.
+    '''
+    return self.dictionaries[column][self.codes[column][row_id]]
+
+  def value(self, row_id):
+    '''
+      Returns the VALUE of a row as an int when it is a whole number, a float
+      otherwise, or None when the cell was empty in the file.
+    '''
+    return output_value(self.values[row_id])
+
+  def filter(self, **criteria):
+    '''
+      Finds the rows matching every 'column=label' pair given.
+
+      Parameters:
+      criteria: column names from ENCODED_COLUMNS mapped to the label wanted
+
+      Returns:
+      list: the matching row ids, in file order
+    '''
+    row_ids = None
+    for column, label in criteria.items():
+      code = self.code(column, label)
+
+      # A label that is not in the file cannot match anything
+      if code is None:
+        return []
+
+      column_codes = self.codes[column]
+      if row_ids is None:
+        row_ids = [row_id for row_id, row_code in enumerate(column_codes) if row_code == code]
+      else:
+        row_ids = [row_id for row_id in row_ids if column_codes[row_id] == code]
+
+    if row_ids is None:
+      return list(range(len(self)))
+    return row_ids
+
+  def output_row(self, row_id):
+    '''
+      Builds the row the question scripts print, in the order of OUTPUT_HEADER.
+    '''
+    return [
+        self.label('ref_date', row_id),
+        self.label('geo', row_id),
+        self.label('noc', row_id),
+        self.label('characteristic', row_id),
+        self.label('statistics', row_id),
+        self.value(row_id),
+    ]
+
+  def select(self, **criteria):
+    '''
+      Same as filter(), but returns the rows themselves in the order of OUTPUT_HEADER.
+    '''
+    return [self.output_row(row_id) for row_id in self.filter(**criteria)]
+
+
+def output_value(value):
+  '''
+    Converts a stored VALUE back to what was written in the file: an int for a
+    whole number, a float otherwise, or None for an empty cell.
+  '''
+  value = float(value)
+  if math.isnan(value):
+    return None
+  if value.is_integer():
+    return int(value)
+  return value
+
+
+def parse_value(text):
+  '''
+    Converts the text (or the raw bytes) of a VALUE cell to a float, using NaN for an
+    empty cell or one that is not a number, e.g. the '..' or 'x' some StatCan tables
+    write for a figure that is not available.
+  '''
+  if not text:
+    return math.nan
+  try:
+    return float(text)
+  except ValueError:
+    return math.nan
+
+
+def is_data_row(row):
+  '''
+    Tells if a parsed CSV row is a data row, as opposed to the header, a blank
+    line or one of the footnote lines StatCan adds at the end of a download.
+  '''
+  return len(row) > STATUS_COLUMN and row[REF_DATE_COLUMN] != 'REF_DATE'
+
+
+def encode_rows(rows, dictionaries=None):
+  '''
+    Builds a VacancyTable from parsed CSV rows, skipping anything that is not a
+    data row.
+
+    Parameters:
+    rows (iterable): the rows, as lists of fields
+    dictionaries (dict): labels that already have a code, e.g. those of a table the
+      rows are added to (see incremental.py); the new table keeps their codes and
+      gives new labels the next ones. They are copied, not changed.
+
+    Returns:
+    VacancyTable: the encoded rows.
+  '''
+  dictionaries = {name: list((dictionaries or {}).get(name, [])) for name, _ in ENCODED_COLUMNS}
+  lookups = {name: {label: code for code, label in enumerate(dictionaries[name])} for name, _ in ENCODED_COLUMNS}
+  codes = {name: array.array(CODE_TYPECODE) for name, _ in ENCODED_COLUMNS}
+  values = array.array(VALUE_TYPECODE)
+
+  for row in rows:
+    if not is_data_row(row):
+      continue
+
+    for name, position in ENCODED_COLUMNS:
+      label = row[position]
+      lookup = lookups[name]
+      code = lookup.get(label)
+      if code is None:
+        code = len(lookup)
+        lookup[label] = code
+        dictionaries[name].append(label)
+      codes[name].append(code)
+
+    values.append(parse_value(row[VALUE_COLUMN]))
+
+  return VacancyTable(dictionaries, codes, values)
+
+
+def parse_file(file_name):
+  '''
+    Reads a StatCan CSV file and builds a VacancyTable from it.
+
+    Parameters:
+    file_name (str): The path to the CSV file.
+
+    Returns:
+    VacancyTable: the parsed file.
+  '''
+  # 'tokenizer' reads the file as bytes and decodes only the columns that are kept.
+  # ('tokenizer' uses this module, so it is imported here rather than at the top.)
+  from vacancies import tokenizer
+
+  with profiling.stage('parse', file=os.path.basename(file_name)) as timer:
+    table = tokenizer.encode_file(file_name)
+    timer.count(len(table))
+  return table
+
+
+def open_store(store_path):
+  '''
+    Opens a store written by cache.py or streaming.py as a VacancyTable.
+
+    Parameters:
+    store_path (str): the path to the store
+
+    Returns:
+    VacancyTable: the stored table, mapped from the file.
+
+    Raises:
+    ValueError: when the file is not a readable store
+  '''
+  stored = cache.read_store(store_path)
+  if stored is None:
+    raise ValueError(f"Not a readable store: {store_path}")
+  _, dictionaries, codes, values = stored
+  return VacancyTable(dictionaries, codes, values)
+
+
+def remember_table(file_name, table):
+  '''
+    Makes load_table() return 'table' for 'file_name' for as long as the file does
+    not change, e.g. after the file was parsed some other way (see parallel.py).
+  '''
+  path = os.path.abspath(file_name)
+  stat = os.stat(path)
+  _loaded_tables[path] = ((stat.st_size, stat.st_mtime_ns), table)
+
+
+def columnar_format(file_name):
+  '''
+    Returns the format ('parquet' or 'arrow') of a file holding a table already, by
+    its suffix, or None for any other file.
+  '''
+  return COLUMNAR_SUFFIXES.get(os.path.splitext(file_name)[1].lower())
+
+
+def is_loaded(file_name):
+  '''
+    Tells if load_table() already has an up to date table for 'file_name' in memory.
+  '''
+  path = os.path.abspath(file_name)
+  loaded = _loaded_tables.get(path)
+  if loaded is None:
+    return False
+  stat = os.stat(path)
+  return loaded[0] == (stat.st_size, stat.st_mtime_ns)
+
+
+def load_table(file_name, use_cache=True):
+  '''
+    Returns the VacancyTable for 'file_name'. The table is taken, in order, from the
+    tables already loaded in this process, from the on-disk cache (see cache.py), or
+    by parsing the file, which then refreshes the on-disk cache. A Parquet or Arrow
+    file is read as it is, without the on-disk cache.
+
+    Parameters:
+    file_name (str): The path to the CSV file.
+    use_cache (bool): False to ignore the on-disk cache.
+
+    Returns:
+    VacancyTable: the parsed file.
+  '''
+  path = os.path.abspath(file_name)
+  stat = os.stat(path)
+  version = (stat.st_size, stat.st_mtime_ns)
+
+  loaded = _loaded_tables.get(path)
+  if loaded is not None and loaded[0] == version:
+    return loaded[1]
+
+  #
+  #  Parquet and Arrow files hold the table already. ('columnar' uses this module,
+  #  so it is imported here rather than at the top.)
+  #
+  if columnar_format(path) is not None:
+    from vacancies import columnar
+    table = columnar.read_table(path)
+    _loaded_tables[path] = (version, table)
+    return table
+
+  use_cache = use_cache and cache.enabled()
+  with profiling.stage('cache', file=os.path.basename(path)):
+    cached = cache.fetch(path, stat) if use_cache else None
+
+  #
+  #  Big files are streamed into the cache chunk by chunk and then mapped from
+  #  there, instead of being parsed into memory in one go. ('streaming' uses this
+  #  module, so it is imported here rather than at the top.)
+  #
+  if cached is None and use_cache and stat.st_size >= STREAMING_THRESHOLD:
+    from vacancies import streaming
+    with profiling.stage('ingest', file=os.path.basename(path)):
+      streaming.ingest(path)
+      cached = cache.fetch(path, stat)
+
+  if cached is not None:
+    table = VacancyTable(*cached)
+  else:
+    table = parse_file(path)
+    if use_cache:
+      cache.store(path, stat, table)
+
+  _loaded_tables[path] = (version, table)
+  return table
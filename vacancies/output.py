@@ -0,0 +1,342 @@
+'''
+output.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The rows a selection matches are written through sinks, which write them in
+    blocks rather than with one print() per row. The sinks are chosen with an output
+    spec, a comma-separated list of:
+
+      quiet           write nothing, only count the rows
+      summary         print the number of rows and the quarters they cover
+      stdout          print the rows, as "a, b, c" lines (the default), with ".." for
+                      a missing (e.g. suppressed) value
+      csv:<file>      write the rows as CSV, with a header
+      jsonl:<file>    write one JSON object per row (JSON Lines)
+      parquet:<file>  write the rows as a Parquet file (needs the 'pyarrow' package)
+      arrow:<file>    write the rows as an Arrow IPC file (needs the 'pyarrow' package)
+
+    The question scripts and main.py take the spec from the VACANCIES_OUTPUT
+    environment variable, e.g. VACANCIES_OUTPUT=summary,jsonl:rows.jsonl
+
+    The file sinks write under a temporary name in the folder of their file and rename
+    it to the file when closed, so a reader never sees half a file and two queries
+    writing the same file never mix their rows (the last one to finish wins).
+'''
+
+#
+#   Packages and modules
+#
+
+# 'contextlib' ignores a temporary file already gone
+import contextlib
+
+# 'csv' writes the CSV sink
+import csv
+
+# 'json' writes the JSON Lines sink
+import json
+
+# 'os' reads the output spec from the environment
+import os
+
+# 'sys' gives access to the console
+import sys
+
+# 'tempfile' gives every file sink its own temporary file before the atomic rename
+import tempfile
+
+# 'loader' gives the header of the selected rows
+from vacancies import loader
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+OUTPUT_VARIABLE = 'VACANCIES_OUTPUT'
+DEFAULT_SPEC = 'stdout'
+BLOCK_ROWS = 10_000
+FILE_BUFFER_SIZE = 1 << 20
+FILE_MODE = 0o644
+
+#
+#  How the console shows a missing value (e.g. a suppressed VALUE), the way StatCan
+#  tables do; files leave it empty
+#
+MISSING_TEXT = '..'
+
+
+class OutputError(ValueError):
+  '''
+    Raised when an output spec cannot be used.
+  '''
+
+
+class Sink:
+  '''
+    Where selected rows go. write_rows() may be called any number of times, and
+    close() once at the end, or abort() when the rows could not all be written.
+
+    Attributes:
+    header (list): the names of the columns of the rows
+    rows (int): the number of rows written so far
+  '''
+
+  def __init__(self, header):
+    self.header = list(header)
+    self.rows = 0
+
+  def write_rows(self, rows):
+    self.rows += len(rows)
+
+  def close(self):
+    pass
+
+  def abort(self):
+    pass
+
+
+def temporary_file(path):
+  '''
+    Creates the temporary file a file sink (or columnar.py) writes before renaming
+    it to 'path'.
+
+    Returns:
+    tuple: (file descriptor, temporary path)
+  '''
+  directory, name = os.path.split(os.path.abspath(path))
+  descriptor, temporary_path = tempfile.mkstemp(dir=directory, prefix=f".{name}.", suffix='.tmp')
+  os.chmod(temporary_path, FILE_MODE)
+  return descriptor, temporary_path
+
+
+def remove_file(path):
+  '''
+    Removes a temporary file, if it is still there.
+  '''
+  with contextlib.suppress(FileNotFoundError):
+    os.remove(path)
+
+
+def _text(value):
+  return MISSING_TEXT if value is None else str(value)
+
+
+class QuietSink(Sink):
+  '''
+    Only counts the rows.
+  '''
+
+
+class SummarySink(Sink):
+  '''
+    Prints the number of rows and the quarters they cover when closed.
+  '''
+
+  def __init__(self, header):
+    super().__init__(header)
+    self._first = None
+    self._last = None
+
+  def write_rows(self, rows):
+    super().write_rows(rows)
+    for row in rows:
+      self._first = row[0] if self._first is None else min(self._first, row[0])
+      self._last = row[0] if self._last is None else max(self._last, row[0])
+
+  def close(self):
+    if self.rows:
+      print(f"{self.rows} rows, {self._first} to {self._last}")
+    else:
+      print("0 rows")
+
+
+class StdoutSink(Sink):
+  '''
+    Prints the rows as "a, b, c" lines, one write per block of rows.
+  '''
+
+  def __init__(self, header, stream=None):
+    super().__init__(header)
+    self._stream = stream or sys.stdout
+
+  def write_rows(self, rows):
+    super().write_rows(rows)
+    for start in range(0, len(rows), BLOCK_ROWS):
+      block = rows[start:start + BLOCK_ROWS]
+      self._stream.write(''.join(', '.join(_text(value) for value in row) + '\n' for row in block))
+
+
+class TextFileSink(Sink):
+  '''
+    Writes a text file under a temporary name and renames it to 'path' when closed.
+
+    Attributes:
+    path (str): the file written
+  '''
+
+  def __init__(self, header, path):
+    super().__init__(header)
+    self.path = path
+    descriptor, self._temporary_path = temporary_file(path)
+    self._file = os.fdopen(descriptor, 'w', newline='', encoding='utf-8', buffering=FILE_BUFFER_SIZE)
+
+  def close(self):
+    self._file.close()
+    os.replace(self._temporary_path, self.path)
+
+  def abort(self):
+    self._file.close()
+    remove_file(self._temporary_path)
+
+
+class CsvSink(TextFileSink):
+  '''
+    Writes the rows as a CSV file with a header.
+  '''
+
+  def __init__(self, header, path):
+    super().__init__(header, path)
+    self._writer = csv.writer(self._file)
+    self._writer.writerow(self.header)
+
+  def write_rows(self, rows):
+    super().write_rows(rows)
+    self._writer.writerows(rows)
+
+
+class JsonLinesSink(TextFileSink):
+  '''
+    Writes one JSON object per row, keyed by the header.
+  '''
+
+  def write_rows(self, rows):
+    super().write_rows(rows)
+    for start in range(0, len(rows), BLOCK_ROWS):
+      block = rows[start:start + BLOCK_ROWS]
+      self._file.write(''.join(json.dumps(dict(zip(self.header, row, strict=True))) + '\n' for row in block))
+
+
+class ArrowSink(Sink):
+  '''
+    Collects the rows by column and writes them as one Arrow table when closed, as
+    a Parquet file or an Arrow IPC file.
+  '''
+
+  def __init__(self, header, path, file_format):
+    super().__init__(header)
+    self._pyarrow = _import_pyarrow()
+    self._path = path
+    self._file_format = file_format
+    self._columns = [[] for _ in self.header]
+
+  def write_rows(self, rows):
+    super().write_rows(rows)
+    # No rows have no columns to zip with the header
+    if rows:
+      for column, values in zip(self._columns, zip(*rows, strict=True), strict=True):
+        column.extend(values)
+
+  def close(self):
+    pa = self._pyarrow
+    table = pa.table(dict(zip(self.header, self._columns, strict=True)))
+    descriptor, temporary_path = temporary_file(self._path)
+    os.close(descriptor)
+    try:
+      if self._file_format == 'parquet':
+        import pyarrow.parquet
+        pyarrow.parquet.write_table(table, temporary_path)
+      else:
+        import pyarrow.feather
+        pyarrow.feather.write_feather(table, temporary_path)
+      os.replace(temporary_path, self._path)
+    except BaseException:
+      remove_file(temporary_path)
+      raise
+
+
+def _import_pyarrow():
+  try:
+    import pyarrow
+  except ImportError:
+    raise OutputError("Writing Parquet or Arrow files needs the 'pyarrow' package (the 'columnar' extra)") from None
+  return pyarrow
+
+
+#
+#  The sinks that write to a file, by the name used in an output spec
+#
+FILE_SINKS = {
+    'csv': CsvSink,
+    'jsonl': JsonLinesSink,
+    'parquet': lambda header, path: ArrowSink(header, path, 'parquet'),
+    'arrow': lambda header, path: ArrowSink(header, path, 'arrow'),
+}
+CONSOLE_SINKS = {
+    'quiet': QuietSink,
+    'summary': SummarySink,
+    'stdout': StdoutSink,
+}
+
+
+def open_sinks(spec=None, header=loader.OUTPUT_HEADER):
+  '''
+    Opens the sinks of an output spec, see the module summary.
+
+    Parameters:
+    spec (str): the output spec, by default VACANCIES_OUTPUT or DEFAULT_SPEC
+    header (list): the names of the columns of the rows
+
+    Returns:
+    list: the open sinks
+
+    Raises:
+    OutputError: when the spec names an unknown sink or misses a file name
+  '''
+  if spec is None:
+    spec = os.environ.get(OUTPUT_VARIABLE) or DEFAULT_SPEC
+
+  sinks = []
+  try:
+    for entry in spec.split(','):
+      kind, _, path = entry.strip().partition(':')
+      if kind in CONSOLE_SINKS and not path:
+        sinks.append(CONSOLE_SINKS[kind](header))
+      elif kind in FILE_SINKS and path:
+        sinks.append(FILE_SINKS[kind](header, path))
+      elif kind in FILE_SINKS:
+        raise OutputError(f"The '{kind}' output needs a file name, e.g. {kind}:rows.{kind}")
+      else:
+        raise OutputError(f"Unknown output '{entry.strip()}', use one of: {', '.join(list(CONSOLE_SINKS) + list(FILE_SINKS))}")
+  except Exception:
+    for sink in sinks:
+      sink.abort()
+    raise
+  return sinks
+
+
+def write_rows(rows, sinks):
+  '''
+    Writes rows to every sink and closes the sinks; when writing fails, the sinks
+    are aborted instead, so no file sink leaves a partial file behind.
+
+    Parameters:
+    rows (list): the rows
+    sinks (list): the sinks, see open_sinks()
+
+    Returns:
+    int: the number of rows written
+  '''
+  try:
+    for sink in sinks:
+      sink.write_rows(rows)
+  except BaseException:
+    for sink in sinks:
+      sink.abort()
+    raise
+  for sink in sinks:
+    sink.close()
+  return len(rows)
@@ -0,0 +1,449 @@
+'''
+parallel.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This module parses several data files, and big data files in several pieces, at the
+    same time in a pool of worker processes.
+
+    Every file is cut into byte ranges that start and end on line boundaries (a StatCan
+    row never spans two lines, so a range always holds whole rows). Nothing is assumed
+    about the order of the rows: a range holds whatever GEO and REF_DATE keys its rows
+    have, and the same key may turn up in several ranges. Every worker parses (with
+    tokenizer.py) and dictionary-encodes its range into a partial table with its own
+    label dictionaries; the partial tables of a file are then merged, in file order, by
+    translating their codes into one shared dictionary per column.
+    The merged tables are handed to loader.py (and its on-disk cache), so everything
+    built on top of them (cube.py, proportions.py, the question scripts) uses them.
+
+    A file can also be summed without building its table (see quality.py): every
+    worker sums the rows of its range into partial sums keyed by label (GEO, NOC,
+    characteristic, REF_DATE), and the partial sums of the ranges are added up by
+    label. Only the small partial sums go back from the workers, not the rows.
+
+    The number of workers is, in order: the 'workers' argument, the VACANCIES_WORKERS
+    environment variable, or the number of CPUs.
+
+    Commandline Parameters (run as "python -m vacancies.parallel ..."):
+      argv[1:]  = paths to the input files
+      --workers <N>  number of worker processes
+    (To sum a file in parallel, run "python -m vacancies.quality ... --workers <N>")
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'array' holds the merged code columns
+import array
+
+# 'os' gives access to file sizes, environment variables and the CPU count
+import os
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'time' measures how long loading took
+import time
+
+# 'concurrent.futures' runs the worker processes
+from concurrent.futures import ProcessPoolExecutor
+
+# 'numpy' translates the codes of the partial tables
+import numpy as np
+
+# 'cache' keeps the merged tables on disk
+from vacancies import cache
+
+# 'cube' turns the partial tables into arrays to sum
+from vacancies import cube
+
+# 'filters' compiles the filter of a sum again in each worker
+from vacancies import filters
+
+# 'loader' knows how to encode rows into a table
+from vacancies import loader
+
+# 'quality' sums the rows of a byte range
+from vacancies import quality
+
+# 'tokenizer' reads and encodes the rows of a byte range
+from vacancies import tokenizer
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+WORKERS_VARIABLE = 'VACANCIES_WORKERS'
+
+#
+#  A file is only cut into several ranges if each range gets at least this many bytes
+#
+MIN_RANGE_BYTES = 4 * 1024 * 1024
+
+
+def worker_count(workers=None):
+  '''
+    Returns the number of worker processes to use: 'workers', or else the value of
+    VACANCIES_WORKERS, or else the number of CPUs.
+
+    Raises:
+    ValueError: when VACANCIES_WORKERS is not a whole number
+  '''
+  if workers is None:
+    text = os.environ.get(WORKERS_VARIABLE)
+    try:
+      workers = int(text) if text else os.cpu_count() or 1
+    except ValueError:
+      raise ValueError(f"{WORKERS_VARIABLE} should be a whole number of worker processes, not '{text}'") from None
+  return max(1, int(workers))
+
+
+def line_ranges(file_name, parts, min_range_bytes=MIN_RANGE_BYTES):
+  '''
+    Cuts a file into at most 'parts' byte ranges that start and end on line boundaries.
+
+    Returns:
+    list: (start, end) byte offsets, covering the whole file in order
+  '''
+  size = os.path.getsize(file_name)
+  parts = max(1, min(parts, size // max(1, min_range_bytes)))
+
+  boundaries = [0]
+  with open(file_name, 'rb') as data_file:
+    for part in range(1, parts):
+      data_file.seek(size * part // parts)
+      data_file.readline()
+      position = data_file.tell()
+      if boundaries[-1] < position < size:
+        boundaries.append(position)
+  boundaries.append(size)
+  return list(zip(boundaries[:-1], boundaries[1:], strict=True))
+
+
+def parse_range(file_name, start, end):
+  '''
+    Parses the rows between two byte offsets of a file. This runs in a worker process.
+
+    Returns:
+    tuple: (dictionaries, codes, values) of the partial table
+  '''
+  table = tokenizer.encode_file(file_name, start, end)
+  return table.dictionaries, table.codes, table.values
+
+
+def merge_tables(parts):
+  '''
+    Merges partial tables, in order, into one VacancyTable.
+
+    Parameters:
+    parts (list): (dictionaries, codes, values) of each partial table
+
+    Returns:
+    VacancyTable: the merged table
+  '''
+  dictionaries = {name: [] for name, _ in loader.ENCODED_COLUMNS}
+  codes = {}
+  for name, _ in loader.ENCODED_COLUMNS:
+    lookup = {}
+    translated = []
+    for part_dictionaries, part_codes, _ in parts:
+      #
+      #  'translation[code]' is the merged code of the part's label 'code'
+      #
+      translation = np.empty(len(part_dictionaries[name]), dtype=np.intc)
+      for code, label in enumerate(part_dictionaries[name]):
+        merged_code = lookup.get(label)
+        if merged_code is None:
+          merged_code = len(lookup)
+          lookup[label] = merged_code
+          dictionaries[name].append(label)
+        translation[code] = merged_code
+      translated.append(translation[np.frombuffer(part_codes[name], dtype=np.intc)])
+
+    column = array.array(loader.CODE_TYPECODE)
+    if translated:
+      column.frombytes(np.concatenate(translated).astype(np.intc).tobytes())
+    codes[name] = column
+
+  values = array.array(loader.VALUE_TYPECODE)
+  for _, _, part_values in parts:
+    values.extend(part_values)
+
+  return loader.VacancyTable(dictionaries, codes, values)
+
+
+def _table_without_parsing(file_name):
+  '''
+    Returns the table of a file when it needs no parsing: it is loaded already, it is
+    a Parquet or Arrow file, or it is up to date in the on-disk cache. A table taken
+    from the on-disk cache is remembered, so load_table() does not fetch it again.
+
+    Returns:
+    VacancyTable: the table, or None when the file has to be parsed
+  '''
+  if loader.is_loaded(file_name) or loader.columnar_format(file_name):
+    return loader.load_table(file_name)
+  cached = cache.fetch(os.path.abspath(file_name), os.stat(file_name)) if cache.enabled() else None
+  if cached is None:
+    return None
+  table = loader.VacancyTable(*cached)
+  loader.remember_table(file_name, table)
+  return table
+
+
+def load_tables(file_names, workers=None, min_range_bytes=MIN_RANGE_BYTES):
+  '''
+    Loads several data files at once, parsing them in parallel where needed. Files
+    already in memory or in the on-disk cache, and Parquet or Arrow files, are not
+    parsed again.
+
+    Parameters:
+    file_names (list): the paths to the CSV files
+    workers (int): the number of worker processes, see worker_count()
+    min_range_bytes (int): the smallest byte range worth giving to a worker
+
+    Returns:
+    dict: path -> VacancyTable
+  '''
+  workers = worker_count(workers)
+  tables = {}
+  to_parse = []
+  for file_name in dict.fromkeys(file_names):
+    table = _table_without_parsing(file_name)
+    if table is not None:
+      tables[file_name] = table
+    else:
+      to_parse.append(file_name)
+
+  if not to_parse:
+    return tables
+
+  #
+  #  Give every worker roughly the same number of bytes, across all the files
+  #
+  total_size = sum(os.path.getsize(file_name) for file_name in to_parse) or 1
+  tasks = []
+  for file_name in to_parse:
+    parts = max(1, round(workers * os.path.getsize(file_name) / total_size))
+    for start, end in line_ranges(file_name, parts, min_range_bytes):
+      tasks.append((file_name, start, end))
+
+  with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+    futures = [(file_name, pool.submit(parse_range, file_name, start, end)) for file_name, start, end in tasks]
+    partial_tables = {file_name: [] for file_name in to_parse}
+    for file_name, future in futures:
+      partial_tables[file_name].append(future.result())
+
+  for file_name in to_parse:
+    table = merge_tables(partial_tables[file_name])
+    if cache.enabled():
+      cache.store(os.path.abspath(file_name), os.stat(file_name), table)
+    loader.remember_table(file_name, table)
+    tables[file_name] = table
+  return tables
+
+
+def partial_axes(by, where):
+  '''
+    Returns the axes the workers keep when summing, and the part of the filter they
+    apply.
+
+    A filter may pick the labels of geo, noc or characteristic by menu number, which
+    is the position of the label in the whole file, not in a byte range. Those axes
+    are kept by the workers, unfiltered, and the filter is applied to them once the
+    partial sums are merged (see merge_aggregates()).
+
+    Returns:
+    tuple: (axes kept by the workers, the 'by' axes first; filter the workers apply)
+  '''
+  numbered = tuple(axis for axis in cube.AXES if where is not None and axis in filters.MENU_COLUMNS and axis in where.tests)
+  kept = tuple(by) + tuple(axis for axis in numbered if axis not in by)
+  if numbered:
+    where = filters.Filter(where.text, {column: tests for column, tests in where.tests.items() if column not in numbered})
+  return kept, where
+
+
+def aggregate_range(file_name, start, end, by, min_grade, grade_weights, where_text):
+  '''
+    Sums the rows between two byte offsets of a file, for every statistic in them.
+    This runs in a worker process.
+
+    Parameters:
+    file_name (str): the data file
+    start, end (int): the byte range
+    by, min_grade, grade_weights: see quality.aggregate()
+    where_text (str): the filter, or None; it is compiled again here since compiled
+      filters cannot be sent to a worker
+
+    Returns:
+    dict: statistic -> quality.Aggregate of the range over the axes of partial_axes(),
+      its values being sums
+  '''
+  table = tokenizer.encode_file(file_name, start, end)
+  kept, where = partial_axes(by, None if where_text is None else filters.compile_filter(where_text))
+  return {statistics: quality.aggregate(cube.build_cube(table, statistics), kept, min_grade, grade_weights, 'sum', where)
+          for statistics in table.dictionaries['statistics']}
+
+
+def merge_aggregates(parts, by, statistic='sum', where=None):
+  '''
+    Adds up the partial sums of the byte ranges of a file, by label.
+
+    Parameters:
+    parts (list): quality.Aggregate of each range, see aggregate_range()
+    by (tuple): the axes kept
+    statistic (str): 'sum' or 'mean'
+    where (Filter): the filter of the sum, or None
+
+    Returns:
+    quality.Aggregate: the same aggregate as quality.aggregate() of the whole file
+  '''
+  kept, _ = partial_axes(by, where)
+
+  #
+  #  The labels in the order of the file's cube: REF_DATE in date order, the others
+  #  in the order the file lists them
+  #
+  labels = {}
+  for axis in kept:
+    merged = list(dict.fromkeys(label for part in parts for label in part.labels[axis]))
+    labels[axis] = sorted(merged) if axis == 'ref_date' else merged
+  positions = {axis: {label: position for position, label in enumerate(labels[axis])} for axis in kept}
+
+  shape = tuple(len(labels[axis]) for axis in kept)
+  sums = np.zeros(shape)
+  weight_sums = np.zeros(shape)
+  reported = np.zeros(shape, dtype=np.int64)
+  suppressed = np.zeros(shape, dtype=np.int64)
+  excluded = np.zeros(shape, dtype=np.int64)
+  worst_grade = np.full(shape, cube.NO_GRADE, dtype=np.int8)
+  for part in parts:
+    cells = np.ix_(*(np.array([positions[axis][label] for label in part.labels[axis]], dtype=np.intp) for axis in kept))
+    sums[cells] += np.where(part.weight_sums > 0, part.values, 0.0)
+    weight_sums[cells] += part.weight_sums
+    reported[cells] += part.reported
+    suppressed[cells] += part.suppressed
+    excluded[cells] += part.excluded
+    worst_grade[cells] = np.maximum(worst_grade[cells], part.worst_grade)
+
+  #
+  #  The axes the workers kept only for the filter: apply it with the menu numbers of
+  #  the whole file, leave out their totals and sum over them
+  #
+  masks = []
+  for axis in kept:
+    keep = np.ones(len(labels[axis]), dtype=bool)
+    if where is not None and axis in filters.MENU_COLUMNS and axis in where.tests:
+      keep = np.fromiter((where.matches(axis, label, number) for number, label in enumerate(labels[axis], start=1)),
+                         dtype=bool, count=len(labels[axis]))
+    if axis not in by:
+      keep &= quality.used_labels(axis, labels[axis])
+    masks.append(keep)
+  selected = np.ix_(*masks)
+  summed = tuple(range(len(by), len(kept)))
+
+  weight_sums = weight_sums[selected].sum(axis=summed)
+  sums = sums[selected].sum(axis=summed)
+  with np.errstate(divide='ignore', invalid='ignore'):
+    values = np.where(weight_sums > 0, sums if statistic == 'sum' else sums / weight_sums, np.nan)
+  return quality.Aggregate(
+      tuple(by),
+      {axis: [label for label, keep in zip(labels[axis], mask, strict=True) if keep] for axis, mask in zip(kept, masks, strict=True) if axis in by},
+      values,
+      reported[selected].sum(axis=summed),
+      suppressed[selected].sum(axis=summed),
+      excluded[selected].sum(axis=summed),
+      worst_grade[selected].max(axis=summed, initial=cube.NO_GRADE),
+      weight_sums,
+  )
+
+
+def aggregate_files(file_names, by=quality.DEFAULT_BY, min_grade=None, grade_weights=None, statistic='sum', where=None,
+                    workers=None, min_range_bytes=MIN_RANGE_BYTES):
+  '''
+    Sums several data files at once (see quality.aggregate()), each cut into byte
+    ranges that are summed in worker processes. Files already in memory or in the
+    on-disk cache, and Parquet or Arrow files, are summed from their cube instead.
+
+    Parameters:
+    file_names (list): the paths to the CSV files
+    by, min_grade, grade_weights, statistic, where: see quality.aggregate()
+    workers (int): the number of worker processes, see worker_count()
+    min_range_bytes (int): the smallest byte range worth giving to a worker
+
+    Returns:
+    dict: path -> quality.Aggregate of the file's default statistic (see
+      cube.default_statistics())
+
+    Raises:
+    ValueError: when an axis or the statistic is unknown
+  '''
+  by = tuple(by)
+  quality.check_arguments(by, statistic)
+  workers = worker_count(workers)
+  aggregates = {}
+  to_sum = []
+  for file_name in dict.fromkeys(file_names):
+    if _table_without_parsing(file_name) is not None:
+      aggregates[file_name] = quality.aggregate(cube.load_cube(file_name), by, min_grade, grade_weights, statistic, where)
+    else:
+      to_sum.append(file_name)
+
+  if not to_sum:
+    return aggregates
+
+  total_size = sum(os.path.getsize(file_name) for file_name in to_sum) or 1
+  tasks = []
+  for file_name in to_sum:
+    parts = max(1, round(workers * os.path.getsize(file_name) / total_size))
+    for start, end in line_ranges(file_name, parts, min_range_bytes):
+      tasks.append((file_name, start, end))
+
+  where_text = None if where is None else where.text
+  with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+    futures = [(file_name, pool.submit(aggregate_range, file_name, start, end, by, min_grade, grade_weights, where_text))
+               for file_name, start, end in tasks]
+    partial_sums = {file_name: [] for file_name in to_sum}
+    for file_name, future in futures:
+      partial_sums[file_name].append(future.result())
+
+  for file_name in to_sum:
+    # The statistics in the order of the file, as in its table
+    statistics = cube.default_statistics(list(dict.fromkeys(name for part in partial_sums[file_name] for name in part)))
+    parts = [part[statistics] for part in partial_sums[file_name] if statistics in part]
+    aggregates[file_name] = merge_aggregates(parts, by, statistic, where)
+  return aggregates
+
+
+def main(argv):
+  '''
+    Loads the files given on the command line in parallel and reports how long it took.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.parallel', description='Load StatCan CSV files in parallel.')
+  parser.add_argument('file_names', nargs='+', help='paths to the input files')
+  parser.add_argument('--workers', type=int, help='number of worker processes')
+  arguments = parser.parse_args(argv[1:])
+
+  started = time.perf_counter()
+  try:
+    tables = load_tables(arguments.file_names, arguments.workers)
+  except FileNotFoundError as e:
+    print(f"File not found: {e.filename}")
+    return 2
+  elapsed = time.perf_counter() - started
+
+  for file_name, table in tables.items():
+    print(f"{file_name}: {len(table)} rows, {len(table.dictionaries['geo'])} GEO, {len(table.dictionaries['ref_date'])} REF_DATE")
+  print(f"Loaded {len(tables)} file(s) with {worker_count(arguments.workers)} worker(s) in {elapsed:.3f} s")
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv))
@@ -0,0 +1,228 @@
+'''
+profiling.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    This module shows where the time of a run goes. The code marks its stages (parsing,
+    building the cube, selecting rows, printing, plotting, ...) with
+
+      with profiling.stage('parse') as timer:
+        ...
+        timer.count(rows)
+
+    which does nothing unless profiling is switched on, either with "--profile <file>"
+    on the command line of main.py or with the VACANCIES_PROFILE environment variable
+    set to the trace file to write. Setting VACANCIES_CPROFILE=1 (or "--cprofile")
+    also runs the whole program under cProfile.
+
+    When the program ends, the trace file is written in the Chrome trace format (open
+    it in chrome://tracing or https://ui.perfetto.dev): one event per stage with its
+    duration and row count, plus the totals per stage and the row counters under
+    "otherData". With cProfile the statistics are saved next to it, as <file>.prof,
+    and the slowest functions are added to the trace.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'atexit' writes the trace when the program ends, however it ends
+import atexit
+
+# 'cProfile' and 'pstats' profile every function call, when asked to
+import cProfile
+import pstats
+
+# 'io' collects the cProfile report
+import io
+
+# 'json' writes the trace
+import json
+
+# 'os' reads the environment variables and gives the process id
+import os
+
+# 'threading' gives the thread id of each stage
+import threading
+
+# 'time' measures the stages
+import time
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+PROFILE_VARIABLE = 'VACANCIES_PROFILE'
+CPROFILE_VARIABLE = 'VACANCIES_CPROFILE'
+PROFILE_SUFFIX = '.prof'
+TOP_FUNCTIONS = 25
+
+
+class _Stage:
+  '''
+    One timed stage; an event of the trace once it ends.
+  '''
+
+  def __init__(self, recorder, name, args):
+    self._recorder = recorder
+    self.name = name
+    self.args = args
+
+  def count(self, rows):
+    '''
+      Adds 'rows' to the rows handled by this stage.
+    '''
+    self.args['rows'] = self.args.get('rows', 0) + rows
+
+  def __enter__(self):
+    self._started = time.perf_counter()
+    return self
+
+  def __exit__(self, *_):
+    self._recorder.add(self, self._started, time.perf_counter())
+    return False
+
+
+class _NoStage:
+  '''
+    Stands in for a stage when profiling is off.
+  '''
+
+  def count(self, rows):
+    pass
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *_):
+    return False
+
+
+_NO_STAGE = _NoStage()
+
+
+class Recorder:
+  '''
+    Collects the stages of one run and writes them as a trace.
+
+    Attributes:
+    trace_file (str): where to write the trace
+    events (list): the Chrome trace events of the stages so far
+    counters (dict): stage name -> rows handled, over the whole run
+    profiler (cProfile.Profile): the profiler, or None without cProfile
+  '''
+
+  def __init__(self, trace_file, use_cprofile=False):
+    self.trace_file = trace_file
+    self.events = []
+    self.counters = {}
+    self.totals = {}
+    self._lock = threading.Lock()
+    self._origin = time.perf_counter()
+    self.profiler = cProfile.Profile() if use_cprofile else None
+    if self.profiler is not None:
+      self.profiler.enable()
+
+  def add(self, stage, started, ended):
+    event = {
+        'name': stage.name,
+        'cat': 'vacancies',
+        'ph': 'X',
+        'ts': round((started - self._origin) * 1e6, 1),
+        'dur': round((ended - started) * 1e6, 1),
+        'pid': os.getpid(),
+        'tid': threading.get_ident(),
+        'args': stage.args,
+    }
+    with self._lock:
+      self.events.append(event)
+      self.totals[stage.name] = self.totals.get(stage.name, 0.0) + ended - started
+      if 'rows' in stage.args:
+        self.counters[stage.name] = self.counters.get(stage.name, 0) + stage.args['rows']
+
+  def write(self):
+    '''
+      Stops cProfile, if running, and writes the trace file.
+    '''
+    ended = time.perf_counter()
+    other_data = {
+        'total_seconds': round(ended - self._origin, 6),
+        'stage_seconds': {name: round(seconds, 6) for name, seconds in self.totals.items()},
+        'rows': self.counters,
+    }
+
+    if self.profiler is not None:
+      self.profiler.disable()
+      self.profiler.dump_stats(self.trace_file + PROFILE_SUFFIX)
+      report = io.StringIO()
+      pstats.Stats(self.profiler, stream=report).sort_stats('cumulative').print_stats(TOP_FUNCTIONS)
+      other_data['cprofile'] = report.getvalue()
+
+    run = {'name': 'run', 'cat': 'vacancies', 'ph': 'X', 'ts': 0, 'dur': round((ended - self._origin) * 1e6, 1),
+           'pid': os.getpid(), 'tid': threading.get_ident(), 'args': {}}
+    with open(self.trace_file, 'w', encoding='utf-8') as trace_file:
+      json.dump({'traceEvents': [run] + self.events, 'displayTimeUnit': 'ms', 'otherData': other_data}, trace_file, indent=1)
+
+
+#
+#  The recorder of this process, or None when profiling is off
+#
+_recorder = None
+
+
+def enabled():
+  '''
+    Tells if profiling is on.
+  '''
+  return _recorder is not None
+
+
+def stage(name, **args):
+  '''
+    Returns a context manager timing one stage of the run, see the module summary.
+    The keyword arguments are kept with the stage in the trace.
+  '''
+  if _recorder is None:
+    return _NO_STAGE
+  return _Stage(_recorder, name, args)
+
+
+def configure(trace_file=None, use_cprofile=None):
+  '''
+    Switches profiling on if a trace file is given, or set in VACANCIES_PROFILE. The
+    trace is written when the program ends.
+
+    Parameters:
+    trace_file (str): the trace file to write, by default from VACANCIES_PROFILE
+    use_cprofile (bool): also run cProfile, by default from VACANCIES_CPROFILE
+
+    Returns:
+    bool: True if profiling is on
+  '''
+  global _recorder
+  if _recorder is not None:
+    return True
+
+  if trace_file is None:
+    trace_file = os.environ.get(PROFILE_VARIABLE)
+  if not trace_file:
+    return False
+  if use_cprofile is None:
+    use_cprofile = os.environ.get(CPROFILE_VARIABLE, '') not in ('', '0')
+
+  _recorder = Recorder(trace_file, use_cprofile)
+  atexit.register(finish)
+  return True
+
+
+def finish():
+  '''
+    Writes the trace and switches profiling off.
+  '''
+  global _recorder
+  recorder, _recorder = _recorder, None
+  if recorder is not None:
+    recorder.write()
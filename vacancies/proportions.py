@@ -0,0 +1,324 @@
+'''
+proportions.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The questions in main.py ask for proportions, e.g. the share of job vacancies
+    recruited through social media. Every data file has one "total" characteristic
+    (e.g. "Recruitment strategies, all types") the other characteristics are part of.
+    This module divides the whole cube of a file (see cube.py) by its total in one
+    NumPy operation, giving for every GEO, NOC, characteristic and quarter at once:
+
+      1. the share of the total, between 0 and 1
+      2. the change of that share since the previous quarter
+
+    A share is missing (NaN) whenever the value or the total is missing or the total
+    is zero, and so is a change when either of its quarters is missing; a missing
+    value is never treated as 0. Every share also carries a STATUS grade, the worse
+    of the grades of its value and of its total (see cube.py), or no grade when
+    either of them has none, and the shares graded worse than a given grade (or not
+    graded) can be left out.
+
+    Commandline Parameters: 1 (run as "python -m vacancies.proportions <file_name>")
+      argv[1] = path to the input file; every share is written to the console as CSV
+'''
+
+#
+#   Packages and modules
+#
+
+# 'csv' writes the shares to the console
+import csv
+
+# 're' recognises the label of the total characteristic
+import re
+
+# 'sys' gives access to the command line parameters and the console
+import sys
+
+# 'weakref' lets computed shares go away together with the cube they came from
+import weakref
+
+# 'numpy' does the division for the whole cube at once
+import numpy as np
+
+# 'cube' loads a data file as arrays
+from vacancies import cube
+
+# 'loader' turns stored values back into the numbers written in the file
+from vacancies import loader
+
+# 'profiling' times the computation when profiling is on
+from vacancies import profiling
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+
+#
+#  The total characteristic reads like "<category>, all <types|levels|durations>"
+#
+TOTAL_LABEL_PATTERN = re.compile(r', all \w+$')
+
+OUTPUT_HEADER = ["Ref Date", "Geo", "National Occupation Classification", "Job Vacancy Characteristic",
+                 "Value", "Total", "Proportion", "Change Since Previous Quarter", "Status"]
+
+#
+#  Proportions already computed in this process, keyed by the cube they came from
+#
+_computed_proportions = weakref.WeakKeyDictionary()
+
+
+class Proportions:
+  '''
+    The share of its total of every cell of a cube.
+
+    Attributes:
+    cube (VacancyCube): the cube the shares were computed from
+    total (int): position of the total characteristic on the characteristic axis
+    shares (numpy.ndarray): cube-shaped shares between 0 and 1, NaN where missing
+    changes (numpy.ndarray): cube-shaped change of each share since the previous
+      quarter, NaN for the first quarter and where either quarter is missing
+    missing (numpy.ndarray): bool cube, True where there is no share
+    grades (numpy.ndarray): int8 cube of the grade of each share, the worse of the
+      grades of its value and of its total (cube.NO_GRADE when either has none)
+  '''
+
+  def __init__(self, data_cube, total, shares, changes):
+    self.cube = data_cube
+    self.total = total
+    self.shares = shares
+    self.changes = changes
+    self.missing = np.isnan(shares)
+    cell_grades = data_cube.grades
+    total_grades = cell_grades[:, :, total:total + 1, :]
+    # NO_GRADE is below every grade, so np.maximum() alone would let a graded total
+    # stand in for a value without a grade
+    self.grades = np.where((cell_grades == cube.NO_GRADE) | (total_grades == cube.NO_GRADE),
+                           np.int8(cube.NO_GRADE), np.maximum(cell_grades, total_grades))
+
+  @property
+  def total_label(self):
+    return self.cube.labels['characteristic'][self.total]
+
+  def _cells(self, noc, characteristic, geo=None):
+    '''
+      Yields the (cell, date position) of every row of one selection, by label, in
+      the order VacancyCube.rows() returns them.
+    '''
+    noc_position = self.cube.index('noc', noc)
+    characteristic_position = self.cube.index('characteristic', characteristic)
+    if noc_position is None or characteristic_position is None:
+      return
+
+    if geo is None:
+      geo_positions = range(len(self.cube.labels['geo']))
+    else:
+      geo_position = self.cube.index('geo', geo)
+      geo_positions = [] if geo_position is None else [geo_position]
+
+    for geo_position in geo_positions:
+      cell = (geo_position, noc_position, characteristic_position)
+      for date_position in np.flatnonzero(self.cube.status[cell] != cube.NO_ROW_STATUS):
+        yield cell, date_position
+
+  def shares_for(self, noc, characteristic, geo=None, min_grade=None):
+    '''
+      Returns the shares of one selection, by label, lined up with the rows
+      VacancyCube.rows() returns for the same selection.
+
+      Parameters:
+      min_grade (int): leave out (as None) the shares graded worse than this grade
+        (see cube.grade_rank()), or None to keep every share
+
+      Returns:
+      list: one share (or None when missing) per row
+    '''
+    shares = []
+    for cell, date_position in self._cells(noc, characteristic, geo):
+      share = self.shares[cell][date_position]
+      grade = self.grades[cell][date_position]
+      left_out = min_grade is not None and (grade == cube.NO_GRADE or grade > min_grade)
+      shares.append(None if np.isnan(share) or left_out else float(share))
+    return shares
+
+  def status_for(self, noc, characteristic, geo=None):
+    '''
+      Returns the STATUS grade of the shares of one selection, lined up like
+      shares_for(): a letter, or '' when neither the value nor the total has one.
+    '''
+    return [cube.grade_label(self.grades[cell][date_position])
+            for cell, date_position in self._cells(noc, characteristic, geo)]
+
+
+def total_position(data_cube):
+  '''
+    Finds the total characteristic of a cube.
+
+    Returns:
+    int: its position on the characteristic axis
+
+    Raises:
+    ValueError: when no characteristic looks like a total
+  '''
+  for position, label in enumerate(data_cube.labels['characteristic']):
+    if TOTAL_LABEL_PATTERN.search(label):
+      return position
+  raise ValueError("No total characteristic (e.g. '..., all types') in this file")
+
+
+def compute_proportions(data_cube, total=None):
+  '''
+    Computes the shares of every cell of a cube in one pass.
+
+    Parameters:
+    data_cube (VacancyCube): the cube
+    total (int): position of the total characteristic, found by default
+
+    Returns:
+    Proportions: the shares and their quarter-over-quarter changes
+  '''
+  if total is None:
+    total = total_position(data_cube)
+
+  # The totals, kept as a characteristic axis of length 1 so they divide every characteristic
+  totals = data_cube.values[:, :, total:total + 1, :]
+  with np.errstate(divide='ignore', invalid='ignore'):
+    shares = np.where(totals > 0, data_cube.values / totals, np.nan)
+
+  # NaN in either quarter gives NaN, so missing shares never look like a change
+  changes = np.full_like(shares, np.nan)
+  changes[..., 1:] = np.diff(shares, axis=-1)
+
+  return Proportions(data_cube, total, shares, changes)
+
+
+def load_proportions(file_name, total_label=None):
+  '''
+    Returns the Proportions of 'file_name', computing them once per loaded cube.
+
+    Parameters:
+    file_name (str): The path to the CSV file.
+    total_label (str): the label of the total characteristic, found by default
+
+    Raises:
+    ValueError: when there is no such total characteristic
+  '''
+  data_cube = cube.load_cube(file_name)
+  total = None
+  if total_label is not None:
+    total = data_cube.index('characteristic', total_label)
+    if total is None:
+      raise ValueError(f"No characteristic '{total_label}' in this file")
+
+  computed = _computed_proportions.get(data_cube)
+  if computed is None or (total is not None and computed.total != total):
+    with profiling.stage('proportions'):
+      computed = compute_proportions(data_cube, total)
+    _computed_proportions[data_cube] = computed
+  return computed
+
+
+def update_proportions(old_cube, data_cube, dates):
+  '''
+    Computes the Proportions of 'data_cube' from those of 'old_cube', an older
+    version of the same cube (see cube.update_cube()), when only the quarters 'dates'
+    changed: the other shares are copied and only those quarters, and the change
+    of the quarter after each, are computed again. Nothing is done when no
+    Proportions of 'old_cube' were computed.
+
+    Parameters:
+    old_cube (VacancyCube): the cube before the update
+    data_cube (VacancyCube): the cube after the update
+    dates (iterable): the REF_DATE labels of the changed quarters
+
+    Returns:
+    Proportions: the shares of 'data_cube', or None
+  '''
+  old = _computed_proportions.get(old_cube)
+  if old is None:
+    return None
+
+  old_cells = np.ix_(*(np.arange(length) for length in old_cube.shape[:-1]),
+                     np.array([data_cube.index('ref_date', label) for label in old_cube.labels['ref_date']], dtype=np.intp))
+  shares = np.full(data_cube.shape, np.nan)
+  shares[old_cells] = old.shares
+  changes = np.full(data_cube.shape, np.nan)
+  changes[old_cells] = old.changes
+
+  changed = np.array(sorted(data_cube.index('ref_date', label) for label in set(dates)), dtype=np.intp)
+  if len(changed):
+    totals = data_cube.values[:, :, old.total:old.total + 1, changed]
+    with np.errstate(divide='ignore', invalid='ignore'):
+      shares[..., changed] = np.where(totals > 0, data_cube.values[..., changed] / totals, np.nan)
+
+    # A quarter's change depends on it and on the quarter before it
+    recomputed = np.union1d(changed, changed + 1)
+    recomputed = recomputed[recomputed < data_cube.shape[-1]]
+    changes[..., recomputed] = np.nan
+    later = recomputed[recomputed > 0]
+    changes[..., later] = shares[..., later] - shares[..., later - 1]
+
+  computed = Proportions(data_cube, old.total, shares, changes)
+  _computed_proportions[data_cube] = computed
+  return computed
+
+
+def share_rows(proportions):
+  '''
+    Lists every cell of the cube the file has a row for, with its share.
+
+    Returns:
+    list: rows in the order of OUTPUT_HEADER, missing numbers as None
+  '''
+  data_cube = proportions.cube
+  labels = data_cube.labels
+  rows = []
+  for geo, noc, characteristic, date in zip(*np.nonzero(data_cube.status != cube.NO_ROW_STATUS), strict=True):
+    total = data_cube.values[geo, noc, proportions.total, date]
+    share = proportions.shares[geo, noc, characteristic, date]
+    change = proportions.changes[geo, noc, characteristic, date]
+    grade = proportions.grades[geo, noc, characteristic, date]
+    rows.append([
+        labels['ref_date'][date],
+        labels['geo'][geo],
+        labels['noc'][noc],
+        labels['characteristic'][characteristic],
+        loader.output_value(data_cube.values[geo, noc, characteristic, date]),
+        loader.output_value(total),
+        None if np.isnan(share) else round(float(share), 6),
+        None if np.isnan(change) else round(float(change), 6),
+        cube.grade_label(grade),
+    ])
+  return rows
+
+
+def main(argv):
+  '''
+    Writes every share of a data file to the console as CSV.
+  '''
+  if len(argv) != 2:
+    print("Usage: python -m vacancies.proportions <file_name>")
+    sys.exit(1)
+
+  file_name = argv[1]
+  try:
+    proportions = load_proportions(file_name)
+  except FileNotFoundError:
+    print(f"File not found: {file_name}")
+    sys.exit(2)
+  except ValueError as e:
+    print(f"Cannot compute proportions: {e}")
+    sys.exit(3)
+
+  csv_writer = csv.writer(sys.stdout)
+  csv_writer.writerow(OUTPUT_HEADER)
+  csv_writer.writerows(share_rows(proportions))
+
+
+if __name__ == "__main__":
+  main(sys.argv)
@@ -0,0 +1,347 @@
+'''
+quality.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Every StatCan value comes with a STATUS: a quality grade from A (excellent) to
+    F (too unreliable to be published, its VALUE is left empty). This module works
+    out, for the whole cube of a file at once (see cube.py):
+
+      1. the grade of every cell, as a small integer (0 for A ... 5 for F, see
+         VacancyCube.grades)
+      2. the state of every cell: reported (it has a value, which may be 0),
+         suppressed (the file has a row, but no value) or no row at all
+      3. sums (or means) of the values over any axes, using only the cells that are
+         reported and graded well enough, each weighted by its grade if asked to
+
+    A sum over cells that are all suppressed or excluded is missing (empty), never
+    0, and every aggregate says how many of its cells were reported, suppressed and
+    excluded, and the worst grade it used.
+
+    When the noc or characteristic axis is summed over, its total label (e.g. "Total,
+    all occupations") is left out, so nothing is counted twice; see used_labels(),
+    which parallel.py applies too. The cells can be narrowed down first with
+    a filter (see filters.py), e.g. to leave out the geographies that add up to
+    another one.
+
+    Commandline Parameters (run as "python -m vacancies.quality"):
+      argv[1]               path to the input file
+      --by <axis>...        the axes kept (default: ref_date characteristic); the
+                            others (geo, noc, characteristic, ref_date) are summed over
+      --min-grade <grade>   leave out the cells graded worse than this (e.g. C)
+      --weight <grade>=<w>  weight the cells of a grade (e.g. E=0.5), default 1
+      --mean                average the cells instead of summing them
+      --where <filter>      only use the cells that pass a filter
+      --workers <N>         sum the file in N worker processes (see parallel.py)
+      The aggregates are written through the sinks of VACANCIES_OUTPUT (see output.py).
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'numpy' grades and sums the whole cube at once
+import numpy as np
+
+# 'cube' loads a data file as arrays
+from vacancies import cube
+
+# 'filters' narrows the cells down
+from vacancies import filters
+
+# 'loader' knows the STATUS grades and turns sums back into numbers
+from vacancies import loader
+
+# 'output' writes the aggregates
+from vacancies import output
+
+# 'profiling' times the aggregation when profiling is on
+from vacancies import profiling
+
+# 'proportions' recognises the total labels
+from vacancies import proportions
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+
+#
+#  The state of a cell
+#
+REPORTED = 0
+SUPPRESSED = 1
+NO_ROW = 2
+
+#
+#  The axes whose total label is left out when they are summed over
+#
+TOTAL_AXES = ('noc', 'characteristic')
+
+DEFAULT_BY = ('ref_date', 'characteristic')
+STATISTICS = ('sum', 'mean')
+AXIS_HEADER = {'geo': "Geo", 'noc': "National Occupation Classification",
+               'characteristic': "Job Vacancy Characteristic", 'ref_date': "Ref Date"}
+AGGREGATE_HEADER = ["Value", "Reported", "Suppressed", "Excluded", "Worst Grade"]
+
+
+class Aggregate:
+  '''
+    Values of a cube summed (or averaged) over some of its axes.
+
+    Attributes:
+    by (tuple): the axes kept, in order
+    labels (dict): axis -> labels, for the axes kept
+    values (numpy.ndarray): the sums (or means), NaN where no cell was used
+    reported (numpy.ndarray): the number of cells with a value
+    suppressed (numpy.ndarray): the number of cells with a row but no value
+    excluded (numpy.ndarray): the number of cells with a value left out for their
+      grade or with a weight of 0
+    worst_grade (numpy.ndarray): the worst grade used, cube.NO_GRADE when none was
+    weight_sums (numpy.ndarray): the sum of the weights of the cells used, so partial
+      aggregates can be merged (see parallel.py)
+  '''
+
+  def __init__(self, by, labels, values, reported, suppressed, excluded, worst_grade, weight_sums):
+    self.by = by
+    self.labels = labels
+    self.values = values
+    self.reported = reported
+    self.suppressed = suppressed
+    self.excluded = excluded
+    self.worst_grade = worst_grade
+    self.weight_sums = weight_sums
+
+  def header(self):
+    return [AXIS_HEADER[axis] for axis in self.by] + AGGREGATE_HEADER
+
+  def rows(self):
+    '''
+      Returns one row per combination of the labels kept, in the order of header().
+    '''
+    rows = []
+    for position in np.ndindex(*self.values.shape):
+      rows.append([self.labels[axis][index] for axis, index in zip(self.by, position, strict=True)] + [
+          loader.output_value(round(float(self.values[position]), 6)),
+          int(self.reported[position]),
+          int(self.suppressed[position]),
+          int(self.excluded[position]),
+          cube.grade_label(self.worst_grade[position]),
+      ])
+    return rows
+
+
+def parse_grade(text):
+  '''
+    Returns the grade of a grade letter given by the user.
+
+    Raises:
+    ValueError: when it is not one of loader.STATUS_GRADES
+  '''
+  grade = cube.grade_rank(str(text).strip().upper())
+  if grade == cube.NO_GRADE:
+    raise ValueError(f"Invalid STATUS grade '{text}', expected one of: {', '.join(loader.STATUS_GRADES)}")
+  return grade
+
+
+def states(data_cube):
+  '''
+    Returns the state of every cell of a cube (REPORTED, SUPPRESSED or NO_ROW), as an
+    int8 cube.
+  '''
+  return np.where(data_cube.status == cube.NO_ROW_STATUS, np.int8(NO_ROW),
+                  np.where(data_cube.missing, np.int8(SUPPRESSED), np.int8(REPORTED)))
+
+
+def weights(data_cube, min_grade=None, grade_weights=None):
+  '''
+    Returns the weight of every cell of a cube: 0 for the cells without a value or
+    graded worse than 'min_grade', otherwise the weight of their grade.
+
+    Parameters:
+    data_cube (VacancyCube): the cube
+    min_grade (int): the worst grade used, or None for every grade; the cells whose
+      STATUS is not a grade are left out too when it is given
+    grade_weights (dict): grade letter -> weight, 1 for the grades not given
+
+    Returns:
+    numpy.ndarray: float64 cube of weights
+  '''
+  cell_grades = data_cube.grades
+  lookup = np.ones(len(loader.STATUS_GRADES) + 1)
+  for grade, weight in (grade_weights or {}).items():
+    lookup[parse_grade(grade)] = weight
+  if min_grade is not None:
+    lookup[min_grade + 1:] = 0
+    lookup[cube.NO_GRADE] = 0
+
+  # NO_GRADE (-1) indexes the last entry of the lookup
+  cell_weights = lookup[cell_grades]
+  cell_weights[data_cube.missing] = 0
+  return cell_weights
+
+
+def _axis_masks(data_cube, where):
+  '''
+    Returns, for each axis of a cube, which of its labels pass a filter.
+  '''
+  return [np.fromiter((where is None or where.matches(axis, label, number)
+                       for number, label in enumerate(data_cube.labels[axis], start=1)),
+                      dtype=bool, count=len(data_cube.labels[axis]))
+          for axis in cube.AXES]
+
+
+def used_labels(axis, labels):
+  '''
+    Tells which labels of an axis are used when it is summed over: all of them, but
+    the total label of a TOTAL_AXES axis.
+
+    Returns:
+    numpy.ndarray: one bool per label
+  '''
+  if axis not in TOTAL_AXES:
+    return np.ones(len(labels), dtype=bool)
+  return np.array([not proportions.TOTAL_LABEL_PATTERN.search(label) for label in labels], dtype=bool)
+
+
+def check_arguments(by, statistic):
+  '''
+    Checks the axes kept and the statistic of an aggregation.
+
+    Raises:
+    ValueError: when an axis or the statistic is unknown
+  '''
+  unknown = [axis for axis in by if axis not in cube.AXES]
+  if unknown or len(set(by)) != len(by):
+    raise ValueError(f"Invalid axes {', '.join(by)}, expected some of: {', '.join(cube.AXES)}")
+  if statistic not in STATISTICS:
+    raise ValueError(f"Unknown statistic '{statistic}', use one of: {', '.join(STATISTICS)}")
+
+
+def aggregate(data_cube, by=DEFAULT_BY, min_grade=None, grade_weights=None, statistic='sum', where=None):
+  '''
+    Sums (or averages) the values of a cube over the axes not in 'by'.
+
+    Parameters:
+    data_cube (VacancyCube): the cube
+    by (tuple): the axes kept, from cube.AXES
+    min_grade (int): the worst grade used, see weights()
+    grade_weights (dict): grade letter -> weight, see weights()
+    statistic (str): 'sum' for weighted sums, 'mean' for weighted means
+    where (Filter): only use the cells that pass it, or None for every cell
+
+    Returns:
+    Aggregate: the aggregates
+
+    Raises:
+    ValueError: when an axis or the statistic is unknown
+  '''
+  by = tuple(by)
+  check_arguments(by, statistic)
+
+  with profiling.stage('aggregate', by=','.join(by)):
+    #
+    #  The cells used: those passing the filter, without the totals of the axes
+    #  summed over
+    #
+    masks = _axis_masks(data_cube, where)
+    for position, axis in enumerate(cube.AXES):
+      if axis not in by:
+        masks[position] &= used_labels(axis, data_cube.labels[axis])
+    selected = np.ix_(*masks)
+    cell_states = states(data_cube)[selected]
+    if where is not None and not where.matches('statistics', data_cube.statistics):
+      cell_states = np.full_like(cell_states, NO_ROW)
+    if where is not None and 'status' in where.tests:
+      passes = np.array([where.matches('status', label) for label in data_cube.status_labels] + [True])
+      cell_states = np.where(passes[data_cube.status[selected]], cell_states, np.int8(NO_ROW))
+    cell_grades = data_cube.grades[selected]
+    cell_weights = weights(data_cube, min_grade, grade_weights)[selected]
+    cell_weights[cell_states == NO_ROW] = 0
+    values = np.where(cell_weights > 0, data_cube.values[selected], 0.0)
+
+    #
+    #  Sum over the axes not kept; the axes kept stay in the order of the cube and
+    #  are then put in the order of 'by'
+    #
+    summed = tuple(position for position, axis in enumerate(cube.AXES) if axis not in by)
+    kept = [axis for axis in cube.AXES if axis in by]
+    order = [kept.index(axis) for axis in by]
+
+    def total(array):
+      return np.transpose(array.sum(axis=summed), order)
+
+    used = cell_weights > 0
+    weight_sums = total(cell_weights)
+    sums = total(values * cell_weights)
+    with np.errstate(divide='ignore', invalid='ignore'):
+      results = np.where(weight_sums > 0, sums if statistic == 'sum' else sums / weight_sums, np.nan)
+    worst_grade = np.transpose(np.where(used, cell_grades, np.int8(cube.NO_GRADE)).max(axis=summed, initial=cube.NO_GRADE), order)
+
+    return Aggregate(
+        by,
+        {axis: [label for label, keep in zip(data_cube.labels[axis], masks[cube.AXES.index(axis)], strict=True) if keep] for axis in by},
+        results,
+        total(cell_states == REPORTED),
+        total(cell_states == SUPPRESSED),
+        total((cell_states == REPORTED) & ~used),
+        worst_grade,
+        weight_sums,
+    )
+
+
+def main(argv):
+  '''
+    Writes the aggregates of the file given on the command line.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.quality',
+                                   description='Sum job vacancies over some axes, by STATUS quality grade.')
+  parser.add_argument('file_name', help='path to the input file')
+  parser.add_argument('--by', nargs='+', default=list(DEFAULT_BY), choices=cube.AXES, help='the axes kept')
+  parser.add_argument('--min-grade', help='leave out the cells graded worse than this')
+  parser.add_argument('--weight', action='append', default=[], help='<grade>=<weight>, e.g. E=0.5')
+  parser.add_argument('--mean', action='store_true', help='average the cells instead of summing them')
+  parser.add_argument('--where', help='only use the cells that pass this filter')
+  parser.add_argument('--workers', type=int, help='sum the file in this many worker processes')
+  arguments = parser.parse_args(argv[1:])
+
+  try:
+    grade_weights = {}
+    for entry in arguments.weight:
+      grade, separator, weight = entry.partition('=')
+      if not separator:
+        raise ValueError(f"Invalid weight '{entry}', expected <grade>=<weight>")
+      grade_weights[grade] = float(weight)
+    min_grade = None if arguments.min_grade is None else parse_grade(arguments.min_grade)
+    where = None if arguments.where is None else filters.compile_filter(arguments.where)
+
+    statistic = 'mean' if arguments.mean else 'sum'
+    if arguments.workers is None:
+      aggregated = aggregate(cube.load_cube(arguments.file_name), arguments.by, min_grade, grade_weights, statistic, where)
+    else:
+      # Imported here, since parallel.py sums the byte ranges with this module
+      from vacancies import parallel
+      aggregated = parallel.aggregate_files([arguments.file_name], arguments.by, min_grade, grade_weights, statistic,
+                                            where, arguments.workers)[arguments.file_name]
+    output.write_rows(aggregated.rows(), output.open_sinks(header=aggregated.header()))
+  except FileNotFoundError:
+    print(f"File not found: {arguments.file_name}")
+    return 2
+  except ValueError as e:
+    print(f"Cannot aggregate: {e}")
+    return 3
+  return 0
+
+
+if __name__ == "__main__":
+  profiling.configure()
+  sys.exit(main(sys.argv))
@@ -0,0 +1,299 @@
+'''
+registry.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    Every question is answered the same way: the user picks a job vacancy
+    characteristic and a National Occupation Classification (NOC) from the labels of
+    the question's data file, and gets the matching rows. This module holds one
+    definition per question and the code they all share.
+
+    A definition only says:
+      1. the question number and the question itself
+      2. the data file that answers it
+      3. what its characteristics are called (e.g. "recruitment strategy")
+      4. optionally the label of the total characteristic; by default it is the one
+         that reads like "..., all types" (see proportions.py)
+
+    The characteristic and NOC choices are read from the data file itself, in the order
+    the file lists them, so they always match what the file holds. A fifth question
+    only needs a new Question in QUESTIONS (or register()).
+
+    Instead of asking for a selection, the question scripts can take a filter after
+    --where (see filters.py), e.g. every NOC for social media in 2023:
+
+        question1.py dataFiles/dataForQuestion1.csv --where "characteristic = 6 and ref_date = 2023"
+
+    The question scripts write the rows of each query for plotting.py to a file of its
+    own (dataForPlotting-q<question>-<unique id>.csv), so any number of queries can run
+    at the same time. The file is written under a temporary name and renamed when
+    complete (see output.py). A plotting file given with a .parquet or .arrow suffix
+    is written in that format, so plotting.py reads it without parsing any text.
+
+    Environment variables:
+      VACANCIES_PLOT_DIR  the folder of the files for plotting.py (default: the
+                          current folder)
+'''
+
+#
+#   Packages and modules
+#
+
+# 'os' builds the paths of the data files
+import os
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'uuid' gives the file for plotting.py of every query a name of its own
+import uuid
+
+# 'cache' knows the project folder
+from vacancies import cache
+
+# 'cube' gives the labels of a file that is already loaded
+from vacancies import cube
+
+# 'filters' selects the rows of a --where filter
+from vacancies import filters
+
+# 'index' reads the rows of a selection, and the labels of a file that is not loaded
+from vacancies import index
+
+# 'loader' tells if a file is loaded and gives the header of the rows
+from vacancies import loader
+
+# 'output' writes the selected rows
+from vacancies import output
+
+# 'profiling' times the writing when profiling is on
+from vacancies import profiling
+
+# 'proportions' recognises the label of the total characteristic
+from vacancies import proportions
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+DATA_DIR = os.path.join(cache.PROJECT_DIR, 'dataFiles')
+PLOT_DIR_VARIABLE = 'VACANCIES_PLOT_DIR'
+PLOTTING_FILE_PATTERN = 'dataForPlotting-q{question}-{token}.csv'
+WHERE_OPTION = '--where'
+
+#
+#  Position of each axis in the keys of a row index, see index.py
+#
+INDEX_KEY_POSITIONS = {'noc': 0, 'characteristic': 1, 'geo': 2}
+
+
+class Question:
+  '''
+    The definition of one question.
+
+    Attributes:
+    number (int): the question number
+    title (str): the question, as shown in the menu of main.py
+    data_file (str): the path of the data file that answers it
+    characteristic_name (str): what the characteristics of the file are called
+    total_label (str): the label of the total characteristic, or None to find it
+  '''
+
+  def __init__(self, number, title, data_file, characteristic_name, total_label=None):
+    self.number = number
+    self.title = title
+    self.data_file = data_file
+    self.characteristic_name = characteristic_name
+    self.total_label = total_label
+
+  def choices(self, axis, file_name=None):
+    '''
+      Returns the menu of one axis ('noc' or 'characteristic'), read from the data file.
+
+      Returns:
+      dict: menu number (from 1) -> label, in the order of the file
+    '''
+    return dict(enumerate(vocabulary(file_name or self.data_file, axis), start=1))
+
+  def total(self, file_name=None):
+    '''
+      Returns the label of the total characteristic.
+
+      Raises:
+      ValueError: when no characteristic looks like a total
+    '''
+    if self.total_label is not None:
+      return self.total_label
+    for label in vocabulary(file_name or self.data_file, 'characteristic'):
+      if proportions.TOTAL_LABEL_PATTERN.search(label):
+        return label
+    raise ValueError("No total characteristic (e.g. '..., all types') in this file")
+
+  def find_rows(self, file_name, noc, characteristic):
+    '''
+      Finds the rows of a data file for one occupation and characteristic.
+
+      Parameters:
+      file_name (str): The path to the CSV file.
+      noc (str): the National Occupation Classification, as written in the file
+      characteristic (str): the characteristic, as written in the file
+
+      Returns:
+      list: one [ref date, geo, occupation, characteristic, statistics, value] row per
+      quarter; the value is None when it was suppressed (left empty in the file)
+    '''
+    return index.select_rows(file_name, noc, characteristic)
+
+  def ask_selection(self, file_name=None):
+    '''
+      Asks the user for the characteristic and the National Occupation Classification
+      they are looking for.
+
+      Returns:
+      tuple: (occupation, characteristic) as they are written in the data file
+    '''
+    characteristic = ask_choice(f"Enter the number of the {self.characteristic_name} you are looking for:",
+                                self.choices('characteristic', file_name))
+    noc = ask_choice("Enter the number of the type of National Occupation Classification you are looking for:",
+                     self.choices('noc', file_name))
+    return noc, characteristic
+
+  def plotting_file(self):
+    '''
+      Returns a new path, used by no other query, for the rows to plot.
+    '''
+    folder = os.environ.get(PLOT_DIR_VARIABLE) or '.'
+    return os.path.join(folder, PLOTTING_FILE_PATTERN.format(question=self.number, token=uuid.uuid4().hex[:12]))
+
+  def run_script(self, argv):
+    '''
+      The main function of the question scripts: asks the user for a selection in the
+      file given on the command line (or selects the rows of the filter given after
+      --where), prints the matching rows and writes them for plotting.py, to the file
+      given after the data file or to a new file of its own.
+    '''
+    argv = list(argv)
+    where = None
+    if WHERE_OPTION in argv:
+      position = argv.index(WHERE_OPTION)
+      where = argv[position + 1] if position + 1 < len(argv) else ''
+      del argv[position:position + 2]
+    if len(argv) not in (2, 3):
+      print(f"Usage: question{self.number}.py <file_name> [<plotting_file>] [{WHERE_OPTION} <filter>]")
+      sys.exit(1)
+    file_name = argv[1]
+    plotting_file = argv[2] if len(argv) == 3 else self.plotting_file()
+
+    try:
+      if where is None:
+        noc, characteristic = self.ask_selection(file_name)
+        rows = self.find_rows(file_name, noc, characteristic)
+      else:
+        rows = filters.select_rows(file_name, where)
+
+      # Write the rows for plotting, and show them the way VACANCIES_OUTPUT asks for
+      # (printed by default), in bulk rather than row by row. The plotting sink is
+      # opened first, and aborted when the other sinks cannot be opened, so a failure
+      # leaves no temporary file behind.
+      with profiling.stage('write', rows=len(rows)):
+        plotting_sink = output.FILE_SINKS[loader.columnar_format(plotting_file) or 'csv'](loader.OUTPUT_HEADER, plotting_file)
+        try:
+          sinks = output.open_sinks() + [plotting_sink]
+        except BaseException:
+          plotting_sink.abort()
+          raise
+        output.write_rows(rows, sinks)
+      print(f"Rows for plotting written to {plotting_file} (python plotting.py {plotting_file})")
+
+    except FileNotFoundError:
+      print(f"File not found: {file_name}")
+      sys.exit(2)
+    except filters.FilterError as e:
+      print(f"Invalid filter: {e}")
+      sys.exit(1)
+    except Exception as e:
+      print(f"An unexpected error occurred: {e}")
+      sys.exit(3)
+
+
+def vocabulary(file_name, axis):
+  '''
+    Returns the labels of one axis ('noc', 'characteristic' or 'geo') of a data file,
+    in the order the file lists them. They come from the loaded table when there is
+    one (or the file is a Parquet or Arrow file), otherwise from the file's row
+    index, so the file is not parsed for them.
+  '''
+  if loader.is_loaded(file_name) or loader.columnar_format(file_name):
+    return list(cube.load_cube(file_name).labels[axis])
+  position = INDEX_KEY_POSITIONS[axis]
+  return list(dict.fromkeys(key[position] for key in index.load_index(file_name).keys))
+
+
+def get_valid_integer(lower_bound, upper_bound):
+  '''
+    Asks until the user enters an integer between the bounds.
+  '''
+  while True:
+    try:
+      user_input = int(input("Enter your choice: "))
+      if lower_bound <= user_input <= upper_bound:
+        return user_input
+      print(f"Please enter an integer between {lower_bound} and {upper_bound}.")
+    except ValueError:
+      print("Please enter a valid integer.")
+
+
+def ask_choice(prompt, choices):
+  '''
+    Shows a numbered menu and returns the label the user picks.
+  '''
+  print(prompt)
+  print('\n'.join(f"{number}. {label}" for number, label in choices.items()))
+  return choices[get_valid_integer(min(choices), max(choices))]
+
+
+#
+#  The questions, by number
+#
+QUESTIONS = {}
+
+
+def register(question):
+  '''
+    Adds a question to QUESTIONS, replacing any question with the same number.
+  '''
+  QUESTIONS[question.number] = question
+  return question
+
+
+def get_question(number):
+  '''
+    Returns the question with a number.
+
+    Raises:
+    ValueError: when there is no such question
+  '''
+  if number not in QUESTIONS:
+    raise ValueError(f"Invalid question {number}, expected a number between {min(QUESTIONS)} and {max(QUESTIONS)}")
+  return QUESTIONS[number]
+
+
+register(Question(
+    1, "What is the proportion of job vacancies for people who got their job through social media quarterly, "
+       "without adjusting for seasonality, in Canada?",
+    os.path.join(DATA_DIR, 'dataForQuestion1.csv'), 'recruitment strategy'))
+register(Question(
+    2, "What is the proportion of job vacancies, with no minimum level of education required quarterly, "
+       "without adjusting for seasonality, in Canada?",
+    os.path.join(DATA_DIR, 'dataForQuestion2.csv'), 'minimum level of education'))
+register(Question(
+    3, "What is the proportion of job vacancies for people with more than 8 years of experience quarterly, "
+       "without adjusting for seasonality, in Canada?",
+    os.path.join(DATA_DIR, 'dataForQuestion3.csv'), 'minimum experience level'))
+register(Question(
+    4, "What is the proportion of job vacancies that last for less than 15 days on the market before they "
+       "are filled quarterly, without adjusting for seasonality, in Canada?",
+    os.path.join(DATA_DIR, 'dataForQuestion4.csv'), 'duration of job vacancy'))
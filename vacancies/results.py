@@ -0,0 +1,336 @@
+'''
+results.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The same selections are asked for over and over. This module keeps the answers on
+    disk, next to the table cache of cache.py, so a repeated selection is answered
+    without loading the data file or drawing the chart again.
+
+    An answer is kept under a key made of:
+      1. the SHA-256 hash of the data file's content
+      2. the question number, the characteristic and the NOC
+      3. the output format: a series ('rows' for the selected rows, 'proportions' for
+         their shares, 'status' for their grades) or 'png' / 'svg' for the chart
+      4. RESULT_VERSION, the version of the form of the answers
+
+    Since the key holds the content hash, an answer is never used once its data file
+    has changed. The answers are evicted least recently used first once their total
+    size goes over a cap.
+
+    A long-running process such as server.py keeps its answers in a MemoryCache
+    instead, with the same keys and the same cap, so answering a repeated selection
+    touches no file at all.
+
+    Environment variables:
+      VACANCIES_RESULT_CACHE_BYTES  the size cap in bytes (default: 64 MB, 0 turns the
+                                    result cache off)
+      VACANCIES_NO_CACHE            set to 1 to turn every cache off, see cache.py
+'''
+
+#
+#   Packages and modules
+#
+
+# 'collections' keeps the answers of a MemoryCache in the order they were last used
+import collections
+
+# 'contextlib' ignores an answer another process removed first
+import contextlib
+
+# 'hashlib' names the file of each answer after its key
+import hashlib
+
+# 'json' stores the key and the selected rows
+import json
+
+# 'os' gives access to file sizes, timestamps and atomic renames
+import os
+
+# 'tempfile' gives each writer its own temporary file before the atomic rename
+import tempfile
+
+# 'cache' gives the cache folder and the content hash of the data files
+from vacancies import cache
+
+# 'profiling' times the cache hits when profiling is on
+from vacancies import profiling
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+MAX_BYTES_VARIABLE = 'VACANCIES_RESULT_CACHE_BYTES'
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+RESULTS_FOLDER = 'results'
+RESULT_SUFFIX = '.result'
+
+#
+#  Part of every key; changed whenever the answers change form, so older answers are
+#  not used (2: suppressed values are None instead of 0; 3: a share has no grade when
+#  its value or its total has none)
+#
+RESULT_VERSION = 3
+
+#
+#  Content hashes already computed in this process, by path and (size, mtime_ns)
+#
+_file_versions = {}
+
+
+class ResultCache:
+  '''
+    A folder of answers, evicted least recently used first. The time an answer was
+    last used is the modification time of its file.
+
+    Attributes:
+    folder (str): where the answers are kept
+    max_bytes (int): the most bytes the answers may take up together
+  '''
+
+  def __init__(self, folder, max_bytes=DEFAULT_MAX_BYTES):
+    self.folder = folder
+    self.max_bytes = max_bytes
+
+  def _path(self, key):
+    name = hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+    return os.path.join(self.folder, name + RESULT_SUFFIX)
+
+  def get(self, key):
+    '''
+      Returns the bytes kept under 'key', or None.
+    '''
+    path = self._path(key)
+    try:
+      with open(path, 'rb') as result_file:
+        data = result_file.read()
+      # Mark the answer as just used
+      os.utime(path)
+    except OSError:
+      return None
+    return data
+
+  def put(self, key, data):
+    '''
+      Keeps 'data' under 'key' and evicts old answers if the cap is exceeded. The
+      cache is only a speed-up, so a folder we cannot write to is not an error.
+    '''
+    if len(data) > self.max_bytes:
+      return
+    try:
+      os.makedirs(self.folder, exist_ok=True)
+      file_descriptor, temporary_path = tempfile.mkstemp(dir=self.folder, suffix='.tmp')
+      try:
+        with os.fdopen(file_descriptor, 'wb') as result_file:
+          result_file.write(data)
+        os.replace(temporary_path, self._path(key))
+      except BaseException:
+        os.unlink(temporary_path)
+        raise
+      self.evict()
+    except OSError:
+      pass
+
+  def evict(self):
+    '''
+      Removes the least recently used answers until the rest fit under the cap.
+    '''
+    entries = []
+    with os.scandir(self.folder) as scanned:
+      for entry in scanned:
+        if entry.name.endswith(RESULT_SUFFIX):
+          stat = entry.stat()
+          entries.append((stat.st_mtime_ns, stat.st_size, entry.path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+      if total <= self.max_bytes:
+        break
+      with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+      total -= size
+
+  def clear(self):
+    '''
+      Removes every answer.
+    '''
+    max_bytes, self.max_bytes = self.max_bytes, 0
+    try:
+      self.evict()
+    except FileNotFoundError:
+      pass
+    finally:
+      self.max_bytes = max_bytes
+
+
+class MemoryCache:
+  '''
+    Answers kept in memory, evicted least recently used first, with the same get()
+    and put() as ResultCache.
+
+    Attributes:
+    max_bytes (int): the most bytes the answers may take up together
+  '''
+
+  def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+    self.max_bytes = max_bytes
+    self._entries = collections.OrderedDict()
+    self._bytes = 0
+
+  def get(self, key):
+    '''
+      Returns the bytes kept under 'key', or None.
+    '''
+    name = json.dumps(key, sort_keys=True)
+    data = self._entries.get(name)
+    if data is not None:
+      self._entries.move_to_end(name)
+    return data
+
+  def put(self, key, data):
+    '''
+      Keeps 'data' under 'key' and evicts old answers if the cap is exceeded.
+    '''
+    if len(data) > self.max_bytes:
+      return
+    name = json.dumps(key, sort_keys=True)
+    old = self._entries.pop(name, None)
+    if old is not None:
+      self._bytes -= len(old)
+    self._entries[name] = data
+    self._bytes += len(data)
+    while self._bytes > self.max_bytes:
+      _, evicted = self._entries.popitem(last=False)
+      self._bytes -= len(evicted)
+
+  def clear(self):
+    '''
+      Removes every answer.
+    '''
+    self._entries.clear()
+    self._bytes = 0
+
+
+def default_cache():
+  '''
+    Returns the result cache in the cache folder, or None when it is turned off.
+  '''
+  max_bytes = int(os.environ.get(MAX_BYTES_VARIABLE) or DEFAULT_MAX_BYTES)
+  if not cache.enabled() or max_bytes <= 0:
+    return None
+  return ResultCache(os.path.join(cache.cache_dir(), RESULTS_FOLDER), max_bytes)
+
+
+def file_version(file_name):
+  '''
+    Returns the SHA-256 hash of a data file's content. It is taken from the file's
+    table cache when that is up to date, so the file is only read when it changed.
+  '''
+  path = os.path.abspath(file_name)
+  stat = os.stat(path)
+  version = (path, stat.st_size, stat.st_mtime_ns)
+
+  digest = _file_versions.get(version)
+  if digest is None:
+    stored = cache.read_store(cache.cache_path(path)) if cache.enabled() else None
+    if stored is not None and (stored[0]['size'], stored[0]['mtime_ns']) == (stat.st_size, stat.st_mtime_ns):
+      digest = stored[0]['sha256']
+    else:
+      digest = cache.file_digest(path)
+    _file_versions[version] = digest
+  return digest
+
+
+def result_key(file_name, question, noc, characteristic, output_format):
+  '''
+    Builds the key of one answer, see the module summary.
+  '''
+  return {
+      'version': RESULT_VERSION,
+      'file': file_version(file_name),
+      'question': question,
+      'noc': noc,
+      'characteristic': characteristic,
+      'format': output_format,
+  }
+
+
+def query_series(file_name, question, noc, characteristic, series, compute, result_cache=None):
+  '''
+    Returns a series of a selection, from the result cache when it is there.
+
+    Parameters:
+    file_name (str): the data file
+    question (int): the question number
+    noc (str): the National Occupation Classification
+    characteristic (str): the job vacancy characteristic
+    series (str): the name of the series, e.g. 'rows' or 'proportions'
+    compute (function): takes no parameters and returns the series, a list that can
+      be written as JSON
+    result_cache (ResultCache): the cache to use (or a MemoryCache), default_cache()
+      by default
+
+    Returns:
+    list: the series
+  '''
+  result_cache = result_cache or default_cache()
+  if result_cache is None:
+    return compute()
+
+  key = result_key(file_name, question, noc, characteristic, series)
+  data = result_cache.get(key)
+  if data is not None:
+    with profiling.stage('result cache hit', format=series):
+      return json.loads(data)
+
+  values = compute()
+  result_cache.put(key, json.dumps(values).encode('utf-8'))
+  return values
+
+
+def query_rows(file_name, question, noc, characteristic, find_rows, result_cache=None):
+  '''
+    Returns the rows of a selection, from the result cache when they are there.
+
+    Parameters:
+    file_name, question, noc, characteristic: see query_series()
+    find_rows (function): takes (file_name, noc, characteristic) and finds the rows
+    result_cache (ResultCache): the cache to use, default_cache() by default
+
+    Returns:
+    list: the rows, as find_rows() returns them
+  '''
+  return query_series(file_name, question, noc, characteristic, 'rows',
+                      lambda: find_rows(file_name, noc, characteristic), result_cache)
+
+
+def query_figure(file_name, question, noc, characteristic, render, file_format='png', result_cache=None):
+  '''
+    Returns the chart of a selection as image bytes, from the result cache when it is
+    there.
+
+    Parameters:
+    file_name, question, noc, characteristic: see query_rows()
+    render (function): takes the file format and returns the image bytes
+    file_format (str): 'png' or 'svg'
+    result_cache (ResultCache): the cache to use, default_cache() by default
+
+    Returns:
+    bytes: the image
+  '''
+  result_cache = result_cache or default_cache()
+  if result_cache is None:
+    return render(file_format)
+
+  key = result_key(file_name, question, noc, characteristic, file_format)
+  data = result_cache.get(key)
+  if data is not None:
+    with profiling.stage('result cache hit', format=file_format):
+      return data
+
+  data = render(file_format)
+  result_cache.put(key, data)
+  return data
@@ -0,0 +1,233 @@
+'''
+streaming.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The full StatCan tables (every GEO, every characteristic, every quarter) are several
+    gigabytes, far more than parse_file() in loader.py should hold in Python objects.
+    This module reads such a file in fixed-size chunks of lines, as bytes cut into
+    fields by tokenizer.py, keeps only the rows wanted (optionally a set of GEOs and of
+    Statistics), dictionary-encodes them on the fly by the raw bytes of their labels
+    and spills each chunk's code arrays to temporary files. At the end the spilled
+    columns are copied into a compact store in the cache format of cache.py, which the
+    loader then maps into memory. Memory use is bounded by the chunk size plus the
+    label dictionaries, whatever the size of the file.
+
+    The byte order mark in front of the first header cell and the blank / footnote lines
+    StatCan adds after the data are skipped. The SHA-256 of the file is computed while
+    it is read, so no second pass is needed for the cache key.
+
+    Commandline Parameters (run as "python -m vacancies.streaming ..."):
+      argv[1] = path to the input file
+      argv[2] = path to the store to write
+      --geo <GEO>                 keep only this GEO (may be repeated)
+      --statistics <Statistics>   keep only this statistic (may be repeated)
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'array' holds the codes of the current chunk
+import array
+
+# 'hashlib' computes the content hash of the file while reading it
+import hashlib
+
+# 'io' buffers the hashing byte reader
+import io
+
+# 'itertools' cuts the rows into chunks
+import itertools
+
+# 'os' gives access to file sizes and timestamps
+import os
+
+# 'shutil' removes the folder of spilled chunks
+import shutil
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'tempfile' gives us a folder for the spilled chunks
+import tempfile
+
+# 'cache' writes the compact store
+from vacancies import cache
+
+# 'loader' knows the layout of a StatCan row
+from vacancies import loader
+
+# 'tokenizer' cuts the lines into fields as bytes
+from vacancies import tokenizer
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+CHUNK_ROWS = 100_000
+COPY_BLOCK_SIZE = 1 << 20
+
+
+class _HashingReader(io.RawIOBase):
+  '''
+    A byte reader that updates a hash with everything read through it.
+  '''
+
+  def __init__(self, raw_file, digest):
+    self._raw_file = raw_file
+    self.digest = digest
+
+  def readable(self):
+    return True
+
+  def readinto(self, buffer):
+    count = self._raw_file.readinto(buffer)
+    if count:
+      self.digest.update(memoryview(buffer)[:count])
+    return count
+
+
+class _SpilledColumn:
+  '''
+    One column being written chunk by chunk to a temporary file.
+  '''
+
+  def __init__(self, folder, name, typecode):
+    self.name = name
+    self.typecode = typecode
+    self.length = 0
+    self.chunk = array.array(typecode)
+    self.path = os.path.join(folder, f"{name}.bin")
+
+  def spill(self):
+    # Opened for each chunk, so no file is left open if the ingest stops half way
+    with open(self.path, 'ab' if self.length else 'wb') as spilled_file:
+      self.chunk.tofile(spilled_file)
+    self.length += len(self.chunk)
+    self.chunk = array.array(self.typecode)
+
+  def pieces(self):
+    if not self.length:
+      return
+    with open(self.path, 'rb') as spilled_file:
+      for block in iter(lambda: spilled_file.read(COPY_BLOCK_SIZE), b''):
+        yield block
+
+
+def ingest(source_path, store_path=None, geos=None, statistics=None, chunk_rows=CHUNK_ROWS):
+  '''
+    Streams a StatCan CSV file into a compact store.
+
+    Parameters:
+    source_path (str): the CSV file
+    store_path (str): the store to write; by default the cache file of 'source_path',
+      which is only allowed when no rows are filtered out
+    geos (set): the GEOs to keep, or None for all
+    statistics (set): the Statistics to keep, or None for all
+    chunk_rows (int): the number of rows read before spilling the codes to disk
+
+    Returns:
+    str: the path of the store written
+  '''
+  row_filter = None
+  if geos is not None or statistics is not None:
+    row_filter = {'geo': sorted(geos) if geos else None, 'statistics': sorted(statistics) if statistics else None}
+  if store_path is None:
+    if row_filter is not None:
+      raise ValueError("A filtered store needs its own store path, it cannot replace the cache of the whole file")
+    store_path = cache.cache_path(source_path)
+
+  stat = os.stat(source_path)
+  digest = hashlib.sha256()
+  # Lookups from the raw bytes of a label to its code, one per encoded column; the
+  # labels are decoded at the end, in the order their codes were given
+  lookups = {name: {} for name, _ in loader.ENCODED_COLUMNS}
+  # The GEOs and Statistics kept, each with whether the raw labels seen so far are
+  # among them
+  kept = [(position, wanted, {}) for position, wanted in ((loader.GEO_COLUMN, geos), (loader.STATISTICS_COLUMN, statistics))
+          if wanted is not None]
+
+  spill_folder = tempfile.mkdtemp(prefix='vacancies-ingest-')
+  try:
+    columns = [_SpilledColumn(spill_folder, name, loader.CODE_TYPECODE) for name, _ in loader.ENCODED_COLUMNS]
+    value_column = _SpilledColumn(spill_folder, 'value', loader.VALUE_TYPECODE)
+    encoded = [(column, lookups[name], position) for column, (name, position) in zip(columns, loader.ENCODED_COLUMNS, strict=True)]
+
+    with open(source_path, 'rb') as raw_file:
+      lines = io.BufferedReader(_HashingReader(raw_file, digest))
+
+      while True:
+        chunk = list(itertools.islice(lines, chunk_rows))
+        if not chunk:
+          break
+
+        for line in chunk:
+          # None for the header, the blank lines and the footnotes
+          fields = tokenizer.raw_fields(line)
+          if fields is None:
+            continue
+          passes = True
+          for position, wanted, seen in kept:
+            field = fields[position]
+            if field not in seen:
+              seen[field] = tokenizer.decode(field) in wanted
+            passes = passes and seen[field]
+          if not passes:
+            continue
+
+          for column, lookup, position in encoded:
+            field = fields[position]
+            code = lookup.get(field)
+            if code is None:
+              code = lookup[field] = len(lookup)
+            column.chunk.append(code)
+          value_column.chunk.append(loader.parse_value(fields[loader.VALUE_COLUMN]))
+
+        for column in columns + [value_column]:
+          column.spill()
+
+    dictionaries = {name: [tokenizer.decode(field) for field in lookups[name]] for name, _ in loader.ENCODED_COLUMNS}
+    key = cache.source_key(source_path, stat, digest.hexdigest())
+    key['filter'] = row_filter
+    cache.write_columns(store_path, key, dictionaries, [
+        (column.name, column.typecode, column.length, column.pieces())
+        for column in columns + [value_column]
+    ])
+  finally:
+    shutil.rmtree(spill_folder, ignore_errors=True)
+
+  return store_path
+
+
+def main(argv):
+  '''
+    Streams one CSV file into a store from the command line.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.streaming', description='Stream a StatCan CSV file into a compact store.')
+  parser.add_argument('file_name', help='path to the input file')
+  parser.add_argument('store', help='path to the store to write')
+  parser.add_argument('--geo', action='append', help='keep only this GEO (may be repeated)')
+  parser.add_argument('--statistics', action='append', help='keep only this statistic (may be repeated)')
+  parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='rows read before spilling to disk')
+  arguments = parser.parse_args(argv[1:])
+
+  try:
+    ingest(arguments.file_name, arguments.store,
+           geos=set(arguments.geo) if arguments.geo else None,
+           statistics=set(arguments.statistics) if arguments.statistics else None,
+           chunk_rows=arguments.chunk_rows)
+  except FileNotFoundError:
+    print(f"File not found: {arguments.file_name}")
+    return 2
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv))
@@ -0,0 +1,268 @@
+'''
+synthetic.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The data files in dataFiles/ only hold a few hundred rows, too few to show how the
+    code scales. This module writes synthetic files with the layout of a StatCan
+    download, as large as needed, to load-test the question scripts:
+
+      - the same 17 columns (REF_DATE, GEO, DGUID, ..., VALUE, STATUS, ..., DECIMALS),
+        every field double-quoted, with a byte order mark in front of the header
+      - rows ordered by GEO, NOC, characteristic and REF_DATE, one VECTOR and
+        COORDINATE per series, like StatCan
+      - a total characteristic ("..., all types") every other characteristic is a part
+        of, values rounded to 5 and quality grades A to E
+      - suppressed cells: an empty VALUE with STATUS "F"
+      - the blank lines, symbol legend and footnotes StatCan adds after the data
+
+    The numbers of quarters, GEOs, NOCs and characteristics can be chosen; labels beyond
+    the real ones are numbered. Rows are written one by one, so a file of any size
+    takes no more memory than a small one, and the same seed always gives the same file.
+
+    Commandline Parameters (run as "python -m vacancies.synthetic ..."):
+      argv[1] = path to the file to write
+      --quarters <N>, --geos <N>, --nocs <N>, --characteristics <N>
+      --start <YYYY-MM>     the first quarter
+      --suppressed <F>      the share of suppressed cells, between 0 and 1
+      --seed <N>            the seed of the random numbers
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'csv' writes the quoted StatCan rows
+import csv
+
+# 'random' makes up the values, from a fixed seed
+import random
+
+# 'sys' gives access to the command line parameters
+import sys
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+HEADER = ["REF_DATE", "GEO", "DGUID", "National Occupational Classification", "Job vacancy characteristics",
+          "Statistics", "UOM", "UOM_ID", "SCALAR_FACTOR", "SCALAR_ID", "VECTOR", "COORDINATE", "VALUE",
+          "STATUS", "SYMBOL", "TERMINATED", "DECIMALS"]
+
+GEOS = [
+    ("Canada", "2016A000011124"),
+    ("Newfoundland and Labrador", "2016A000210"),
+    ("Prince Edward Island", "2016A000211"),
+    ("Nova Scotia", "2016A000212"),
+    ("New Brunswick", "2016A000213"),
+    ("Quebec", "2016A000224"),
+    ("Ontario", "2016A000235"),
+    ("Manitoba", "2016A000246"),
+    ("Saskatchewan", "2016A000247"),
+    ("Alberta", "2016A000248"),
+    ("British Columbia", "2016A000259"),
+    ("Yukon", "2016A000260"),
+    ("Northwest Territories", "2016A000261"),
+    ("Nunavut", "2016A000262"),
+]
+
+NOCS = [
+    "Total, all occupations",
+    "Management occupations [0]",
+    "Business, finance and administration occupations [1]",
+    "Natural and applied sciences and related occupations [2]",
+    "Health occupations [3]",
+    "Occupations in education, law and social, community and government services [4]",
+    "Occupations in art, culture, recreation and sport [5]",
+    "Sales and service occupations [6]",
+    "Trades, transport and equipment operators and related occupations [7]",
+    "Natural resources, agriculture and related production occupations [8]",
+    "Occupations in manufacturing and utilities [9]",
+    "Unclassified occupations",
+]
+
+#
+#  The first characteristic is the total, the others are parts of it
+#
+CHARACTERISTICS = [
+    "Recruitment strategies, all types",
+    "Personal contacts, referrals, informal networks",
+    'Posting a "help-wanted" sign on the storefront of the location',
+    "Company website",
+    "Online job boards",
+    "Social media",
+    "Job or recruitment fairs at schools, colleges or universities",
+    "Government employment centre or website",
+    "Professional networking, headhunters or employment agency",
+    "Newspaper ads",
+    "Other recruitment strategies",
+]
+
+#
+#  Quality grades, weighted roughly like in the real files
+#
+STATUS_GRADES = ('A', 'B', 'C', 'D', 'E')
+STATUS_WEIGHTS = (45, 35, 10, 4, 1)
+SUPPRESSED_STATUS = 'F'
+
+FOOTNOTES = [
+    [],
+    [],
+    ["Symbol legend:"],
+    ["..", "not available for a specific reference period"],
+    ["A", "data quality: excellent"],
+    ["B", "data quality: very good"],
+    ["C", "data quality: good"],
+    ["D", "data quality: acceptable"],
+    ["E", "use with caution"],
+    ["F", "too unreliable to be published"],
+    [],
+    ["Footnotes:"],
+    ["1", "Synthetic data, generated for load testing. The values are made up."],
+    ["2", "Job vacancies are rounded to the nearest multiple of 5."],
+]
+
+DEFAULT_START = '2015-01'
+DEFAULT_QUARTERS = 36
+# By default, one of each known label
+DEFAULT_GEOS = len(GEOS)
+DEFAULT_NOCS = len(NOCS)
+DEFAULT_CHARACTERISTICS = len(CHARACTERISTICS)
+DEFAULT_SUPPRESSED = 0.05
+DEFAULT_SEED = 1
+FIRST_VECTOR = 200_000_000
+
+
+def quarters(start, count):
+  '''
+    Returns 'count' REF_DATEs ("YYYY-MM"), three months apart, from 'start'.
+  '''
+  year, month = (int(part) for part in start.split('-'))
+  dates = []
+  for _ in range(count):
+    dates.append(f"{year:04d}-{month:02d}")
+    month += 3
+    if month > 12:
+      year, month = year + 1, month - 12
+  return dates
+
+
+def labels(known, count, numbered):
+  '''
+    Returns 'count' labels: the known ones first, then numbered ones made from the
+    format string 'numbered'.
+  '''
+  return list(known[:count]) + [numbered.format(number=number) for number in range(len(known) + 1, count + 1)]
+
+
+def generate_rows(quarter_count=DEFAULT_QUARTERS, geo_count=DEFAULT_GEOS, noc_count=DEFAULT_NOCS,
+                  characteristic_count=DEFAULT_CHARACTERISTICS, start=DEFAULT_START,
+                  suppressed=DEFAULT_SUPPRESSED, seed=DEFAULT_SEED):
+  '''
+    Yields the data rows of a synthetic file, one at a time.
+
+    Parameters:
+    quarter_count, geo_count, noc_count, characteristic_count (int): the size of
+      each dimension; the number of rows is their product
+    start (str): the first quarter, "YYYY-MM"
+    suppressed (float): the share of suppressed cells
+    seed (int): the seed of the random numbers
+
+    Yields:
+    list: one row of 17 fields
+  '''
+  generator = random.Random(seed)
+  dates = quarters(start, quarter_count)
+  geos = GEOS[:geo_count] + [(f"Economic region {number}", f"2016S0500{number:04d}")
+                             for number in range(len(GEOS) + 1, geo_count + 1)]
+  nocs = labels(NOCS, noc_count, "Occupation group [{number}]")
+  characteristics = labels(CHARACTERISTICS, characteristic_count, "Other characteristic {number}")
+
+  vector = FIRST_VECTOR
+  for geo_number, (geo, dguid) in enumerate(geos, start=1):
+    # Smaller geographies have fewer vacancies
+    geo_size = 1.0 if geo_number == 1 else generator.uniform(0.005, 0.4)
+    for noc_number, noc in enumerate(nocs, start=1):
+      noc_size = 1.0 if noc_number == 1 else generator.uniform(0.01, 0.25)
+      #
+      #  The total of every quarter, with a trend and some noise; the parts of the
+      #  total are drawn as shares of it
+      #
+      level = 900_000 * geo_size * noc_size
+      trend = generator.uniform(-0.04, 0.04)
+      totals = [level * (1 + trend) ** position * generator.uniform(0.9, 1.1) for position in range(len(dates))]
+
+      for characteristic_number, characteristic in enumerate(characteristics, start=1):
+        share = 1.0 if characteristic_number == 1 else generator.uniform(0.01, 0.6)
+        vector += 1
+        coordinate = f"{geo_number}.{noc_number}.{characteristic_number}.1"
+        for date, total in zip(dates, totals, strict=True):
+          if generator.random() < suppressed:
+            value, status = '', SUPPRESSED_STATUS
+          else:
+            value = str(5 * round(total * share * generator.uniform(0.95, 1.05) / 5))
+            status = generator.choices(STATUS_GRADES, STATUS_WEIGHTS)[0]
+          yield [date, geo, dguid, noc, characteristic, "Job vacancies", "Number", "223", "units", "0",
+                 f"v{vector}", coordinate, value, status, "", "", "0"]
+
+
+def write_file(file_name, footnotes=True, **options):
+  '''
+    Writes a synthetic data file, row by row.
+
+    Parameters:
+    file_name (str): the file to write
+    footnotes (bool): False to leave out the lines StatCan adds after the data
+    options: passed on to generate_rows()
+
+    Returns:
+    int: the number of data rows written
+  '''
+  count = 0
+  # 'utf-8-sig' writes the byte order mark StatCan puts in front of the header
+  with open(file_name, 'w', encoding='utf-8-sig', newline='', buffering=1 << 20) as data_file:
+    csv_writer = csv.writer(data_file, quoting=csv.QUOTE_ALL)
+    csv_writer.writerow(HEADER)
+    for row in generate_rows(**options):
+      csv_writer.writerow(row)
+      count += 1
+    if footnotes:
+      csv_writer.writerows(FOOTNOTES)
+  return count
+
+
+def main(argv):
+  '''
+    Writes one synthetic data file from the command line.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.synthetic', description='Write a synthetic StatCan job vacancy file.')
+  parser.add_argument('file_name', help='path to the file to write')
+  parser.add_argument('--quarters', type=int, default=DEFAULT_QUARTERS, help='number of quarters')
+  parser.add_argument('--geos', type=int, default=DEFAULT_GEOS, help='number of geographies')
+  parser.add_argument('--nocs', type=int, default=DEFAULT_NOCS, help='number of occupations')
+  parser.add_argument('--characteristics', type=int, default=DEFAULT_CHARACTERISTICS, help='number of characteristics, the total included')
+  parser.add_argument('--start', default=DEFAULT_START, help='first quarter, YYYY-MM')
+  parser.add_argument('--suppressed', type=float, default=DEFAULT_SUPPRESSED, help='share of suppressed cells')
+  parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help='seed of the random numbers')
+  parser.add_argument('--no-footnotes', action='store_true', help='leave out the lines after the data')
+  arguments = parser.parse_args(argv[1:])
+
+  if min(arguments.quarters, arguments.geos, arguments.nocs, arguments.characteristics) < 1:
+    parser.error("every dimension needs at least 1 entry")
+
+  count = write_file(arguments.file_name, footnotes=not arguments.no_footnotes,
+                     quarter_count=arguments.quarters, geo_count=arguments.geos, noc_count=arguments.nocs,
+                     characteristic_count=arguments.characteristics, start=arguments.start,
+                     suppressed=arguments.suppressed, seed=arguments.seed)
+  print(f"Wrote {count} rows to {arguments.file_name}")
+  return 0
+
+
+if __name__ == "__main__":
+  sys.exit(main(sys.argv))
@@ -0,0 +1,243 @@
+'''
+tokenizer.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    The StatCan files have a fixed layout: 17 columns, every field double-quoted. The
+    general csv module reads every field of every row into a string, while we only
+    use a few of them. This module reads the files as bytes instead, through mmap:
+
+      1. a data line is cut on the '","' between two fields, which gives its 17
+         fields as bytes, still without decoding anything
+      2. only the columns asked for are kept (projection pushdown); the other fields
+         are never decoded
+      3. when a file is encoded into a table, the labels are looked up by their bytes,
+         so a label is decoded once, the first time it is seen, however many rows
+         repeat it
+
+    A line that does not cut into 17 fields that way (the header with its byte order
+    mark, the footnotes, a field holding '","' itself) is read with the csv module
+    instead, so the result is always the same as with csv.reader.
+'''
+
+#
+#   Packages and modules
+#
+
+# 'array' holds the code and VALUE columns
+import array
+
+# 'csv' reads the lines that are not in the plain StatCan layout
+import csv
+
+# 'mmap' maps the file into memory
+import mmap
+
+# 'loader' knows the layout of a StatCan row and builds the table
+from vacancies import loader
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+SEPARATOR = b'","'
+QUOTE = b'"'
+FIELD_COUNT = 17
+HEADER_FIELD = b'"REF_DATE'
+
+
+def decode(field):
+  '''
+    Decodes a field cut from a quoted line, turning its doubled quotes back into one.
+  '''
+  return field.decode('utf-8').replace('""', '"')
+
+
+def _raw(label):
+  '''
+    Turns a label back into the bytes it has between the quotes of a line.
+  '''
+  return label.replace('"', '""').encode('utf-8')
+
+
+def split_line(line):
+  '''
+    Cuts a line into the raw bytes of its fields, without the quotes around them (a
+    doubled quote inside a field stays doubled).
+
+    Returns:
+    list: the FIELD_COUNT fields, or None when the line is not a plain quoted data row
+  '''
+  fields = line.split(SEPARATOR)
+  if len(fields) != FIELD_COUNT or fields[0][:1] != QUOTE or fields[0] == HEADER_FIELD:
+    return None
+  fields[0] = fields[0][1:]
+  fields[-1] = fields[-1].rstrip(b'\r\n')[:-1]
+  return fields
+
+
+def raw_fields(line):
+  '''
+    Cuts any line into the raw bytes of its fields, see split_line(). A line that is
+    not in the plain layout is read with the csv module and its fields are turned back
+    into the same bytes, so the fields of a data row can always be compared as bytes.
+
+    Returns:
+    list: the fields, or None when the line is not a data row
+  '''
+  raw = split_line(line)
+  if raw is not None:
+    return raw
+  row = next(csv.reader([line.decode('utf-8-sig')]), [])
+  if not loader.is_data_row(row):
+    return None
+  return [_raw(field) for field in row]
+
+
+def fields(line, columns):
+  '''
+    Returns the decoded fields at 'columns' of one line.
+
+    Parameters:
+    line (bytes): the line, with or without its line ending
+    columns (tuple): the positions of the fields wanted
+
+    Returns:
+    list: the fields, or None when the line is not a data row
+  '''
+  raw = split_line(line)
+  if raw is not None:
+    return [decode(raw[column]) for column in columns]
+  row = next(csv.reader([line.decode('utf-8-sig')]), [])
+  if not loader.is_data_row(row):
+    return None
+  return [row[column] for column in columns]
+
+
+def iter_lines(file_name, start=0, end=None):
+  '''
+    Yields the lines of a file between two byte offsets, as bytes, read through mmap.
+  '''
+  with open(file_name, 'rb') as data_file:
+    try:
+      mapped = mmap.mmap(data_file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+      # An empty file cannot be mapped
+      return
+  with mapped:
+    mapped.seek(start)
+    readline = mapped.readline
+    if end is None or end >= len(mapped):
+      yield from iter(readline, b'')
+      return
+    while mapped.tell() < end:
+      yield readline()
+
+
+def project(file_name, columns):
+  '''
+    Yields the decoded fields at 'columns' of every data row of a file, see fields().
+  '''
+  for line in iter_lines(file_name):
+    row = fields(line, columns)
+    if row is not None:
+      yield row
+
+
+def encode_lines(lines):
+  '''
+    Builds a VacancyTable from the lines of a StatCan file, the same one
+    loader.encode_rows() builds from csv.reader rows, reading only the encoded
+    columns and VALUE.
+
+    Parameters:
+    lines (iterable): the lines, as bytes
+
+    Returns:
+    VacancyTable: the encoded rows
+  '''
+  # Lookups from the raw bytes of a label to its code, one per encoded column; the
+  # labels are decoded at the end, in the order their codes were given
+  ref_dates, geos, nocs, characteristics, statistics, statuses = lookups = [{} for _ in loader.ENCODED_COLUMNS]
+  codes = {name: array.array(loader.CODE_TYPECODE) for name, _ in loader.ENCODED_COLUMNS}
+  values = array.array(loader.VALUE_TYPECODE)
+  append_ref_date, append_geo, append_noc, append_characteristic, append_statistics, append_status = [
+      codes[name].append for name, _ in loader.ENCODED_COLUMNS]
+  append_value = values.append
+  nan = float('nan')
+  ref_date_column, geo_column, noc_column, characteristic_column, statistics_column, status_column = [
+      position for _, position in loader.ENCODED_COLUMNS]
+  value_column = loader.VALUE_COLUMN
+
+  #
+  #  This loop runs once per row, so it is written out column by column (in the
+  #  order of loader.ENCODED_COLUMNS) rather than looping over the columns
+  #
+  for line in lines:
+    # split_line() written out: here the first field keeps its opening quote, which
+    # is dropped from the REF_DATE labels at the end
+    raw = line.split(SEPARATOR)
+    if len(raw) != FIELD_COUNT or raw[0][:1] != QUOTE or raw[0] == HEADER_FIELD:
+      raw = raw_fields(line)
+      if raw is None:
+        continue
+      raw[0] = QUOTE + raw[0]
+
+    field = raw[ref_date_column]
+    code = ref_dates.get(field)
+    if code is None:
+      code = ref_dates[field] = len(ref_dates)
+    append_ref_date(code)
+
+    field = raw[geo_column]
+    code = geos.get(field)
+    if code is None:
+      code = geos[field] = len(geos)
+    append_geo(code)
+
+    field = raw[noc_column]
+    code = nocs.get(field)
+    if code is None:
+      code = nocs[field] = len(nocs)
+    append_noc(code)
+
+    field = raw[characteristic_column]
+    code = characteristics.get(field)
+    if code is None:
+      code = characteristics[field] = len(characteristics)
+    append_characteristic(code)
+
+    field = raw[statistics_column]
+    code = statistics.get(field)
+    if code is None:
+      code = statistics[field] = len(statistics)
+    append_statistics(code)
+
+    field = raw[status_column]
+    code = statuses.get(field)
+    if code is None:
+      code = statuses[field] = len(statuses)
+    append_status(code)
+
+    field = raw[value_column]
+    try:
+      append_value(float(field) if field else nan)
+    except ValueError:
+      # Not a number (e.g. '..'), missing as in loader.parse_value()
+      append_value(nan)
+
+  lookups[0] = {field[len(QUOTE):]: code for field, code in ref_dates.items()}
+  dictionaries = {name: [decode(field) for field in lookup]
+                  for (name, _), lookup in zip(loader.ENCODED_COLUMNS, lookups, strict=True)}
+  return loader.VacancyTable(dictionaries, codes, values)
+
+
+def encode_file(file_name, start=0, end=None):
+  '''
+    Encodes the rows of a file, or of the lines between two byte offsets of it, into
+    a VacancyTable, see encode_lines().
+  '''
+  return encode_lines(iter_lines(file_name, start, end))
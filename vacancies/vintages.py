@@ -0,0 +1,439 @@
+'''
+vintages.py
+  Author(s): Puneet Chaudhary (1231356), Krish Garg (1275663), Yash Tandon (1258096)
+
+  Project: Job Vacancies in Canada
+  Date of Last Update: October 18, 2026
+
+  Functional Summary
+    StatCan revises published figures, and every row of a data file names the series it
+    belongs to with a VECTOR (e.g. v104496370) and a COORDINATE (e.g. 1.1.34.1). This
+    module keeps the history of a data file's figures, release after release (vintage
+    after vintage), in one file next to it (<data file>.vintages), so revised figures
+    can be audited without keeping a full copy of every release.
+
+    The history holds one record per cell (VECTOR, REF_DATE) and vintage, and only for
+    the cells whose VALUE or STATUS changed since the vintage before: a new quarter adds
+    its cells, a revision adds the revised cells, anything else adds nothing. A cell
+    that is no longer in the file gets a "removed" record. So the history:
+
+      1. answers a point-in-time query (every figure as it was in some vintage) by
+         taking, for each cell, its last record up to that vintage
+      2. answers "what changed in a vintage" by reading that vintage's records, next to
+         the figures they replaced, without comparing whole files
+
+    The records are kept as compact arrays in the store format of cache.py: the series
+    number, the REF_DATE code, the VALUE and the STATUS code, grouped by vintage.
+
+    Commandline Parameters (run as "python -m vacancies.vintages <command> ..."):
+      record <data_file> [--name N]       record the file as it is now as a new vintage
+      release <data_file> <release_file> [--name N]
+                                          record the rows of a release (see
+                                          incremental.py) as a new vintage
+      list <data_file>                    list the vintages
+      as-of <data_file> [<vintage>] [--vector V]
+                                          write every figure as it was in a vintage
+      changes <data_file> [<vintage>]     write what a vintage changed
+      A vintage is given by its number (from 1) or its name, the latest by default;
+      the rows are written through the sinks of VACANCIES_OUTPUT (see output.py).
+'''
+
+#
+#   Packages and modules
+#
+
+# 'argparse' reads the command line parameters
+import argparse
+
+# 'datetime' stamps each vintage with the time it was recorded
+import datetime
+
+# 'os' gives access to the data file's path
+import os
+
+# 'sys' gives access to the command line parameters
+import sys
+
+# 'numpy' holds the records and finds the state of every cell at once
+import numpy as np
+
+# 'cache' reads and writes the history in its store format
+from vacancies import cache
+
+# 'loader' knows the layout of a StatCan row
+from vacancies import loader
+
+# 'output' writes the rows of the queries
+from vacancies import output
+
+# 'profiling' times recording a vintage when profiling is on
+from vacancies import profiling
+
+# 'tokenizer' reads only the VECTOR, COORDINATE, REF_DATE, VALUE and STATUS of every row
+from vacancies import tokenizer
+
+#
+# Define any "constants" for the file here.
+# Names of constants should be in UPPER_CASE.
+#
+HISTORY_SUFFIX = '.vintages'
+
+#
+#  Fields read for every cell of a file, in the order of the tuples of read_figures()
+#
+FIGURE_COLUMNS = (loader.VECTOR_COLUMN, loader.COORDINATE_COLUMN, loader.REF_DATE_COLUMN,
+                  loader.VALUE_COLUMN, loader.STATUS_COLUMN)
+
+#
+#  STATUS code of a cell that is not in the file (any more); it never has a record
+#  of its own, but a "removed" record sets a cell back to it
+#
+ABSENT_STATUS = -1
+
+SERIES_TYPECODE = 'i'
+DATE_TYPECODE = 'i'
+VALUE_TYPECODE = 'd'
+STATUS_TYPECODE = 'b'
+
+FIGURE_HEADER = ["Ref Date", "Vector", "Coordinate", "Value", "Status"]
+CHANGE_HEADER = ["Ref Date", "Vector", "Coordinate", "Previous Value", "Previous Status", "Value", "Status"]
+
+
+class History:
+  '''
+    The recorded vintages of one data file.
+
+    Attributes:
+    file_name (str): the data file
+    vintages (list): one dict per vintage: its name, when it was recorded, the
+      SHA-256 of what was recorded and its number of records
+    vectors (list): the VECTOR of every series, by series number
+    coordinates (list): the COORDINATE of every series, by series number
+    dates (list): the REF_DATE labels, by code
+    status_labels (list): the STATUS labels, by code
+    series, date, values, status (numpy.ndarray): the records, grouped by vintage
+  '''
+
+  def __init__(self, file_name, vintages, vectors, coordinates, dates, status_labels, series, date, values, status):
+    self.file_name = file_name
+    self.vintages = vintages
+    self.vectors = vectors
+    self.coordinates = coordinates
+    self.dates = dates
+    self.status_labels = status_labels
+    self.series = series
+    self.date = date
+    self.values = values
+    self.status = status
+
+  def ends(self):
+    '''
+      Returns the end of the records of every vintage, in order.
+    '''
+    return np.cumsum([vintage['records'] for vintage in self.vintages], dtype=np.int64)
+
+  def vintage_number(self, vintage=None):
+    '''
+      Turns a vintage number (from 1, as an int or as text) or name into its number,
+      the latest vintage by default.
+
+      Raises:
+      ValueError: when there is no such vintage
+    '''
+    if not self.vintages:
+      raise ValueError(f"No vintage recorded for {self.file_name}")
+    if vintage is None:
+      return len(self.vintages)
+    for number, recorded in enumerate(self.vintages, start=1):
+      if recorded['name'] == str(vintage):
+        return number
+    if str(vintage).isdigit() and 1 <= int(vintage) <= len(self.vintages):
+      return int(vintage)
+    raise ValueError(f"No vintage '{vintage}', expected a name or a number between 1 and {len(self.vintages)}")
+
+  def state(self, vintage=None):
+    '''
+      Returns every figure as it was in a vintage.
+
+      Returns:
+      tuple: (values, status) arrays shaped (series, REF_DATE), status being
+      ABSENT_STATUS for a cell the file did not have
+    '''
+    shape = (len(self.vectors), len(self.dates))
+    values = np.full(shape, np.nan)
+    status = np.full(shape, ABSENT_STATUS, dtype=np.int8)
+    if vintage == 0 or not self.vintages:
+      return values, status
+
+    # Records are in vintage order: the last record of each cell up to the vintage wins
+    end = self.ends()[self.vintage_number(vintage) - 1]
+    cells = self.series[:end].astype(np.int64) * len(self.dates) + self.date[:end]
+    _, last_from_end = np.unique(cells[::-1], return_index=True)
+    last = end - 1 - last_from_end
+    values.flat[cells[last]] = self.values[last]
+    status.flat[cells[last]] = self.status[last]
+    return values, status
+
+  def figures(self, vintage=None, vector=None):
+    '''
+      Returns the rows of a point-in-time query: [ref date, vector, coordinate, value,
+      status] for every cell the file had in a vintage, by series and date.
+    '''
+    values, status = self.state(vintage)
+    series_numbers = range(len(self.vectors)) if vector is None else \
+        [number for number, label in enumerate(self.vectors) if label == vector]
+    order = np.argsort(self.dates)
+
+    rows = []
+    for number in series_numbers:
+      for date in order:
+        if status[number, date] != ABSENT_STATUS:
+          rows.append([self.dates[date], self.vectors[number], self.coordinates[number],
+                       loader.output_value(values[number, date]), self.status_labels[status[number, date]]])
+    return rows
+
+  def changes(self, vintage=None):
+    '''
+      Returns what a vintage changed: [ref date, vector, coordinate, previous value,
+      previous status, value, status] for every record of the vintage, missing
+      numbers and statuses as None.
+    '''
+    number = self.vintage_number(vintage)
+    ends = self.ends()
+    start, end = (ends[number - 2] if number > 1 else 0), ends[number - 1]
+    previous_values, previous_status = self.state(number - 1)
+
+    def status_label(code):
+      return None if code == ABSENT_STATUS else self.status_labels[code]
+
+    rows = []
+    for record in range(start, end):
+      series, date = self.series[record], self.date[record]
+      rows.append([
+          self.dates[date], self.vectors[series], self.coordinates[series],
+          loader.output_value(previous_values[series, date]), status_label(previous_status[series, date]),
+          loader.output_value(self.values[record]), status_label(self.status[record]),
+      ])
+    return sorted(rows, key=lambda row: (row[1], row[0]))
+
+
+def history_path(file_name):
+  '''
+    Returns the path of the history of a data file.
+  '''
+  return file_name + HISTORY_SUFFIX
+
+
+def load_history(file_name):
+  '''
+    Opens the history of a data file; a file with no history gets an empty one.
+
+    Raises:
+    ValueError: when the history file cannot be read
+  '''
+  path = history_path(file_name)
+  if not os.path.exists(path):
+    return History(file_name, [], [], [], [], [],
+                   *(np.empty(0, dtype=dtype) for dtype in (np.intc, np.intc, np.float64, np.int8)))
+
+  stored = cache.read_store(path)
+  if stored is None:
+    raise ValueError(f"Not a readable history: {path}")
+  _, dictionaries, arrays, values = stored
+  return History(file_name, dictionaries['vintages'], dictionaries['vectors'], dictionaries['coordinates'],
+                 dictionaries['dates'], dictionaries['status'],
+                 np.frombuffer(arrays['series'], dtype=np.intc), np.frombuffer(arrays['date'], dtype=np.intc),
+                 np.frombuffer(values, dtype=np.float64), np.frombuffer(arrays['status'], dtype=np.int8))
+
+
+def read_figures(file_name):
+  '''
+    Reads the cells of a StatCan file (or release): one (VECTOR, COORDINATE,
+    REF_DATE, VALUE, STATUS) tuple per data row.
+  '''
+  return [(vector, coordinate, ref_date, loader.parse_value(value), status)
+          for vector, coordinate, ref_date, value, status in tokenizer.project(file_name, FIGURE_COLUMNS)]
+
+
+def _codes(labels, wanted):
+  '''
+    Returns the code of every label in 'wanted', adding the new ones to 'labels'.
+  '''
+  lookup = {label: code for code, label in enumerate(labels)}
+  codes = []
+  for label in wanted:
+    code = lookup.get(label)
+    if code is None:
+      code = lookup[label] = len(labels)
+      labels.append(label)
+    codes.append(code)
+  return np.array(codes, dtype=np.intc)
+
+
+def record(file_name, figures, source, name=None, complete=True):
+  '''
+    Adds a vintage to the history of a data file, with a record for every cell that
+    is new or changed since the latest vintage.
+
+    Parameters:
+    file_name (str): the data file
+    figures (list): the (VECTOR, COORDINATE, REF_DATE, VALUE, STATUS) of the cells,
+      see read_figures()
+    source (str): the file the figures were read from, whose SHA-256 is kept
+    name (str): the name of the vintage; by default the time it is recorded, to the
+      second, followed by '-2', '-3', ... when that name is already taken
+    complete (bool): True when 'figures' are every cell of the file, so a cell
+      missing from them was removed; False for a release, which only holds some
+
+    Returns:
+    dict: the new vintage
+
+    Raises:
+    ValueError: when there is already a vintage with the name given
+  '''
+  history = load_history(file_name)
+  recorded = datetime.datetime.now().isoformat(timespec='seconds')
+  names = {vintage['name'] for vintage in history.vintages}
+  if not name:
+    # Vintages recorded within the same second are told apart by a number
+    name = recorded
+    number = 2
+    while name in names:
+      name = f"{recorded}-{number}"
+      number += 1
+  elif name in names:
+    raise ValueError(f"There is already a vintage '{name}'")
+
+  with profiling.stage('vintage', file=os.path.basename(file_name)) as timer:
+    old_values, old_status = history.state()
+
+    vectors, coordinates = list(history.vectors), list(history.coordinates)
+    dates, status_labels = list(history.dates), list(history.status_labels)
+    series = _codes(vectors, [figure[0] for figure in figures])
+    coordinates += [None] * (len(vectors) - len(coordinates))
+    for number, figure in zip(series, figures, strict=True):
+      coordinates[number] = figure[1]
+    date = _codes(dates, [figure[2] for figure in figures])
+    values = np.array([figure[3] for figure in figures], dtype=np.float64)
+    status = _codes(status_labels, [figure[4] for figure in figures]).astype(np.int8)
+
+    #
+    #  Grow the latest state to the new series and dates, then keep the cells whose
+    #  VALUE or STATUS differs from it (a NaN VALUE equals a NaN VALUE)
+    #
+    shape = (len(vectors), len(dates))
+    previous_values = np.full(shape, np.nan)
+    previous_values[:old_values.shape[0], :old_values.shape[1]] = old_values
+    previous_status = np.full(shape, ABSENT_STATUS, dtype=np.int8)
+    previous_status[:old_status.shape[0], :old_status.shape[1]] = old_status
+
+    all_series, all_date = series, date
+    before = previous_values[series, date]
+    changed = (previous_status[series, date] != status) | ~((before == values) | (np.isnan(before) & np.isnan(values)))
+    series, date, values, status = series[changed], date[changed], values[changed], status[changed]
+
+    if complete:
+      present = np.zeros(shape, dtype=bool)
+      present[all_series, all_date] = True
+      removed_series, removed_date = np.nonzero((previous_status != ABSENT_STATUS) & ~present)
+      series = np.concatenate((series, removed_series.astype(np.intc)))
+      date = np.concatenate((date, removed_date.astype(np.intc)))
+      values = np.concatenate((values, np.full(len(removed_series), np.nan)))
+      status = np.concatenate((status, np.full(len(removed_series), ABSENT_STATUS, dtype=np.int8)))
+    timer.count(len(series))
+
+  vintage = {'name': name, 'recorded': recorded, 'sha256': cache.file_digest(source), 'records': len(series)}
+  dictionaries = {
+      'vintages': history.vintages + [vintage],
+      'vectors': vectors,
+      'coordinates': coordinates,
+      'dates': dates,
+      'status': status_labels,
+  }
+
+  # The old records are copied as they are and the new ones added after them
+  length = len(history.series) + len(series)
+  columns = []
+  for column_name, typecode, old, new in (('series', SERIES_TYPECODE, history.series, series),
+                                          ('date', DATE_TYPECODE, history.date, date),
+                                          ('value', VALUE_TYPECODE, history.values, values),
+                                          ('status', STATUS_TYPECODE, history.status, status)):
+    columns.append((column_name, typecode, length, [memoryview(np.ascontiguousarray(old)).cast('B'),
+                                                    memoryview(np.ascontiguousarray(new)).cast('B')]))
+  cache.write_columns(history_path(file_name), {'path': os.path.abspath(file_name)}, dictionaries, columns)
+  return vintage
+
+
+def record_file(file_name, name=None):
+  '''
+    Records a data file as it is now as a new vintage, see record().
+  '''
+  return record(file_name, read_figures(file_name), file_name, name)
+
+
+def record_release(file_name, release_file, name=None):
+  '''
+    Records the rows of a release of a data file as a new vintage, see record().
+  '''
+  return record(file_name, read_figures(release_file), release_file, name, complete=False)
+
+
+def has_history(file_name):
+  '''
+    Tells if any vintage of a data file was recorded.
+  '''
+  return os.path.exists(history_path(file_name))
+
+
+def main(argv):
+  '''
+    Runs one command of the module summary.
+  '''
+  parser = argparse.ArgumentParser(prog='python -m vacancies.vintages', description='Record and query the vintages of a data file.')
+  commands = parser.add_subparsers(dest='command', required=True)
+  record_parser = commands.add_parser('record', help='record the file as a new vintage')
+  record_parser.add_argument('data_file')
+  record_parser.add_argument('--name', help='name of the vintage')
+  release_parser = commands.add_parser('release', help='record the rows of a release as a new vintage')
+  release_parser.add_argument('data_file')
+  release_parser.add_argument('release_file')
+  release_parser.add_argument('--name', help='name of the vintage')
+  list_parser = commands.add_parser('list', help='list the vintages')
+  list_parser.add_argument('data_file')
+  as_of_parser = commands.add_parser('as-of', help='every figure as it was in a vintage')
+  as_of_parser.add_argument('data_file')
+  as_of_parser.add_argument('vintage', nargs='?', help='vintage number or name (default: the latest)')
+  as_of_parser.add_argument('--vector', help='keep one VECTOR')
+  changes_parser = commands.add_parser('changes', help='what a vintage changed')
+  changes_parser.add_argument('data_file')
+  changes_parser.add_argument('vintage', nargs='?', help='vintage number or name (default: the latest)')
+  arguments = parser.parse_args(argv[1:])
+
+  try:
+    if arguments.command == 'record':
+      vintage = record_file(arguments.data_file, arguments.name)
+      print(f"Recorded vintage '{vintage['name']}' with {vintage['records']} changed figure(s)")
+    elif arguments.command == 'release':
+      vintage = record_release(arguments.data_file, arguments.release_file, arguments.name)
+      print(f"Recorded vintage '{vintage['name']}' with {vintage['records']} changed figure(s)")
+    elif arguments.command == 'list':
+      for number, vintage in enumerate(load_history(arguments.data_file).vintages, start=1):
+        print(f"{number}. {vintage['name']} (recorded {vintage['recorded']}): {vintage['records']} figure(s)")
+    elif arguments.command == 'as-of':
+      history = load_history(arguments.data_file)
+      output.write_rows(history.figures(arguments.vintage, arguments.vector), output.open_sinks(header=FIGURE_HEADER))
+    else:
+      history = load_history(arguments.data_file)
+      output.write_rows(history.changes(arguments.vintage), output.open_sinks(header=CHANGE_HEADER))
+  except FileNotFoundError as e:
+    print(f"File not found: {e.filename}")
+    return 2
+  except ValueError as e:
+    print(f"Cannot {arguments.command}: {e}")
+    return 3
+  return 0
+
+
+if __name__ == "__main__":
+  profiling.configure()
+  sys.exit(main(sys.argv))